@@ -0,0 +1,134 @@
+"""Premium response shaping: row-wise dict splat vs the columnar path.
+
+Usage::
+
+    python benchmarks/premium_shaping.py [payload.json] [--rows N] [--repeat R]
+
+``payload.json`` is a saved ``maxi.premium(..., pandas=False)`` response
+(e.g. ``json.dump(maxi.premium(limit=5000, pandas=False), f)``). Without
+one, a synthetic payload of ``N`` rows carrying every ``PremiumDetail``
+field as the API sends it (strings) is generated. Reports the best of ``R``
+runs of the previous row-wise flattening and of ``shape_premium_response``,
+with the resulting frame's memory.
+"""
+
+import argparse
+import dataclasses
+import json
+import random
+import time
+
+import pandas as pd
+
+from datamaxi._responses import PremiumDetail
+from datamaxi.resources.premium import shape_premium_response
+
+_EXCHANGES = ["binance", "bybit", "okx", "upbit", "bithumb", "coinbase"]
+
+
+def synthesize(rows: int):
+    rng = random.Random(0)
+    fields = dataclasses.fields(PremiumDetail)
+    data = []
+    for i in range(rows):
+        detail = {}
+        for f in fields:
+            if f.name in ("se", "te"):
+                detail[f.name] = rng.choice(_EXCHANGES)
+            elif f.name in ("sq", "tq"):
+                detail[f.name] = rng.choice(["USDT", "KRW", "USD"])
+            elif f.name in ("sm", "tm"):
+                detail[f.name] = rng.choice(["spot", "futures"])
+            elif f.name in ("sb", "tb", "bid"):
+                detail[f.name] = f"TOKEN{i % 500}"
+            elif "bool" in str(f.type):
+                detail[f.name] = rng.random() < 0.5
+            elif "int" in str(f.type):
+                detail[f.name] = str(1_700_000_000_000 + i)
+            elif "float" in str(f.type):
+                detail[f.name] = f"{rng.uniform(-5, 5):.6f}"
+            else:
+                detail[f.name] = None
+        data.append(
+            {
+                "detail": detail,
+                "source_annualized_funding_rate": f"{rng.random():.4f}",
+                "target_annualized_funding_rate": f"{rng.random():.4f}",
+            }
+        )
+    return {"data": data}
+
+
+def rowwise(res):
+    """The previous implementation: one splatted dict per item."""
+    return pd.DataFrame(
+        [
+            {
+                **item["detail"],
+                "source_annualized_funding_rate": item.get(
+                    "source_annualized_funding_rate"
+                ),
+                "target_annualized_funding_rate": item.get(
+                    "target_annualized_funding_rate"
+                ),
+            }
+            for item in res["data"]
+        ]
+    )
+
+
+def rowwise_numeric(res):
+    """Row-wise, then ``pd.to_numeric`` on every column that parses."""
+    frame = rowwise(res)
+    for name in frame.columns:
+        numbers = pd.to_numeric(frame[name], errors="coerce")
+        if numbers.notna().any():
+            frame[name] = numbers
+    return frame
+
+
+def best_of(fn, repeat: int):
+    best, frame = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        frame = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, frame
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("payload", nargs="?")
+    parser.add_argument("--rows", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.payload:
+        with open(args.payload, encoding="utf-8") as f:
+            res = json.load(f)
+    else:
+        res = synthesize(args.rows)
+    print(f"{len(res['data'])} premium rows, best of {args.repeat}")
+    cases = (
+        ("row-wise (strings)", lambda: rowwise(res)),
+        ("row-wise + to_numeric", lambda: rowwise_numeric(res)),
+        ("columnar", lambda: shape_premium_response(res, True)),
+        (
+            "columnar categorical",
+            lambda: shape_premium_response(res, True, categorical=True),
+        ),
+        (
+            "columnar 4 columns",
+            lambda: shape_premium_response(
+                res, True, columns=["se", "te", "pdp", "pdp24h"]
+            ),
+        ),
+    )
+    for label, fn in cases:
+        seconds, frame = best_of(fn, args.repeat)
+        memory = frame.memory_usage(deep=True).sum()
+        print(f"{label:<22} {seconds * 1000:>8.1f} ms {memory / 1e6:>8.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Construction time and memory of the REST response models.
+
+Usage::
+
+    python benchmarks/response_models.py [--rows N] [--repeat R]
+
+Builds ``N`` synthetic candle rows and converts them with the generated
+``datamaxi._responses.CexCandleView`` dataclass and its slotted variant from
+:mod:`datamaxi._response_records`, reporting the best of ``R`` timed runs
+and the memory retained by the resulting list (``tracemalloc``).
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from datamaxi._response_records import slotted
+from datamaxi._responses import CexCandleView
+
+
+def synthesize(rows: int):
+    rng = random.Random(0)
+    out = []
+    for i in range(rows):
+        price = 60000 + rng.random() * 100
+        out.append(
+            {
+                "d": 1_700_000_000_000 + i * 60_000,
+                "o": price,
+                "h": price + rng.random(),
+                "l": price - rng.random(),
+                "c": price + rng.random() - 0.5,
+                "v": rng.random() * 10,
+            }
+        )
+    return out
+
+
+def build(model, rows):
+    if hasattr(model, "from_list"):
+        return model.from_list(rows)
+    return [model.from_dict(row) for row in rows]
+
+
+def construct(model, rows, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build(model, rows)
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    built = build(model, rows)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+    return best, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = synthesize(args.rows)
+    print(f"{args.rows} candle rows, best of {args.repeat}")
+    for label, model in (
+        ("dataclass", CexCandleView),
+        ("slotted", slotted(CexCandleView)),
+    ):
+        seconds, retained = construct(model, rows, args.repeat)
+        print(
+            f"{label:<10} {seconds * 1000:>8.1f} ms"
+            f" {args.rows / seconds:>12,.0f} rows/s"
+            f" {retained / args.rows:>8.0f} B/row"
+        )
+
+
+if __name__ == "__main__":
+    main()
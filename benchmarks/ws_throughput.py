@@ -0,0 +1,78 @@
+"""WS decode + fan-out throughput against a replayed recording.
+
+Usage::
+
+    python benchmarks/ws_throughput.py [recording.tsv[.gz]] [--frames N]
+
+Without a recording, a synthetic ``/liquidation/feed`` session of ``N``
+frames is generated first. The recording is replayed as fast as possible
+through :class:`datamaxi.aio.ws_replay.ReplayServer` and consumed with and
+without string interning; numbers include the local socket, so compare runs
+on one machine.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+
+from datamaxi.aio.ws import AsyncDatamaxiWS
+from datamaxi.aio.ws_replay import ReplayServer, read_recording
+
+
+def synthesize(path: str, frames: int) -> None:
+    rng = random.Random(0)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(frames):
+            msg = {
+                "b": "BTC",
+                "d": 1_700_000_000_000 + i,
+                "e": rng.choice(["binance", "bybit", "okx"]),
+                "p": 60000 + rng.random() * 100,
+                "q": "USDT",
+                "s": "BTC-USDT",
+                "sd": rng.choice(["buy", "sell"]),
+                "v": rng.random(),
+                "vusd": rng.random() * 60000,
+            }
+            f.write(f"{i}\t/liquidation/feed\t{json.dumps(msg)}\n")
+
+
+async def consume(path: str, intern_strings: bool) -> float:
+    async with ReplayServer(path, speed=None) as server:
+        async with AsyncDatamaxiWS(
+            api_key="bench",
+            ws_url=server.url,
+            keepalive=0,
+            reconnect=False,
+            intern_strings=intern_strings,
+        ) as ws:
+            started = time.perf_counter()
+            count = 0
+            async for batch in await ws.liquidation_feed.stream_batches():
+                count += len(batch)
+            return count / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", nargs="?")
+    parser.add_argument("--frames", type=int, default=100_000)
+    args = parser.parse_args()
+
+    path = args.recording
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(), "synthetic.tsv")
+        synthesize(path, args.frames)
+    frames = sum(1 for _ in read_recording(path))
+    print(f"{frames} frames from {path}")
+    for intern_strings in (False, True):
+        rate = asyncio.run(consume(path, intern_strings))
+        print(f"intern_strings={intern_strings!s:<6} {rate:>12,.0f} msgs/s")
+
+
+if __name__ == "__main__":
+    main()
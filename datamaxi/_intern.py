@@ -0,0 +1,73 @@
+"""Opt-in interning of repeated identifier strings in decoded JSON.
+
+Every decoded ticker / premium row carries fresh ``str`` objects for its
+exchange, symbol, market, base and quote, though a long-running cache only
+ever sees a few hundred distinct values. With ``intern_strings=True`` the
+sync and async REST clients (``API`` / ``AsyncAPI.send_request``) and the WS
+reader (``AsyncWSConnection``) decode with an ``object_hook`` that passes
+those values through :func:`sys.intern`, so every row shares one object per
+distinct value. Interned strings are freed once nothing references them.
+
+Only the values of :data:`INTERN_KEYS` (or the keys given instead of
+``True``) are interned: prices and timestamps are strings on the wire too,
+but rarely repeat, and interning them would only cost time.
+"""
+
+import sys
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Union
+
+#: Wire keys whose values name an exchange, symbol, market or asset.
+INTERN_KEYS: FrozenSet[str] = frozenset(
+    {
+        "e",
+        "s",
+        "m",
+        "b",
+        "q",
+        "se",
+        "te",
+        "sm",
+        "tm",
+        "sb",
+        "tb",
+        "sq",
+        "tq",
+        "bid",
+        "exchange",
+        "symbol",
+        "market",
+        "base",
+        "quote",
+        "currency",
+        "network",
+    }
+)
+
+InternOption = Union[bool, Iterable[str], None]
+
+
+def interning_hook(
+    keys: Iterable[str] = INTERN_KEYS,
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """A ``json.loads`` ``object_hook`` interning the string values of ``keys``."""
+    keys = frozenset(keys)
+    intern = sys.intern
+
+    def hook(obj: Dict[str, Any]) -> Dict[str, Any]:
+        for key in obj.keys() & keys:
+            value = obj[key]
+            if value.__class__ is str:
+                obj[key] = intern(value)
+        return obj
+
+    return hook
+
+
+def object_hook(intern_strings: InternOption) -> Optional[Callable]:
+    """The hook for an ``intern_strings`` option: ``False`` / ``None`` ->
+    ``None``, ``True`` -> :data:`INTERN_KEYS`, else the given keys."""
+    if intern_strings is None or intern_strings is False:
+        return None
+    if intern_strings is True:
+        return interning_hook()
+    return interning_hook(intern_strings)
@@ -0,0 +1,174 @@
+"""Slotted variants of the REST response models in ``datamaxi._responses``.
+
+The generated models are plain ``@dataclass`` es: every instance carries a
+``__dict__``, and ``from_dict`` passes each field as a keyword argument
+after its own ``data.get`` lookup. For a 100k-row candle response that is
+100k hash tables and a few hundred thousand attribute lookups.
+
+This module builds, on first use, one ``@dataclass(slots=True)`` per
+generated model — same name, fields, defaults, ``repr`` and equality — and
+compiles a ``from_dict`` for it from the generated one: the same wire keys
+and fallbacks (read off the generated method's source, so a regenerated
+``_responses`` is picked up without edits here), but with ``data.get`` bound
+once and the fields passed positionally. Nested models resolve to their
+slotted variants. :meth:`from_list` builds a whole ``data`` array.
+Where that source is not shipped (zipapps, frozen apps, sourceless wheels)
+:func:`slotted` returns the generated models themselves, given a
+``from_list`` too. A generated ``from_dict`` that is not a single
+``return cls(field=...)`` raises ``ValueError`` naming the model.
+``benchmarks/response_models.py`` compares both forms.
+"""
+
+from __future__ import annotations
+
+import ast
+import dataclasses
+import functools
+import inspect
+from typing import Any, Dict, List, Optional
+
+import datamaxi._responses as _responses
+
+
+@functools.lru_cache(maxsize=None)
+def _generated_models() -> Dict[str, type]:
+    return {
+        name: obj
+        for name, obj in vars(_responses).items()
+        if dataclasses.is_dataclass(obj) and obj.__module__ == _responses.__name__
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _from_dict_defs() -> Optional[Dict[str, ast.FunctionDef]]:
+    """``{model: its from_dict}`` as parsed from the module source (parsed
+    once); ``None`` when the source is unavailable."""
+    try:
+        source = inspect.getsource(_responses)
+    except (OSError, TypeError):
+        return None
+    defs = {}
+    for node in ast.parse(source).body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef) and item.name == "from_dict":
+                defs[node.name] = item
+    return defs
+
+
+def _field_exprs(model: type, func: Optional[ast.FunctionDef]) -> Dict[str, ast.expr]:
+    """``{field: expression}`` from a generated ``return cls(field=...)``."""
+    body = func.body if func is not None else []
+    if (
+        body
+        and isinstance(body[0], ast.Expr)
+        and isinstance(body[0].value, ast.Constant)
+    ):
+        body = body[1:]  # docstring
+    call = None
+    if len(body) == 1 and isinstance(body[0], ast.Return):
+        call = body[0].value
+    if (
+        not isinstance(call, ast.Call)
+        or call.args
+        or any(kw.arg is None for kw in call.keywords)
+    ):
+        raise ValueError(
+            "datamaxi._responses.{}.from_dict is not a single "
+            "`return cls(field=...)`; its slotted variant cannot be "
+            "derived".format(model.__name__)
+        )
+    exprs = {kw.arg: kw.value for kw in call.keywords}
+    missing = [f.name for f in dataclasses.fields(model) if f.name not in exprs]
+    if missing:
+        raise ValueError(
+            "datamaxi._responses.{}.from_dict sets no {}".format(
+                model.__name__, missing
+            )
+        )
+    return exprs
+
+
+class _BindGet(ast.NodeTransformer):
+    """``data.get(...)`` -> ``g(...)`` (``g`` is bound once per call)."""
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.AST:
+        if (
+            node.attr == "get"
+            and isinstance(node.value, ast.Name)
+            and node.value.id == "data"
+        ):
+            return ast.copy_location(ast.Name("g", ast.Load()), node)
+        return self.generic_visit(node)
+
+
+def _from_dict_source(model: type, exprs: Dict[str, ast.expr]) -> str:
+    args = []
+    for f in dataclasses.fields(model):
+        expr = _BindGet().visit(exprs[f.name])
+        args.append("        {},".format(ast.unparse(expr)))
+    return "def from_dict(cls, data):\n    g = data.get\n    return cls(\n{}\n    )\n".format(
+        "\n".join(args)
+    )
+
+
+def _from_list(cls, rows: List[Dict[str, Any]]) -> List[Any]:
+    """Build one instance per row (a response's ``data`` array)."""
+    from_dict = cls.from_dict
+    return [from_dict(row) for row in rows]
+
+
+def _copy_field(f: dataclasses.Field) -> dataclasses.Field:
+    if f.default_factory is not dataclasses.MISSING:
+        return dataclasses.field(default_factory=f.default_factory)
+    return dataclasses.field(default=f.default)
+
+
+def _slotted(model: type) -> type:
+    cls = dataclasses.make_dataclass(
+        model.__name__,
+        [(f.name, f.type, _copy_field(f)) for f in dataclasses.fields(model)],
+        slots=True,
+    )
+    cls.__module__ = __name__
+    cls.__doc__ = "Slotted variant of ``datamaxi._responses.{}``.".format(
+        model.__name__
+    )
+    cls.from_list = classmethod(_from_list)
+    return cls
+
+
+#: Generated model name -> its slotted variant, filled by :func:`slotted`.
+RESPONSE_RECORDS: Dict[str, type] = {}
+
+
+def slotted(model: Any) -> type:
+    """The slotted variant of a ``_responses`` model (class or name).
+
+    Variants are built on first use, along with the nested models their
+    ``from_dict`` refers to. Without the ``_responses`` source the generated
+    model itself is returned, with :meth:`from_list` attached.
+    """
+    name = getattr(model, "__name__", model)
+    cls = RESPONSE_RECORDS.get(name)
+    if cls is not None:
+        return cls
+    model = getattr(_responses, name, None)
+    if not dataclasses.is_dataclass(model):
+        raise KeyError(name)
+    defs = _from_dict_defs()
+    if defs is None:
+        if not hasattr(model, "from_list"):
+            model.from_list = classmethod(_from_list)
+        return model
+    exprs = _field_exprs(model, defs.get(name))
+    cls = RESPONSE_RECORDS[name] = _slotted(model)
+    scope = {"_as_model": _responses._as_model, "_as_models": _responses._as_models}
+    for expr in exprs.values():  # nested models resolve to their variants
+        for node in ast.walk(expr):
+            if isinstance(node, ast.Name) and node.id in _generated_models():
+                scope[node.id] = slotted(node.id)
+    exec(_from_dict_source(model, exprs), scope)
+    cls.from_dict = classmethod(scope["from_dict"])
+    return cls
@@ -14,9 +14,15 @@ two loops can't drift onto different retry behavior:
 * Honors a ``Retry-After`` response header (seconds or HTTP-date form) when
   present, taking priority over the computed backoff — mirrors
   ``Retry.respect_retry_after_header=True``.
+
+The WebSocket client (``datamaxi.aio.ws``) reconnects on a separate,
+long-lived policy — :func:`get_reconnect_delay` — which adds jitter so a
+fleet of clients dropped by the same upstream outage doesn't reconnect in
+lockstep.
 """
 
 import email.utils
+import random
 import re
 import time
 
@@ -84,3 +90,19 @@ def get_retry_delay(attempt, backoff_factor, headers):
     if retry_after is not None:
         return retry_after
     return get_backoff_time(attempt, backoff_factor)
+
+
+def get_reconnect_delay(attempt, backoff_factor, backoff_max, jitter=True):
+    """Seconds to sleep before WebSocket reconnect attempt ``attempt`` (1 = first).
+
+    Exponential ``backoff_factor * 2 ** (attempt - 1)``, capped at
+    ``backoff_max``. With ``jitter`` the result is drawn uniformly from
+    ``[delay / 2, delay]`` ("equal jitter"): clients spread out instead of
+    retrying in lockstep, while still waiting at least half the backoff.
+    """
+    # Clamp the exponent: an unbounded reconnect loop must not overflow.
+    exponent = min(max(attempt, 1), 32) - 1
+    delay = min(backoff_max, backoff_factor * (2**exponent))
+    if jitter:
+        delay = random.uniform(delay / 2, delay)
+    return delay
@@ -14,6 +14,7 @@ import os
 from datamaxi.__version__ import __version__
 from datamaxi.api import ResponseMeta
 from datamaxi._dispatch import resolve_endpoint, raise_for_error, extract_limit_usage
+from datamaxi._intern import object_hook
 from datamaxi._retry import is_retryable, get_retry_delay
 
 
@@ -34,7 +35,8 @@ class AsyncAPI:
     Mirrors the sync ``API``: shared endpoint resolution, bounded retry of
     transient gateway 5xx on GET requests with exponential backoff (honoring
     ``Retry-After`` — see ``datamaxi._retry``), the same ``ClientError`` /
-    ``ServerError`` contract, and ``last_response`` metadata.
+    ``ServerError`` contract, ``last_response`` metadata, and the opt-in
+    ``intern_strings`` decoding (see ``datamaxi._intern``).
     """
 
     def __init__(
@@ -46,6 +48,7 @@ class AsyncAPI:
         retry_backoff=0.5,
         retry_statuses=(502, 503, 504),
         transport=None,
+        intern_strings=False,
     ):
         httpx = _import_httpx()
         self.api_key = api_key or os.environ.get("DATAMAXI_API_KEY")
@@ -55,6 +58,7 @@ class AsyncAPI:
         self.retry_backoff = retry_backoff
         self.retry_statuses = tuple(retry_statuses)
         self.last_response = None
+        self._object_hook = object_hook(intern_strings)
         self._client = httpx.AsyncClient(
             base_url=base_url or "",
             timeout=timeout,
@@ -92,7 +96,7 @@ class AsyncAPI:
         raise_for_error(response.status_code, response.text, response.headers)
 
         try:
-            data = response.json()
+            data = response.json(object_hook=self._object_hook)
         except ValueError:
             data = response.text
 
@@ -6,7 +6,10 @@ from typing import Any, List, Dict, Union, Optional, Tuple, Callable, TYPE_CHECK
 
 from datamaxi.aio._core import AsyncAPI, AsyncResource
 from datamaxi.lib.utils import check_required_parameter, check_required_parameters
-from datamaxi.resources.utils import raise_if_no_data, to_indexed_dataframe
+from datamaxi.resources.frames import resolve_output, to_frame
+from datamaxi.resources.models import to_model, to_models
+from datamaxi.resources.schema import endpoint_schema
+from datamaxi.resources.utils import raise_if_no_data
 from datamaxi.lib.constants import (
     SPOT,
     FUTURES,
@@ -41,8 +44,13 @@ class AsyncCexCandle(AsyncResource):
         from_unix: Optional[str] = None,
         to_unix: Optional[str] = None,
         pandas: bool = True,
+        output: Optional[str] = None,
+        friendly_names: bool = False,
+        columns: Optional[List[str]] = None,
+        datetime_index: bool = False,
     ) -> Union[pd.DataFrame, CandleResponse]:
         """Fetch candle data (async). See ``datamaxi.Datamaxi.cex.candle``."""
+        output = resolve_output(pandas, output, models=True)
         check_required_parameters(
             [
                 [exchange, "exchange"],
@@ -66,11 +74,12 @@ class AsyncCexCandle(AsyncResource):
         )
         raise_if_no_data(res)
 
-        if pandas:
-            from datamaxi.resources.utils import convert_data_to_data_frame
-
-            return convert_data_to_data_frame(res["data"])
-        return res
+        if output == "raw":
+            return res
+        if output == "model":
+            return to_models(res["data"], "CexCandleView")
+        schema = endpoint_schema("cex_candle", friendly_names, False, datetime_index)
+        return to_frame(res["data"], output, schema=schema, columns=columns)
 
     async def exchanges(self, market: Market) -> List[str]:
         check_required_parameter(market, "market")
@@ -100,8 +109,12 @@ class AsyncCexTicker(AsyncResource):
         currency: Optional[str] = None,
         conversion_base: Optional[str] = None,
         pandas: bool = True,
+        output: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        categorical: bool = False,
     ) -> Union[pd.DataFrame, TickerResponse]:
         """Fetch ticker data (async). See ``datamaxi.Datamaxi.cex.ticker``."""
+        output = resolve_output(pandas, output, models=True)
         check_required_parameters(
             [
                 [exchange, "exchange"],
@@ -121,9 +134,14 @@ class AsyncCexTicker(AsyncResource):
             conversion_base=conversion_base,
         )
 
-        if pandas:
-            return to_indexed_dataframe([res["data"]], "d")
-        return res
+        if output == "raw":
+            return res
+        if output == "model":
+            return to_model(res["data"], "TickerView")
+        schema = endpoint_schema("ticker", False, True) if categorical else None
+        return to_frame(
+            [res["data"]], output, index="d", schema=schema, columns=columns
+        )
 
     async def exchanges(self, market: Market) -> List[str]:
         check_required_parameters([[market, "market"]])
@@ -167,7 +185,10 @@ class AsyncCexWalletStatus(AsyncResource):
         exchange: str,
         asset: str,
         pandas: bool = True,
+        output: Optional[str] = None,
+        columns: Optional[List[str]] = None,
     ) -> Union[pd.DataFrame, List[WalletStatusRow]]:
+        output = resolve_output(pandas, output)
         check_required_parameters(
             [
                 [exchange, "exchange"],
@@ -177,9 +198,9 @@ class AsyncCexWalletStatus(AsyncResource):
         res = await self.request_endpoint(
             "wallet_status", exchange=exchange, asset=asset
         )
-        if pandas:
-            return to_indexed_dataframe(res, "network")
-        return res
+        if output == "raw":
+            return res
+        return to_frame(res, output, index="network", columns=columns)
 
     async def exchanges(self) -> List[str]:
         return await self.request_endpoint("wallet_status_exchanges")
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from typing import List, Union, TYPE_CHECKING
+from typing import List, Optional, Union, TYPE_CHECKING
 
 from datamaxi.aio._core import AsyncResource
 from datamaxi.resources.responses import ForexRow
+from datamaxi.resources.frames import resolve_output, to_frame
+from datamaxi.resources.models import to_model
 from datamaxi.lib.utils import check_required_parameter
 
 if TYPE_CHECKING:
@@ -17,14 +19,17 @@ class AsyncForex(AsyncResource):
         self,
         symbol: str,
         pandas: bool = True,
+        output: Optional[str] = None,
+        columns: Optional[List[str]] = None,
     ) -> Union[pd.DataFrame, ForexRow]:
+        output = resolve_output(pandas, output, models=True)
         check_required_parameter(symbol, "symbol")
         res = await self.request_endpoint("forex", symbol=symbol)
-        if pandas:
-            import pandas as pd
-
-            return pd.DataFrame([res])
-        return res
+        if output == "raw":
+            return res
+        if output == "model":
+            return to_model(res, "ForexResponse")
+        return to_frame([res], output, columns=columns)
 
     async def symbols(self) -> List[str]:
         return await self.request_endpoint("forex_symbols")
@@ -7,6 +7,9 @@ from typing import Callable, Tuple, List, Union, Optional, TYPE_CHECKING
 from datamaxi.aio._core import AsyncResource
 from datamaxi.lib.utils import check_required_parameter, check_required_parameters
 from datamaxi.resources.responses import FundingHistoryResponse, LatestFundingRate
+from datamaxi.resources.frames import resolve_output, to_frame
+from datamaxi.resources.models import to_model, to_models
+from datamaxi.resources.schema import endpoint_schema
 from datamaxi.lib.constants import ASC, DESC, SortOrder
 
 if TYPE_CHECKING:
@@ -24,7 +27,12 @@ class AsyncFundingRate(AsyncResource):
         toDateTime: Optional[str] = None,
         sort: SortOrder = DESC,
         pandas: bool = True,
+        output: Optional[str] = None,
+        friendly_names: bool = False,
+        columns: Optional[List[str]] = None,
+        datetime_index: bool = False,
     ) -> Union[Tuple[pd.DataFrame, Callable], Tuple[FundingHistoryResponse, Callable]]:
+        output = resolve_output(pandas, output, models=True)
         check_required_parameters(
             [
                 [exchange, "exchange"],
@@ -63,32 +71,41 @@ class AsyncFundingRate(AsyncResource):
                 fromDateTime,
                 toDateTime,
                 sort,
-                pandas,
+                output=output,
+                friendly_names=friendly_names,
+                datetime_index=datetime_index,
+                columns=columns,
             )
 
-        if pandas:
-            from datamaxi.resources.utils import convert_data_to_data_frame
-
-            df = convert_data_to_data_frame(res["data"])
-            return df, next_request
-        return res, next_request
+        if output == "raw":
+            return res, next_request
+        if output == "model":
+            return to_models(res["data"], "FundingRateHistoryView"), next_request
+        schema = endpoint_schema(
+            "funding_rate_history", friendly_names, False, datetime_index
+        )
+        return (
+            to_frame(res["data"], output, schema=schema, columns=columns),
+            next_request,
+        )
 
     async def latest(
         self,
         exchange: Optional[str] = None,
         symbol: Optional[str] = None,
         pandas: bool = True,
+        output: Optional[str] = None,
+        columns: Optional[List[str]] = None,
     ) -> Union[pd.DataFrame, LatestFundingRate]:
+        output = resolve_output(pandas, output, models=True)
         res = await self.request_endpoint(
             "funding_rate_latest", exchange=exchange, symbol=symbol
         )
-        if pandas:
-            import pandas as pd
-
-            df = pd.DataFrame([res])
-            df = df.set_index("d")
-            return df
-        return res
+        if output == "raw":
+            return res
+        if output == "model":
+            return to_model(res, "FundingRateLatestResponse")
+        return to_frame([res], output, index="d", columns=columns)
 
     async def exchanges(self) -> List[str]:
         return await self.request_endpoint("funding_rate_exchanges")
@@ -6,10 +6,11 @@ async context manager so the underlying httpx client is closed.
 
 from __future__ import annotations
 
-from typing import Any, List, Union, TYPE_CHECKING
+from typing import Any, List, Optional, Union, TYPE_CHECKING
 
 from datamaxi.aio._core import AsyncAPI, AsyncResource
 from datamaxi.resources.responses import NaverTrendRow
+from datamaxi.resources.frames import resolve_output, to_frame
 from datamaxi.lib.utils import check_required_parameter
 from datamaxi.lib.constants import BASE_URL
 
@@ -45,12 +46,15 @@ class AsyncNaver(AsyncResource):
         return await self.request_endpoint("naver_trend_symbols")
 
     async def trend(
-        self, symbol: str, pandas: bool = True
+        self,
+        symbol: str,
+        pandas: bool = True,
+        output: Optional[str] = None,
+        columns: Optional[List[str]] = None,
     ) -> Union[pd.DataFrame, List[NaverTrendRow]]:
+        output = resolve_output(pandas, output)
         check_required_parameter(symbol, "symbol")
         res = await self.request_endpoint("naver_trend", symbol=symbol)
-        if pandas:
-            import pandas as pd
-
-            return pd.DataFrame(res)
-        return res
+        if output == "raw":
+            return res
+        return to_frame(res, output, columns=columns)
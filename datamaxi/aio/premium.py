@@ -43,6 +43,9 @@ class AsyncPremium(AsyncResource):
         token_exclude: Optional[str] = None,
         query: Optional[str] = None,
         pandas: bool = True,
+        output: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        categorical: bool = False,
     ) -> Union[pd.DataFrame, PremiumResponse]:
         params = build_premium_params(
             source_exchange=source_exchange,
@@ -68,7 +71,7 @@ class AsyncPremium(AsyncResource):
             query=query,
         )
         res = await self.request_endpoint("premium", **params)
-        return shape_premium_response(res, pandas)
+        return shape_premium_response(res, pandas, output, columns, categorical)
 
     async def exchanges(self) -> List[str]:
         return await self.request_endpoint("premium_exchanges")
@@ -40,19 +40,191 @@ multiple symbols on one connection.
 from __future__ import annotations
 
 import asyncio
+import functools
+import inspect
+import itertools
 import json
+import logging
 import os
-from typing import Any, AsyncIterator, Dict, List, Optional
+import time
+from collections import deque
+from urllib.parse import urlsplit
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    TYPE_CHECKING,
+)
 
 from datamaxi.__version__ import __version__
+from datamaxi._intern import InternOption, object_hook
+from datamaxi._retry import get_reconnect_delay
 from datamaxi._ws_endpoints import WS_CHANNELS, WS_BASE_PATH, WS_AUTH_HEADER
+from datamaxi.aio.ws_backfill import BACKFILL_PATHS, RestGapFiller
+from datamaxi.aio.ws_metrics import WSMetrics, _percentile
+
+if TYPE_CHECKING:
+    from datamaxi.aio._client import AsyncDatamaxi
+    from datamaxi.aio.ws_replay import WSRecorder
 
 _DEFAULT_WS_URL = "wss://api.datamaxiplus.com"
 # Send an app-level PING within the ~90s openresty proxy idle timeout.
 _KEEPALIVE_INTERVAL = 30.0
+# Reconnect backoff: exponential from _RECONNECT_BACKOFF, capped at
+# _RECONNECT_BACKOFF_MAX, with jitter (see datamaxi._retry).
 _RECONNECT_BACKOFF = 1.0
+_RECONNECT_BACKOFF_MAX = 30.0
+# SUBSCRIBE / UNSUBSCRIBE calls made within this window are coalesced into as
+# few frames as possible, each carrying at most _MAX_PARAMS_PER_FRAME params.
+_SUBSCRIBE_BATCH_WINDOW = 0.005
+_MAX_PARAMS_PER_FRAME = 100
+# Fail a SUBSCRIBE / UNSUBSCRIBE frame the server hasn't acked in this long.
+_ACK_TIMEOUT = 10.0
+_ACK_LATENCY_WINDOW = 1024  # recent ack latencies kept for ack_stats()
+# stream_batches() defaults: flush at this many messages or after this long.
+_BATCH_MAX_SIZE = 1000
+_BATCH_MAX_LATENCY = 0.05
+# add_handler() defaults for coroutine handlers.
+_HANDLER_CONCURRENCY = 64
+_HANDLER_MAX_BACKLOG = 10_000
+_METRICS_INTERVAL = 10.0  # seconds between metrics_hook calls
+# Heartbeat (opt-in): protocol-level ping every `heartbeat` seconds; a pong
+# later than _HEARTBEAT_TIMEOUT is a miss, and _MAX_MISSED_PONGS consecutive
+# misses mark the connection dead and force a reconnect.
+_HEARTBEAT_TIMEOUT = 5.0
+_MAX_MISSED_PONGS = 2
+_RTT_WINDOW = 256  # recent round-trip times kept for heartbeat_stats()
+# Transport defaults (same as websockets'): inbound message size cap, frames
+# buffered ahead of the reader, and the write buffer high-water mark.
+_MAX_MESSAGE_SIZE = 2**20
+_MAX_QUEUE = 16
+_WRITE_LIMIT = 2**15
 _CLOSED = object()  # sentinel pushed to subscriber queues on shutdown
 
+_logger = logging.getLogger(__name__)
+
+CONNECTED = "connected"
+DISCONNECTED = "disconnected"
+RESUBSCRIBED = "resubscribed"
+GAP = "gap"
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class WSEvent:
+    """A connection-state event, delivered to streams opened with ``events=True``.
+
+    ``type`` is one of ``"disconnected"``, ``"connected"``, ``"resubscribed"``
+    (``params`` holds the replayed subscribe params) or ``"gap"``. A ``gap``
+    event follows every successful reconnect and spans the outage: ``start``
+    is the receive time of the last message before the drop (or the drop
+    itself when nothing was received yet) and ``end`` the reconnect time, both
+    UTC milliseconds like the wire ``d`` field — pass them to the REST
+    endpoints to backfill what the stream missed.
+    """
+
+    __slots__ = ("type", "ts", "params", "start", "end")
+
+    def __init__(
+        self,
+        type: str,
+        ts: Optional[int] = None,
+        params: Sequence[str] = (),
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ):
+        self.type = type
+        self.ts = ts if ts is not None else _now_ms()
+        self.params = list(params)
+        self.start = start
+        self.end = end
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Outage length in seconds for a ``gap`` event, else ``None``."""
+        if self.start is None or self.end is None:
+            return None
+        return (self.end - self.start) / 1000.0
+
+    def __repr__(self) -> str:
+        if self.type == GAP:
+            return "WSEvent(type='gap', start={}, end={}, duration={:.3f})".format(
+                self.start, self.end, self.duration
+            )
+        return "WSEvent(type={!r}, ts={})".format(self.type, self.ts)
+
+
+def _chunks(params: List[str], size: int) -> List[List[str]]:
+    """Split ``params`` into frames of at most ``size``; ``[]`` is one frame."""
+    if not params:
+        return [[]]
+    it = iter(params)
+    return [[first, *itertools.islice(it, size - 1)] for first in it]
+
+
+def _coalesce(ops: List[tuple]) -> List[tuple]:
+    """Merge consecutive same-method ``(method, params, future)`` ops.
+
+    Order between SUBSCRIBE and UNSUBSCRIBE runs is preserved; params within a
+    run are de-duplicated keeping first-seen order.
+    """
+    runs: List[tuple] = []
+    for method, params, fut in ops:
+        if runs and runs[-1][0] == method:
+            runs[-1][1].extend(params)
+            runs[-1][2].append(fut)
+        else:
+            runs.append((method, list(params), [fut]))
+    return [(method, list(dict.fromkeys(p)), futs) for method, p, futs in runs]
+
+
+def _connection_lost(cause: Optional[BaseException]) -> ConnectionError:
+    exc = ConnectionError(
+        "WebSocket connection lost before the server acknowledged the "
+        "request; active params are replayed on reconnect"
+    )
+    exc.__cause__ = cause
+    return exc
+
+
+def _mark_retrieved(fut: asyncio.Future) -> None:
+    # Callers may never await an ack; don't warn about its exception on GC.
+    if not fut.cancelled():
+        fut.exception()
+
+
+def _settle(gathered: asyncio.Future, futs: List[asyncio.Future]) -> None:
+    """Resolve the callers' futures once every frame of their run is acked."""
+    for fut in futs:
+        if fut.done():
+            continue
+        if gathered.cancelled():
+            fut.cancel()
+        elif gathered.exception() is not None:
+            fut.set_exception(gathered.exception())
+        else:
+            fut.set_result(gathered.result())
+
+
+class _PendingAck:
+    """A sent SUBSCRIBE / UNSUBSCRIBE frame awaiting its ``{"id": N}`` ack."""
+
+    __slots__ = ("future", "method", "params", "sent", "timer")
+
+    def __init__(self, future: asyncio.Future, method: str, params: List[str]):
+        self.future = future
+        self.method = method
+        self.params = params
+        self.sent = time.monotonic()
+        self.timer: Optional[asyncio.TimerHandle] = None
+
 
 def _import_websockets():
     try:
@@ -65,6 +237,55 @@ def _import_websockets():
     return websockets
 
 
+def _compression_kwargs(compression: Union[str, Dict[str, Any], None]) -> dict:
+    """``websockets.connect`` kwargs for the ``compression`` option.
+
+    ``"deflate"`` negotiates permessage-deflate with websockets' defaults,
+    ``None`` disables it, and a dict is passed to
+    ``ClientPerMessageDeflateFactory`` (``client_max_window_bits``,
+    ``server_max_window_bits``, ``compress_settings``, ...) to trade CPU and
+    memory for ratio.
+    """
+    if compression is None or compression == "deflate":
+        return {"compression": compression}
+    if not isinstance(compression, dict):
+        raise ValueError(
+            f"compression must be 'deflate', None or a dict, got {compression!r}"
+        )
+    from websockets.extensions.permessage_deflate import (
+        ClientPerMessageDeflateFactory,
+    )
+
+    options = {"compress_settings": {"memLevel": 5}, **compression}
+    return {
+        "compression": None,
+        "extensions": [ClientPerMessageDeflateFactory(**options)],
+    }
+
+
+_WIRE_COUNTING_CONNECTION = None
+
+
+def _wire_counting_connection(websockets) -> type:
+    """A ``ClientConnection`` that counts the bytes read off the socket.
+
+    That is the wire size — compressed frames plus framing — to compare with
+    the decoded payload bytes the metrics already count.
+    """
+    global _WIRE_COUNTING_CONNECTION
+    if _WIRE_COUNTING_CONNECTION is None:
+
+        class WireCountingConnection(websockets.ClientConnection):
+            wire_bytes = 0
+
+            def data_received(self, data: bytes) -> None:
+                self.wire_bytes += len(data)
+                super().data_received(data)
+
+        _WIRE_COUNTING_CONNECTION = WireCountingConnection
+    return _WIRE_COUNTING_CONNECTION
+
+
 def _derive_ws_url(base_url: Optional[str]) -> str:
     if not base_url:
         return _DEFAULT_WS_URL
@@ -81,6 +302,49 @@ class AsyncWSConnection:
     Owns the SUBSCRIBE / UNSUBSCRIBE / PING protocol, a reader that fans each
     incoming data message out to every subscriber stream, an app-level PING
     keepalive, and reconnect-with-resubscribe on a dropped connection.
+
+    :meth:`subscribe` / :meth:`unsubscribe` calls are queued and flushed after
+    ``subscribe_batch_window`` seconds: consecutive calls of the same method
+    are merged into frames of at most ``max_params_per_frame`` params (the
+    reconnect replay is chunked the same way). Each call returns a future
+    resolved with the server's ``result`` (one entry per frame) once every
+    frame carrying its params is acked, or failed with ``ConnectionError`` if
+    the connection drops first — the params stay active and are replayed.
+    Frames not acked within ``ack_timeout`` seconds fail with
+    ``asyncio.TimeoutError`` (``None`` waits forever); ack latencies are
+    summarised by :meth:`ack_stats`.
+
+    ``intern_strings`` interns the exchange / symbol / ... values as they
+    are decoded (see :mod:`datamaxi._intern`).
+
+    ``metrics=True`` (implied by a ``metrics_hook``) enables
+    :class:`~datamaxi.aio.ws_metrics.WSMetrics`; ``metrics_hook(snapshot)``
+    is then called every ``metrics_interval`` seconds.
+
+    ``heartbeat=N`` sends a protocol-level ping every N seconds and measures
+    the round trip; after ``max_missed_pongs`` pings in a row without a pong
+    within ``heartbeat_timeout`` seconds the socket is treated as half-open
+    and dropped, so the usual reconnect starts within seconds rather than
+    when the proxy finally cuts it. RTTs are summarised by
+    :meth:`heartbeat_stats`.
+
+    ``compression`` controls permessage-deflate (``"deflate"``, ``None``, or
+    a dict of deflate parameters), ``max_size`` caps an inbound message
+    (``None``: unlimited), ``max_queue`` bounds the frames buffered ahead of
+    the reader and ``write_limit`` sets the write buffer high-water mark.
+    ``connect_kwargs`` still override all of them. With metrics on, the
+    snapshot compares wire bytes with decoded payload bytes.
+
+    A ``recorder`` (see
+    :mod:`datamaxi.aio.ws_replay`) receives every raw frame before decoding.
+
+    Reconnects back off exponentially from ``reconnect_backoff`` seconds up to
+    ``reconnect_backoff_max``, with jitter, and give up after
+    ``max_reconnect_attempts`` consecutive failures (``None`` retries
+    forever). Each outage is reported to event-enabled streams as
+    :class:`WSEvent` s. With a ``gap_filler`` (see
+    :mod:`datamaxi.aio.ws_backfill`) the missed window is fetched over REST
+    and delivered before live messages resume.
     """
 
     def __init__(
@@ -90,17 +354,82 @@ class AsyncWSConnection:
         keepalive: float = _KEEPALIVE_INTERVAL,
         reconnect: bool = True,
         connect_kwargs: Optional[dict] = None,
+        reconnect_backoff: Optional[float] = None,
+        reconnect_backoff_max: float = _RECONNECT_BACKOFF_MAX,
+        max_reconnect_attempts: Optional[int] = None,
+        gap_filler: Optional[RestGapFiller] = None,
+        subscribe_batch_window: float = _SUBSCRIBE_BATCH_WINDOW,
+        max_params_per_frame: int = _MAX_PARAMS_PER_FRAME,
+        ack_timeout: Optional[float] = _ACK_TIMEOUT,
+        metrics: bool = False,
+        metrics_hook: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        metrics_interval: float = _METRICS_INTERVAL,
+        recorder: Optional["WSRecorder"] = None,
+        heartbeat: Optional[float] = None,
+        heartbeat_timeout: float = _HEARTBEAT_TIMEOUT,
+        max_missed_pongs: int = _MAX_MISSED_PONGS,
+        compression: Union[str, Dict[str, Any], None] = "deflate",
+        max_size: Optional[int] = _MAX_MESSAGE_SIZE,
+        max_queue: Optional[int] = _MAX_QUEUE,
+        write_limit: int = _WRITE_LIMIT,
+        intern_strings: InternOption = False,
     ):
+        if max_params_per_frame < 1:
+            raise ValueError("max_params_per_frame must be >= 1")
         self._url = url
+        self._path = urlsplit(url).path.removeprefix(WS_BASE_PATH)  # channel
         self._api_key = api_key
         self._keepalive = keepalive
         self._reconnect = reconnect
-        self._connect_kwargs = connect_kwargs or {}
+        self._connect_kwargs = {
+            **_compression_kwargs(compression),
+            "max_size": max_size,
+            "max_queue": max_queue,
+            "write_limit": write_limit,
+            **(connect_kwargs or {}),
+        }
+        if heartbeat:
+            # Our heartbeat replaces the library's own ping loop.
+            self._connect_kwargs.setdefault("ping_interval", None)
+        self._reconnect_backoff = reconnect_backoff
+        self._reconnect_backoff_max = reconnect_backoff_max
+        self._max_reconnect_attempts = max_reconnect_attempts
+        self._gap_filler = gap_filler
+        self._batch_window = subscribe_batch_window
+        self._max_params_per_frame = max_params_per_frame
+        self._ack_timeout = ack_timeout
+        self._loads = json.loads
+        hook = object_hook(intern_strings)
+        if hook is not None:
+            self._loads = functools.partial(json.loads, object_hook=hook)
+        self._metrics: Optional[WSMetrics] = None
+        if metrics or metrics_hook is not None:
+            self._metrics = WSMetrics(self._path)
+        self._metrics_hook = metrics_hook
+        self._metrics_interval = metrics_interval
+        self._metrics_task: Optional[asyncio.Task] = None
+        self._recorder = recorder
+        self._heartbeat = heartbeat
+        self._heartbeat_timeout = heartbeat_timeout
+        self._max_missed_pongs = max_missed_pongs
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._rtts: deque = deque(maxlen=_RTT_WINDOW)
+        self._missed_pongs = 0
+        self._dead_connections = 0
+        self._wire_bytes = 0  # from connections already closed
         self._ws = None
         self._websockets = None
         self._id = 0
         self._active: set = set()  # params to replay on reconnect
-        self._subscribers: List[asyncio.Queue] = []
+        self._subscribers: List[Any] = []  # sinks; see add_sink()
+        self._event_subscribers: List[Any] = []
+        self._last_recv: Optional[int] = None  # ms; start of the next gap
+        self._queued_ops: List[tuple] = []  # (method, params, future) to flush
+        self._acks: Dict[int, _PendingAck] = {}  # frame id -> pending ack
+        self._ack_latencies: deque = deque(maxlen=_ACK_LATENCY_WINDOW)
+        self._ack_counts = {"acked": 0, "timed_out": 0, "failed": 0}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
         self._reader_task: Optional[asyncio.Task] = None
         self._keepalive_task: Optional[asyncio.Task] = None
         self._closed = False
@@ -110,6 +439,10 @@ class AsyncWSConnection:
         self._reader_task = asyncio.create_task(self._reader())
         if self._keepalive:
             self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+        if self._metrics_hook is not None:
+            self._metrics_task = asyncio.create_task(self._metrics_loop())
+        if self._heartbeat:
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
 
     async def _open(self) -> None:
         self._websockets = _import_websockets()
@@ -117,18 +450,24 @@ class AsyncWSConnection:
             WS_AUTH_HEADER: str(self._api_key),
             "User-Agent": "datamaxi/" + __version__,
         }
+        kwargs = self._connect_kwargs
+        if self._metrics is not None and "create_connection" not in kwargs:
+            kwargs = dict(kwargs)
+            kwargs["create_connection"] = _wire_counting_connection(self._websockets)
+        if self._ws is not None:
+            self._wire_bytes += getattr(self._ws, "wire_bytes", 0)
         # No Origin header: coder/websocket enforces same-origin otherwise.
         self._ws = await self._websockets.connect(
-            self._url, additional_headers=headers, **self._connect_kwargs
+            self._url, additional_headers=headers, **kwargs
         )
+        self._missed_pongs = 0
         if self._active:  # resubscribe after a reconnect
-            await self._send(
-                {
-                    "method": "SUBSCRIBE",
-                    "params": sorted(self._active),
-                    "id": self._next_id(),
-                }
-            )
+            # Under the flush lock, so no queued UNSUBSCRIBE lands between
+            # the chunks and is then undone by a stale SUBSCRIBE.
+            async with self._flush_lock:
+                params = sorted(self._active)
+                for chunk in _chunks(params, self._max_params_per_frame):
+                    await self._send_frame("SUBSCRIBE", chunk)
 
     def _next_id(self) -> int:
         self._id += 1
@@ -137,24 +476,172 @@ class AsyncWSConnection:
     async def _send(self, obj: dict) -> None:
         await self._ws.send(json.dumps(obj))
 
-    async def subscribe(self, params: List[str]) -> None:
+    async def subscribe(self, params: List[str]) -> asyncio.Future:
+        """Queue a SUBSCRIBE; the returned future resolves on the server ack."""
         self._active.update(params)
-        await self._send(
-            {"method": "SUBSCRIBE", "params": list(params), "id": self._next_id()}
-        )
+        return self._enqueue("SUBSCRIBE", params)
 
-    async def unsubscribe(self, params: List[str]) -> None:
+    async def unsubscribe(self, params: List[str]) -> asyncio.Future:
+        """Queue an UNSUBSCRIBE; the returned future resolves on the server ack."""
         for p in params:
             self._active.discard(p)
-        await self._send(
-            {"method": "UNSUBSCRIBE", "params": list(params), "id": self._next_id()}
+        return self._enqueue("UNSUBSCRIBE", params)
+
+    def _enqueue(self, method: str, params: List[str]) -> asyncio.Future:
+        fut = asyncio.get_running_loop().create_future()
+        fut.add_done_callback(_mark_retrieved)
+        self._queued_ops.append((method, list(params), fut))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_soon())
+        return fut
+
+    async def _flush_soon(self) -> None:
+        try:
+            await asyncio.sleep(self._batch_window)
+        finally:
+            self._flush_task = None  # later calls start a new window
+        await self._flush()
+
+    async def _flush(self) -> None:
+        """Send queued ops as coalesced, chunked frames, in call order."""
+        loop = asyncio.get_running_loop()
+        async with self._flush_lock:
+            ops, self._queued_ops = self._queued_ops, []
+            for method, params, futs in _coalesce(ops):
+                acks = []
+                for chunk in _chunks(params, self._max_params_per_frame):
+                    try:
+                        acks.append(await self._send_frame(method, chunk))
+                    except Exception as exc:
+                        lost = loop.create_future()
+                        lost.set_exception(_connection_lost(exc))
+                        acks.append(lost)
+                        break
+                gathered = asyncio.gather(*acks)
+                gathered.add_done_callback(lambda g, futs=futs: _settle(g, futs))
+
+    async def _send_frame(self, method: str, params: List[str]) -> asyncio.Future:
+        """Send one frame and return the future its ack will resolve."""
+        loop = asyncio.get_running_loop()
+        frame_id = self._next_id()
+        pending = _PendingAck(loop.create_future(), method, params)
+        pending.future.add_done_callback(_mark_retrieved)
+        if self._ack_timeout is not None:
+            pending.timer = loop.call_later(
+                self._ack_timeout, self._expire_ack, frame_id
+            )
+        self._acks[frame_id] = pending
+        try:
+            await self._send({"method": method, "params": params, "id": frame_id})
+        except Exception as exc:
+            self._fail_acks(exc)
+            raise
+        return pending.future
+
+    def _resolve_ack(self, msg: Dict[str, Any]) -> None:
+        pending = self._acks.pop(msg.get("id"), None)
+        if pending is None or pending.future.done():
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+        self._ack_latencies.append(time.monotonic() - pending.sent)
+        self._ack_counts["acked"] += 1
+        pending.future.set_result(msg.get("result"))
+
+    def _expire_ack(self, frame_id: int) -> None:
+        pending = self._acks.pop(frame_id, None)
+        if pending is None or pending.future.done():
+            return
+        self._ack_counts["timed_out"] += 1
+        pending.future.set_exception(
+            asyncio.TimeoutError(
+                "no ack for {} {} (id={}) within {}s".format(
+                    pending.method, pending.params, frame_id, self._ack_timeout
+                )
+            )
+        )
+
+    def _fail_acks(self, cause: Optional[BaseException] = None) -> None:
+        """Fail every unacknowledged frame (connection lost or closed)."""
+        acks, self._acks = self._acks, {}
+        for pending in acks.values():
+            if pending.timer is not None:
+                pending.timer.cancel()
+            if pending.future.done():
+                continue
+            self._ack_counts["failed"] += 1
+            pending.future.set_exception(_connection_lost(cause))
+
+    def ack_stats(self) -> Dict[str, Any]:
+        """Subscribe / unsubscribe ack counters and latency summary.
+
+        ``pending`` frames are awaiting an ack; ``acked`` / ``timed_out`` /
+        ``failed`` count settled frames since the connection was created.
+        ``last`` / ``mean`` / ``p50`` / ``p99`` / ``max`` are send-to-ack
+        latencies in seconds over the last ``_ACK_LATENCY_WINDOW`` acks
+        (``None`` before the first ack).
+        """
+        stats: Dict[str, Any] = {"pending": len(self._acks), **self._ack_counts}
+        latencies = list(self._ack_latencies)
+        ordered = sorted(latencies)
+        stats.update(
+            last=latencies[-1] if latencies else None,
+            mean=sum(latencies) / len(latencies) if latencies else None,
+            p50=_percentile(ordered, 50) if ordered else None,
+            p99=_percentile(ordered, 99) if ordered else None,
+            max=ordered[-1] if ordered else None,
         )
+        return stats
+
+    def stream(self, events: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Register a subscriber queue *now* and return an iterator over it.
+
+        With ``events=True`` the iterator also yields :class:`WSEvent` s
+        (disconnect / reconnect / resubscribe / gap) in line with the data.
+        """
+        return self._drain(self._register(events))
+
+    def stream_batches(
+        self,
+        max_size: int = _BATCH_MAX_SIZE,
+        max_latency: float = _BATCH_MAX_LATENCY,
+        events: bool = False,
+    ) -> AsyncIterator[List[Any]]:
+        """Like :meth:`stream`, but yield lists of messages.
+
+        A batch is cut at ``max_size`` messages or ``max_latency`` seconds
+        after its first message, whichever comes first; everything already
+        queued is taken without waiting, so one wake-up serves many messages
+        at high rates.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        if max_latency < 0:
+            raise ValueError("max_latency must be >= 0")
+        return self._drain_batches(self._register(events), max_size, max_latency)
 
-    def stream(self) -> AsyncIterator[Dict[str, Any]]:
-        """Register a subscriber queue *now* and return an iterator over it."""
+    def _register(self, events: bool) -> asyncio.Queue:
         q: asyncio.Queue = asyncio.Queue()
-        self._subscribers.append(q)
-        return self._drain(q)
+        self.add_sink(q, events)
+        return q
+
+    def add_sink(self, sink: Any, events: bool = False) -> None:
+        """Fan messages out to ``sink.put_nowait(item)`` from the reader.
+
+        Any object with a non-blocking ``put_nowait`` works — an
+        ``asyncio.Queue`` (what :meth:`stream` uses) or a thread-safe queue
+        (:class:`datamaxi.ws.DatamaxiWS`). The sink receives a close sentinel
+        when the connection shuts down.
+        """
+        self._subscribers.append(sink)
+        if events:
+            self._event_subscribers.append(sink)
+
+    def remove_sink(self, sink: Any) -> None:
+        if sink in self._subscribers:
+            self._subscribers.remove(sink)
+        if sink in self._event_subscribers:
+            self._event_subscribers.remove(sink)
 
     async def _drain(self, q: asyncio.Queue) -> AsyncIterator[Dict[str, Any]]:
         try:
@@ -164,33 +651,156 @@ class AsyncWSConnection:
                     return
                 yield item
         finally:
-            if q in self._subscribers:
-                self._subscribers.remove(q)
+            self.remove_sink(q)
+
+    async def _drain_batches(
+        self, q: asyncio.Queue, max_size: int, max_latency: float
+    ) -> AsyncIterator[List[Any]]:
+        loop = asyncio.get_running_loop()
+        try:
+            closed = False
+            while not closed:
+                item = await q.get()
+                if item is _CLOSED:
+                    return
+                batch = [item]
+                deadline = loop.time() + max_latency
+                while len(batch) < max_size:
+                    if q.empty():
+                        timeout = deadline - loop.time()
+                        if timeout <= 0:
+                            break
+                        try:
+                            item = await asyncio.wait_for(q.get(), timeout)
+                        except asyncio.TimeoutError:
+                            break
+                    else:
+                        item = q.get_nowait()
+                    if item is _CLOSED:
+                        closed = True
+                        break
+                    batch.append(item)
+                yield batch
+        finally:
+            self.remove_sink(q)
+
+    def _emit(self, event: WSEvent) -> None:
+        for q in list(self._event_subscribers):
+            q.put_nowait(event)
+
+    async def _reconnect_loop(self) -> bool:
+        """Reopen the socket with jittered exponential backoff.
+
+        Returns ``True`` once reconnected (and resubscribed), ``False`` when
+        the connection was closed or ``max_reconnect_attempts`` ran out.
+        """
+        dropped_at = _now_ms()
+        gap_start = self._last_recv if self._last_recv is not None else dropped_at
+        self._emit(WSEvent(DISCONNECTED, ts=dropped_at))
+        # Read the module default at call time so it stays tunable.
+        backoff = self._reconnect_backoff
+        if backoff is None:
+            backoff = _RECONNECT_BACKOFF
+        attempt = 0
+        while not self._closed:
+            attempt += 1
+            if (
+                self._max_reconnect_attempts is not None
+                and attempt > self._max_reconnect_attempts
+            ):
+                return False
+            await asyncio.sleep(
+                get_reconnect_delay(attempt, backoff, self._reconnect_backoff_max)
+            )
+            try:
+                await self._open()
+            except Exception:
+                continue  # handshake/network failure: back off further
+            now = _now_ms()
+            self._emit(WSEvent(CONNECTED, ts=now))
+            if self._active:
+                self._emit(WSEvent(RESUBSCRIBED, ts=now, params=sorted(self._active)))
+            self._emit(WSEvent(GAP, ts=now, start=gap_start, end=now))
+            if self._gap_filler is not None:
+                missed = await self._gap_filler.fill(
+                    sorted(self._active), gap_start, now
+                )
+                for msg in missed:
+                    self._publish(msg)
+            return True
+        return False
+
+    def _publish(self, msg: Any) -> None:
+        sinks = list(self._subscribers)
+        for q in sinks:
+            q.put_nowait(msg)
+        if self._metrics is not None:
+            self._metrics.on_publish(sinks)
+
+    def _decode(self, raw: Any) -> Any:
+        if self._metrics is None:
+            return self._loads(raw)
+        started = time.perf_counter()
+        msg = self._loads(raw)
+        self._metrics.on_message(
+            raw, time.perf_counter() - started, msg, self._last_recv
+        )
+        return msg
+
+    def metrics(self) -> Optional[Dict[str, Any]]:
+        """A :class:`~datamaxi.aio.ws_metrics.WSMetrics` snapshot (starting a
+        new rate interval), or ``None`` when metrics are off."""
+        if self._metrics is None:
+            return None
+        return self._metrics.snapshot(
+            list(self._subscribers),
+            self.ack_stats(),
+            heartbeat=self.heartbeat_stats() if self._heartbeat else None,
+            wire_bytes=self._wire_bytes + getattr(self._ws, "wire_bytes", 0),
+            compression=self._negotiated_compression(),
+        )
+
+    def _negotiated_compression(self) -> Optional[str]:
+        protocol = getattr(self._ws, "protocol", None)
+        names = [ext.name for ext in getattr(protocol, "extensions", ())]
+        return ", ".join(names) or None
+
+    async def _metrics_loop(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self._metrics_interval)
+            try:
+                result = self._metrics_hook(self.metrics())
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                _logger.exception("WS metrics hook failed")
 
     async def _reader(self) -> None:
         while not self._closed:
             try:
                 raw = await self._ws.recv()
-            except self._websockets.ConnectionClosed:
+            except self._websockets.ConnectionClosed as exc:
+                self._fail_acks(exc)
                 if self._closed or not self._reconnect:
                     break
-                await asyncio.sleep(_RECONNECT_BACKOFF)
-                try:
-                    await self._open()
-                except Exception:
-                    continue
-                else:
-                    continue
-            msg = json.loads(raw)
+                if not await self._reconnect_loop():
+                    break
+                continue
+            self._last_recv = _now_ms()
+            if self._recorder is not None:
+                self._recorder.record(self._path, raw, self._last_recv)
+            msg = self._decode(raw)
             # Subscription acks are {"result": [...], "id": N}; when the accepted
             # param list is empty the server omits `result`, leaving just
             # {"id": N}. Data payloads always carry other fields (s/e/d/...) —
             # note they may also include an "id" (token id), so detect an ack as
             # any dict whose keys are a subset of {"result", "id"}.
             if isinstance(msg, dict) and set(msg) <= {"result", "id"}:
+                self._resolve_ack(msg)
                 continue
-            for q in list(self._subscribers):
-                q.put_nowait(msg)
+            if self._gap_filler is not None and self._gap_filler.seen(msg):
+                continue  # already delivered by a REST backfill
+            self._publish(msg)
         for q in list(self._subscribers):
             q.put_nowait(_CLOSED)
 
@@ -202,11 +812,73 @@ class AsyncWSConnection:
             except Exception:
                 pass
 
+    async def _heartbeat_loop(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self._heartbeat)
+            ws = self._ws
+            try:
+                pong = await ws.ping()
+                started = time.monotonic()
+                await asyncio.wait_for(pong, self._heartbeat_timeout)
+            except asyncio.TimeoutError:
+                self._pong_missed(ws)
+            except Exception:
+                continue  # closed or reconnecting: the reader handles it
+            else:
+                self._rtts.append(time.monotonic() - started)
+                self._missed_pongs = 0
+
+    def _pong_missed(self, ws: Any) -> None:
+        self._missed_pongs += 1
+        if self._missed_pongs < self._max_missed_pongs or ws is not self._ws:
+            return
+        _logger.warning(
+            "WS %s missed %d pongs; dropping the connection",
+            self._path,
+            self._missed_pongs,
+        )
+        self._dead_connections += 1
+        self._missed_pongs = 0
+        # No closing handshake: the peer is unresponsive. Aborting makes the
+        # reader see ConnectionClosed now and start the reconnect loop.
+        ws.transport.abort()
+
+    def heartbeat_stats(self) -> Dict[str, Any]:
+        """Heartbeat round-trip times (seconds) and dead-connection counters.
+
+        ``rtt_last`` / ``rtt_mean`` / ``rtt_p50`` / ``rtt_p99`` / ``rtt_max``
+        cover the last ``_RTT_WINDOW`` pongs (``None`` before the first one);
+        ``missed`` is the current run of missed pongs and ``dead`` counts
+        connections dropped for missing too many.
+        """
+        rtts = list(self._rtts)
+        ordered = sorted(rtts)
+        return {
+            "rtt_last": rtts[-1] if rtts else None,
+            "rtt_mean": sum(rtts) / len(rtts) if rtts else None,
+            "rtt_p50": _percentile(ordered, 50) if ordered else None,
+            "rtt_p99": _percentile(ordered, 99) if ordered else None,
+            "rtt_max": ordered[-1] if ordered else None,
+            "missed": self._missed_pongs,
+            "dead": self._dead_connections,
+        }
+
     async def close(self) -> None:
         self._closed = True
-        for task in (self._reader_task, self._keepalive_task):
+        tasks = (
+            self._reader_task,
+            self._keepalive_task,
+            self._flush_task,
+            self._metrics_task,
+            self._heartbeat_task,
+        )
+        for task in tasks:
             if task is not None:
                 task.cancel()
+        for _, _, fut in self._queued_ops:
+            fut.cancel()
+        self._queued_ops = []
+        self._fail_acks()
         if self._ws is not None:
             await self._ws.close()
         for q in list(self._subscribers):
@@ -327,6 +999,113 @@ def _resolve_params(
     return list(params)
 
 
+class WSHandler:
+    """A handler registered on a connection, invoked directly by its reader.
+
+    No queue and no consumer task sit between the socket and the handler. A
+    plain function runs inline for each message (keep it short: it delays
+    the reader). A coroutine function is started as a task per message, at
+    most ``concurrency`` at a time; further messages wait in a backlog of at
+    most ``max_backlog`` (oldest dropped first, counted in :attr:`dropped`).
+    Handler exceptions are logged and counted in :attr:`errors`, never
+    propagated into the reader.
+    """
+
+    def __init__(
+        self,
+        conn: AsyncWSConnection,
+        handler: Callable[[Any], Any],
+        concurrency: int = _HANDLER_CONCURRENCY,
+        max_backlog: int = _HANDLER_MAX_BACKLOG,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self._conn = conn
+        self._handler = handler
+        self._is_async = inspect.iscoroutinefunction(handler)
+        self._concurrency = concurrency
+        self._backlog: deque = deque(maxlen=max_backlog)
+        self._tasks: set = set()
+        self._closed = False
+        self.dropped = 0
+        self.errors = 0
+
+    def put_nowait(self, item: Any) -> None:
+        if item is _CLOSED:
+            self._closed = True
+            return
+        if self._closed:
+            return
+        if not self._is_async:
+            try:
+                self._handler(item)
+            except Exception:
+                self._failed()
+            return
+        if len(self._tasks) < self._concurrency:
+            self._start(item)
+        else:
+            if len(self._backlog) == self._backlog.maxlen:
+                self.dropped += 1
+            self._backlog.append(item)
+
+    def _start(self, item: Any) -> None:
+        task = asyncio.ensure_future(self._handler(item))
+        self._tasks.add(task)
+        task.add_done_callback(self._done)
+
+    def _done(self, task: asyncio.Future) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self._failed(task.exception())
+        if self._backlog and not self._closed:
+            self._start(self._backlog.popleft())
+
+    def _failed(self, exc: Optional[BaseException] = None) -> None:
+        self.errors += 1
+        _logger.error("WS handler %r failed", self._handler, exc_info=exc or True)
+
+    @property
+    def pending(self) -> int:
+        """Async invocations running or waiting in the backlog."""
+        return len(self._tasks) + len(self._backlog)
+
+    def remove(self) -> None:
+        """Stop delivering to the handler; running invocations are left be."""
+        self._closed = True
+        self._backlog.clear()
+        self._conn.remove_sink(self)
+
+    async def drain(self) -> None:
+        """Wait until every running and backlogged invocation has finished."""
+        while self._tasks:
+            await asyncio.wait(set(self._tasks))
+
+
+def _add_handler(
+    conn: AsyncWSConnection,
+    handler: Callable[[Any], Any],
+    concurrency: int,
+    events: bool,
+    max_backlog: int = _HANDLER_MAX_BACKLOG,
+) -> WSHandler:
+    registration = WSHandler(
+        conn, handler, concurrency=concurrency, max_backlog=max_backlog
+    )
+    conn.add_sink(registration, events)
+    return registration
+
+
+async def _subscribe(
+    conn: AsyncWSConnection, params: List[str], stream: Any, confirm: bool
+) -> Any:
+    """SUBSCRIBE ``params`` once ``stream`` is registered (no missed msgs)."""
+    ack = await conn.subscribe(params)
+    if confirm:
+        await ack
+    return stream
+
+
 class Subscription:
     """A single-path subscribable channel (``ws.forex``, ``ws.premium``, ...).
 
@@ -343,7 +1122,7 @@ class Subscription:
         return WS_CHANNELS[self._path].get("param")
 
     async def subscribe(
-        self, *params: str, **tokens: str
+        self, *params: str, events: bool = False, confirm: bool = False, **tokens: str
     ) -> AsyncIterator[Dict[str, Any]]:
         """SUBSCRIBE and return an async iterator over the channel.
 
@@ -352,17 +1131,67 @@ class Subscription:
         ``tokens`` named after this channel's :attr:`param_format` to build one
         param (``subscribe(symbol="BTC-USDT", exchange="binance")``). See
         :func:`build_param`. The two forms are mutually exclusive.
+
+        ``events=True`` interleaves connection :class:`WSEvent` s with the
+        data messages. ``confirm=True`` waits for the server to acknowledge
+        the SUBSCRIBE before returning. Both are control kwargs, not param
+        tokens.
         """
         resolved = _resolve_params(self.param_format, params, tokens)
         conn = await self._client._conn(self._path)
-        stream = conn.stream()  # register the queue before SUBSCRIBE (no missed msgs)
-        await conn.subscribe(resolved)
-        return stream
+        return await _subscribe(conn, resolved, conn.stream(events), confirm)
 
-    async def unsubscribe(self, *params: str, **tokens: str) -> None:
+    async def subscribe_batches(
+        self,
+        *params: str,
+        max_size: int = _BATCH_MAX_SIZE,
+        max_latency: float = _BATCH_MAX_LATENCY,
+        events: bool = False,
+        confirm: bool = False,
+        **tokens: str,
+    ) -> AsyncIterator[List[Any]]:
+        """:meth:`subscribe`, yielding lists of messages instead (see
+        :meth:`AsyncWSConnection.stream_batches`)."""
         resolved = _resolve_params(self.param_format, params, tokens)
         conn = await self._client._conn(self._path)
-        await conn.unsubscribe(resolved)
+        stream = conn.stream_batches(max_size, max_latency, events)
+        return await _subscribe(conn, resolved, stream, confirm)
+
+    async def add_handler(
+        self,
+        handler: Callable[[Any], Any],
+        *params: str,
+        concurrency: int = _HANDLER_CONCURRENCY,
+        events: bool = False,
+        confirm: bool = False,
+        max_backlog: int = _HANDLER_MAX_BACKLOG,
+        **tokens: str,
+    ) -> WSHandler:
+        """SUBSCRIBE and have the reader call ``handler(msg)`` directly.
+
+        ``handler`` may be a plain or a coroutine function (see
+        :class:`WSHandler` for ``concurrency`` / ``max_backlog``);
+        ``params`` / ``tokens`` / ``events`` / ``confirm`` as in
+        :meth:`subscribe`. Call ``.remove()`` on the
+        returned :class:`WSHandler` to stop it.
+        """
+        resolved = _resolve_params(self.param_format, params, tokens)
+        conn = await self._client._conn(self._path)
+        return await _subscribe(
+            conn,
+            resolved,
+            _add_handler(conn, handler, concurrency, events, max_backlog),
+            confirm,
+        )
+
+    async def unsubscribe(
+        self, *params: str, confirm: bool = False, **tokens: str
+    ) -> None:
+        resolved = _resolve_params(self.param_format, params, tokens)
+        conn = await self._client._conn(self._path)
+        ack = await conn.unsubscribe(resolved)
+        if confirm:
+            await ack
 
 
 class MarketSubscription:
@@ -380,25 +1209,71 @@ class MarketSubscription:
         return path
 
     async def subscribe(
-        self, *params: str, market: str = "spot", **tokens: str
+        self,
+        *params: str,
+        market: str = "spot",
+        events: bool = False,
+        confirm: bool = False,
+        **tokens: str,
     ) -> AsyncIterator[Dict[str, Any]]:
         """SUBSCRIBE on ``market``; ``params`` or structured ``tokens`` (see
-        :meth:`Subscription.subscribe`). ``market`` is a control kwarg, not a
-        param token."""
+        :meth:`Subscription.subscribe`). ``market``, ``events`` and
+        ``confirm`` are control kwargs, not param tokens."""
+        path = self._path(market)
+        resolved = _resolve_params(WS_CHANNELS[path].get("param"), params, tokens)
+        conn = await self._client._conn(path)
+        return await _subscribe(conn, resolved, conn.stream(events), confirm)
+
+    async def subscribe_batches(
+        self,
+        *params: str,
+        market: str = "spot",
+        max_size: int = _BATCH_MAX_SIZE,
+        max_latency: float = _BATCH_MAX_LATENCY,
+        events: bool = False,
+        confirm: bool = False,
+        **tokens: str,
+    ) -> AsyncIterator[List[Any]]:
+        """:meth:`subscribe`, yielding lists of messages instead (see
+        :meth:`AsyncWSConnection.stream_batches`)."""
+        path = self._path(market)
+        resolved = _resolve_params(WS_CHANNELS[path].get("param"), params, tokens)
+        conn = await self._client._conn(path)
+        stream = conn.stream_batches(max_size, max_latency, events)
+        return await _subscribe(conn, resolved, stream, confirm)
+
+    async def add_handler(
+        self,
+        handler: Callable[[Any], Any],
+        *params: str,
+        market: str = "spot",
+        concurrency: int = _HANDLER_CONCURRENCY,
+        events: bool = False,
+        confirm: bool = False,
+        max_backlog: int = _HANDLER_MAX_BACKLOG,
+        **tokens: str,
+    ) -> WSHandler:
+        """SUBSCRIBE on ``market`` with a direct handler (see
+        :meth:`Subscription.add_handler`)."""
         path = self._path(market)
         resolved = _resolve_params(WS_CHANNELS[path].get("param"), params, tokens)
         conn = await self._client._conn(path)
-        stream = conn.stream()
-        await conn.subscribe(resolved)
-        return stream
+        return await _subscribe(
+            conn,
+            resolved,
+            _add_handler(conn, handler, concurrency, events, max_backlog),
+            confirm,
+        )
 
     async def unsubscribe(
-        self, *params: str, market: str = "spot", **tokens: str
+        self, *params: str, market: str = "spot", confirm: bool = False, **tokens: str
     ) -> None:
         path = self._path(market)
         resolved = _resolve_params(WS_CHANNELS[path].get("param"), params, tokens)
         conn = await self._client._conn(path)
-        await conn.unsubscribe(resolved)
+        ack = await conn.unsubscribe(resolved)
+        if confirm:
+            await ack
 
 
 class Feed:
@@ -408,9 +1283,34 @@ class Feed:
         self._client = client
         self._path = _require_channel(path)
 
-    async def stream(self) -> AsyncIterator[Dict[str, Any]]:
+    async def stream(self, events: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Return an async iterator over the feed (``events``: see
+        :meth:`Subscription.subscribe`)."""
+        conn = await self._client._conn(self._path)
+        return conn.stream(events=events)
+
+    async def stream_batches(
+        self,
+        max_size: int = _BATCH_MAX_SIZE,
+        max_latency: float = _BATCH_MAX_LATENCY,
+        events: bool = False,
+    ) -> AsyncIterator[List[Any]]:
+        """Return an async iterator over lists of feed messages (see
+        :meth:`AsyncWSConnection.stream_batches`)."""
         conn = await self._client._conn(self._path)
-        return conn.stream()
+        return conn.stream_batches(max_size, max_latency, events)
+
+    async def add_handler(
+        self,
+        handler: Callable[[Any], Any],
+        concurrency: int = _HANDLER_CONCURRENCY,
+        events: bool = False,
+        max_backlog: int = _HANDLER_MAX_BACKLOG,
+    ) -> WSHandler:
+        """Have the reader call ``handler(msg)`` for every feed message (see
+        :class:`WSHandler`)."""
+        conn = await self._client._conn(self._path)
+        return _add_handler(conn, handler, concurrency, events, max_backlog)
 
 
 class AsyncDatamaxiWS:
@@ -423,6 +1323,29 @@ class AsyncDatamaxiWS:
 
     Use as an async context manager so open connections are closed, or call
     :meth:`aclose` explicitly.
+
+    Pass ``backfill=`` an :class:`datamaxi.aio.AsyncDatamaxi` REST client to
+    refill outages on the liquidation / funding-rate / open-interest channels
+    after each reconnect (see :mod:`datamaxi.aio.ws_backfill`). The REST
+    client's lifecycle stays with the caller.
+
+    ``metrics=True`` / ``metrics_hook=`` enable per-connection throughput,
+    lag and backlog metrics (see :mod:`datamaxi.aio.ws_metrics`).
+
+    ``heartbeat=N`` pings every N seconds, tracks the round-trip time and
+    reconnects proactively when pongs stop coming (see
+    :class:`AsyncWSConnection`).
+
+    ``compression`` / ``max_size`` / ``max_queue`` / ``write_limit`` tune
+    permessage-deflate and the transport buffers (see
+    :class:`AsyncWSConnection`).
+
+    ``recorder=`` tees every raw frame to a
+    :class:`~datamaxi.aio.ws_replay.WSRecorder` file, replayable offline
+    with :class:`~datamaxi.aio.ws_replay.ReplayServer`.
+
+    ``intern_strings=True`` makes repeated exchange / symbol / market values
+    share one ``str`` object across messages (see :mod:`datamaxi._intern`).
     """
 
     def __init__(
@@ -433,13 +1356,55 @@ class AsyncDatamaxiWS:
         keepalive: float = _KEEPALIVE_INTERVAL,
         reconnect: bool = True,
         connect_kwargs: Optional[dict] = None,
+        reconnect_backoff: Optional[float] = None,
+        reconnect_backoff_max: float = _RECONNECT_BACKOFF_MAX,
+        max_reconnect_attempts: Optional[int] = None,
+        backfill: Optional["AsyncDatamaxi"] = None,
+        subscribe_batch_window: float = _SUBSCRIBE_BATCH_WINDOW,
+        max_params_per_frame: int = _MAX_PARAMS_PER_FRAME,
+        ack_timeout: Optional[float] = _ACK_TIMEOUT,
+        metrics: bool = False,
+        metrics_hook: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        metrics_interval: float = _METRICS_INTERVAL,
+        recorder: Optional["WSRecorder"] = None,
+        heartbeat: Optional[float] = None,
+        heartbeat_timeout: float = _HEARTBEAT_TIMEOUT,
+        max_missed_pongs: int = _MAX_MISSED_PONGS,
+        compression: Union[str, Dict[str, Any], None] = "deflate",
+        max_size: Optional[int] = _MAX_MESSAGE_SIZE,
+        max_queue: Optional[int] = _MAX_QUEUE,
+        write_limit: int = _WRITE_LIMIT,
+        intern_strings: InternOption = False,
     ):
         self.api_key = api_key or os.environ.get("DATAMAXI_API_KEY")
         self.ws_url = ws_url or _derive_ws_url(base_url)
-        self._keepalive = keepalive
-        self._reconnect = reconnect
-        self._connect_kwargs = connect_kwargs
+        # Per-connection options, passed to every AsyncWSConnection.
+        self._conn_options = dict(
+            keepalive=keepalive,
+            reconnect=reconnect,
+            connect_kwargs=connect_kwargs,
+            reconnect_backoff=reconnect_backoff,
+            reconnect_backoff_max=reconnect_backoff_max,
+            max_reconnect_attempts=max_reconnect_attempts,
+            subscribe_batch_window=subscribe_batch_window,
+            max_params_per_frame=max_params_per_frame,
+            ack_timeout=ack_timeout,
+            metrics=metrics,
+            metrics_hook=metrics_hook,
+            metrics_interval=metrics_interval,
+            recorder=recorder,
+            heartbeat=heartbeat,
+            heartbeat_timeout=heartbeat_timeout,
+            max_missed_pongs=max_missed_pongs,
+            compression=compression,
+            max_size=max_size,
+            max_queue=max_queue,
+            write_limit=write_limit,
+            intern_strings=intern_strings,
+        )
+        self._backfill = backfill
         self._conns: Dict[str, AsyncWSConnection] = {}
+        self._conns_lock = asyncio.Lock()
 
         self.ticker = MarketSubscription(self, "/ticker")
         self.forex = Subscription(self, "/forex")
@@ -451,20 +1416,41 @@ class AsyncDatamaxiWS:
         self.announcement = Subscription(self, "/announcement/listing")
 
     async def _conn(self, path: str) -> AsyncWSConnection:
+        conn = self._conns.get(path)
+        if conn is not None:
+            return conn
+        # Concurrent first subscribes on a path must share one connection.
+        async with self._conns_lock:
+            return await self._open_conn(path)
+
+    async def _open_conn(self, path: str) -> AsyncWSConnection:
         conn = self._conns.get(path)
         if conn is None:
             url = self.ws_url + WS_BASE_PATH + path
+            gap_filler = None
+            if self._backfill is not None and path in BACKFILL_PATHS:
+                gap_filler = RestGapFiller(self._backfill, path)
             conn = AsyncWSConnection(
-                url,
-                self.api_key,
-                keepalive=self._keepalive,
-                reconnect=self._reconnect,
-                connect_kwargs=self._connect_kwargs,
+                url, self.api_key, gap_filler=gap_filler, **self._conn_options
             )
             await conn.start()
             self._conns[path] = conn
         return conn
 
+    def ack_stats(self) -> Dict[str, Dict[str, Any]]:
+        """:meth:`AsyncWSConnection.ack_stats` for every open channel path."""
+        return {path: conn.ack_stats() for path, conn in self._conns.items()}
+
+    def heartbeat_stats(self) -> Dict[str, Dict[str, Any]]:
+        """:meth:`AsyncWSConnection.heartbeat_stats` for every open channel path."""
+        return {path: conn.heartbeat_stats() for path, conn in self._conns.items()}
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """:meth:`AsyncWSConnection.metrics` for every open channel path
+        (empty unless constructed with ``metrics=True`` or a hook)."""
+        snapshots = {path: conn.metrics() for path, conn in self._conns.items()}
+        return {path: snap for path, snap in snapshots.items() if snap is not None}
+
     async def aclose(self) -> None:
         for conn in list(self._conns.values()):
             await conn.close()
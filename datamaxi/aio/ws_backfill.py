@@ -0,0 +1,239 @@
+"""REST backfill of WebSocket outages — opt-in gap-filler for ``AsyncDatamaxiWS``.
+
+After a reconnect the WS stream resumes from "now": whatever happened while
+the socket was down is lost. With ``AsyncDatamaxiWS(backfill=rest_client)``
+(an :class:`datamaxi.aio.AsyncDatamaxi`), each reconnect on a backfillable
+channel fetches the outage window from the matching REST endpoint and
+injects the missed events into the stream, **before** live messages resume:
+
+* ``/liquidation`` -> ``liquidation(exchange, symbol)`` per subscribed param
+* ``/liquidation/feed`` -> ``liquidation.feed()``
+* ``/funding-rate`` -> ``funding_rate.latest(exchange, symbol)``
+* ``/open-interest`` -> ``open_interest(exchange, symbol)``
+
+REST rows are mapped onto the channel's wire shape (``datamaxi._ws_models``)
+so consumers see one message format. Delivery is at-least-once at the source
+and de-duplicated on the client: every message on a backfilled connection is
+keyed by exchange / symbol / token ``id`` / ``d`` (plus side and volume for
+liquidations), and a key already delivered — live before the drop, or
+backfilled and then replayed live — is dropped.
+
+Per-param requests run concurrently (at most ``concurrency`` in flight) and
+the whole fill is bounded by ``timeout`` seconds. A fill that fails or runs
+out of time injects nothing; the ``gap`` event, emitted before the fill
+starts, remains the record of the missed window.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from datamaxi.aio._client import AsyncDatamaxi
+
+_DEFAULT_LIMIT = 1000
+_DEFAULT_DEDUPE_SIZE = 10_000
+_DEFAULT_CONCURRENCY = 8
+_DEFAULT_TIMEOUT = 10.0  # seconds for the whole fill, all params together
+
+_logger = logging.getLogger(__name__)
+
+
+def _liquidation_to_wire(row: Dict[str, Any]) -> Dict[str, Any]:
+    """REST ``LiquidationEntry`` -> WS ``LiquidationMessage`` keys."""
+    return {
+        "b": row.get("base"),
+        "d": row.get("timestamp"),
+        "e": row.get("exchange"),
+        "id": row.get("tokenId"),
+        "p": row.get("price"),
+        "pusd": row.get("priceUsd"),
+        "q": row.get("quote"),
+        "s": row.get("symbol"),
+        "sd": row.get("side"),
+        "v": row.get("volume"),
+        "vusd": row.get("volumeUsd"),
+    }
+
+
+def _open_interest_to_wire(row: Dict[str, Any]) -> Dict[str, Any]:
+    """REST ``OpenInterestResponse`` -> WS ``OpenInterestMessage`` keys."""
+    return {
+        "b": row.get("base"),
+        "d": row.get("timestamp"),
+        "e": row.get("exchange"),
+        "id": row.get("tokenId"),
+        "oi": row.get("openInterest"),
+        "oiusd": row.get("openInterestUsd"),
+        "q": row.get("quote"),
+        "s": row.get("symbol"),
+    }
+
+
+def _split_param(param: str) -> Optional[tuple]:
+    """``"BTC-USDT@binance"`` -> ``("binance", "BTC-USDT")``."""
+    symbol, sep, exchange = param.partition("@")
+    if not sep or not symbol or not exchange:
+        return None
+    return exchange, symbol
+
+
+def _as_ms(value: Any) -> Optional[int]:
+    """A wire timestamp (int, or a numeric string on older endpoints) as int."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def dedupe_key(msg: Any) -> tuple:
+    """Identity of a backfillable event across the REST and WS paths."""
+    get = msg.get
+    return (get("e"), get("s"), get("id"), _as_ms(get("d")), get("sd"), get("v"))
+
+
+class RestGapFiller:
+    """Fetch one channel's outage window over REST, de-duplicated.
+
+    One instance per backfillable connection (see :data:`BACKFILL_PATHS`).
+    :meth:`seen` is called by the reader for every live message and by
+    :meth:`fill` for every REST row, so both paths share one bounded window
+    of recently delivered keys (``dedupe_size`` entries). At most
+    ``concurrency`` REST requests are in flight at once and a fill gives up
+    after ``timeout`` seconds, so a reconnect never waits on REST for longer.
+    """
+
+    def __init__(
+        self,
+        client: "AsyncDatamaxi",
+        path: str,
+        limit: int = _DEFAULT_LIMIT,
+        dedupe_size: int = _DEFAULT_DEDUPE_SIZE,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        timeout: Optional[float] = _DEFAULT_TIMEOUT,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if path not in BACKFILL_PATHS:
+            raise ValueError(
+                f"no REST backfill for WS channel {path!r}; "
+                f"supported: {sorted(BACKFILL_PATHS)}"
+            )
+        self._client = client
+        self._path = path
+        self._limit = limit
+        self._keys: set = set()
+        self._order: deque = deque()
+        self._dedupe_size = dedupe_size
+        self._concurrency = concurrency
+        self._timeout = timeout
+
+    def seen(self, msg: Any) -> bool:
+        """Record ``msg``; ``True`` if an identical event was already delivered."""
+        key = dedupe_key(msg)
+        if key in self._keys:
+            return True
+        self._keys.add(key)
+        self._order.append(key)
+        if len(self._order) > self._dedupe_size:
+            self._keys.discard(self._order.popleft())
+        return False
+
+    async def fill(self, params: List[str], start: int, end: int) -> List[Dict]:
+        """Missed events in ``[start, end]`` (UTC ms), oldest first.
+
+        REST failures and a fill exceeding ``timeout`` are logged and yield
+        no rows: a backfill problem must never take the live stream down
+        with it, nor hold it up.
+        """
+        fetch = BACKFILL_PATHS[self._path](self, params)
+        try:
+            rows = await asyncio.wait_for(fetch, self._timeout)
+        except asyncio.TimeoutError:
+            _logger.warning(
+                "WS backfill of %s timed out after %ss", self._path, self._timeout
+            )
+            return []
+        except Exception:
+            _logger.exception("WS backfill of %s failed", self._path)
+            return []
+        timed = [(_as_ms(r.get("d")), r) for r in rows]
+        timed = [(d, r) for d, r in timed if d is not None and start <= d <= end]
+        timed.sort(key=lambda pair: pair[0])
+        return [r for _, r in timed if not self.seen(r)]
+
+    async def _per_param(
+        self, params: List[str], fetch: Callable[[str, str], Awaitable[Any]]
+    ) -> List[Any]:
+        """``fetch(exchange, symbol)`` for every param, ``concurrency`` at a time.
+
+        Results come back in param order; one failing param is logged and
+        skipped rather than discarding the others.
+        """
+        limiter = asyncio.Semaphore(self._concurrency)
+
+        async def bounded(exchange: str, symbol: str) -> Any:
+            async with limiter:
+                return await fetch(exchange, symbol)
+
+        pairs = list(filter(None, map(_split_param, params)))
+        results = await asyncio.gather(
+            *(bounded(*pair) for pair in pairs), return_exceptions=True
+        )
+        out = []
+        for (exchange, symbol), result in zip(pairs, results):
+            if isinstance(result, BaseException):
+                _logger.error(
+                    "WS backfill of %s for %s@%s failed",
+                    self._path,
+                    symbol,
+                    exchange,
+                    exc_info=result,
+                )
+            else:
+                out.append(result)
+        return out
+
+    async def _liquidation(self, params: List[str]) -> List[Dict]:
+        async def fetch(exchange: str, symbol: str) -> Any:
+            return await self._client.liquidation(
+                exchange=exchange, symbol=symbol, limit=self._limit
+            )
+
+        rows: List[Dict] = []
+        for res in await self._per_param(params, fetch):
+            rows.extend(_liquidation_to_wire(r) for r in res.get("data") or [])
+        return rows
+
+    async def _liquidation_feed(self, params: List[str]) -> List[Dict]:
+        res = await self._client.liquidation.feed(limit=self._limit)
+        return [_liquidation_to_wire(r) for r in res.get("data") or []]
+
+    async def _funding_rate(self, params: List[str]) -> List[Dict]:
+        # Snapshot endpoint: the latest value is the one the outage hid.
+        async def fetch(exchange: str, symbol: str) -> Any:
+            return await self._client.funding_rate.latest(
+                exchange=exchange, symbol=symbol, pandas=False
+            )
+
+        rows = await self._per_param(params, fetch)
+        return [{k: v for k, v in row.items() if k != "p"} for row in rows]
+
+    async def _open_interest(self, params: List[str]) -> List[Dict]:
+        async def fetch(exchange: str, symbol: str) -> Any:
+            return await self._client.open_interest(exchange=exchange, symbol=symbol)
+
+        rows = await self._per_param(params, fetch)
+        return [_open_interest_to_wire(row) for row in rows]
+
+
+#: WS channel path -> REST fetcher. Only these channels can be backfilled.
+BACKFILL_PATHS: Dict[str, Callable] = {
+    "/liquidation": RestGapFiller._liquidation,
+    "/liquidation/feed": RestGapFiller._liquidation_feed,
+    "/funding-rate": RestGapFiller._funding_rate,
+    "/open-interest": RestGapFiller._open_interest,
+}
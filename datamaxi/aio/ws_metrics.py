@@ -0,0 +1,166 @@
+"""Throughput and latency instrumentation for WebSocket connections.
+
+Opt-in (``AsyncDatamaxiWS(metrics=True)`` or ``metrics_hook=...``): with it
+off, the reader does no extra work. With it on, each connection keeps a
+:class:`WSMetrics` that counts messages and payload bytes, times JSON
+decoding, samples end-to-end lag (receive time minus the message's own
+``d`` / ``timestamp``) and tracks every subscriber's backlog depth and
+high-water mark. :meth:`WSMetrics.snapshot` turns that into a plain dict;
+``metrics_hook(snapshot)`` — a function or coroutine function, e.g. a
+Prometheus / StatsD exporter — is called with one per connection every
+``metrics_interval`` seconds.
+
+Snapshot keys: ``path``, ``ts`` (UTC ms), ``messages`` / ``bytes`` (totals;
+``bytes`` is the decoded payload), ``wire_bytes`` (total read off the socket:
+compressed frames plus framing), ``compression`` (negotiated extension or
+``None``), ``msgs_per_sec`` / ``bytes_per_sec`` / ``wire_bytes_per_sec`` /
+``compression_ratio`` (payload / wire bytes) / ``decode_us`` (mean decode
+time per message) over the interval since the previous snapshot, ``lag_ms``
+(``p50`` / ``p90`` / ``p99`` / ``max`` over that interval, ``None`` when no
+message carried a timestamp), ``subscribers`` (``kind``, ``depth``, ``hwm``,
+``dropped`` per sink), ``acks`` (see ``AsyncWSConnection.ack_stats``) and
+``heartbeat`` (RTTs, see ``AsyncWSConnection.heartbeat_stats``; ``None``
+without ``heartbeat=``).
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence
+
+_LAG_SAMPLES = 4096  # lag samples kept per interval
+
+
+def _percentile(ordered: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending, non-empty sequence."""
+    rank = max(1, -(-len(ordered) * q // 100))  # ceil without float error
+    return ordered[int(rank) - 1]
+
+
+def _depth(sink: Any) -> int:
+    """Backlog of a subscriber sink (queue size, or a handler's pending)."""
+    qsize = getattr(sink, "qsize", None)
+    if qsize is not None:
+        return qsize()
+    return getattr(sink, "pending", 0)
+
+
+def _timestamp(msg: Any) -> Optional[int]:
+    get = getattr(msg, "get", None)
+    if get is None:
+        return None
+    ts = get("d")
+    if ts is None:
+        ts = get("timestamp")  # premium
+    return ts if isinstance(ts, int) else None
+
+
+def _payload_size(raw: Any) -> int:
+    """Byte length of a frame; text frames count their UTF-8 encoding
+    (``isascii`` is cached on ``str``, so ASCII frames skip the encode)."""
+    if isinstance(raw, str) and not raw.isascii():
+        return len(raw.encode())
+    return len(raw)
+
+
+class WSMetrics:
+    """Counters for one connection; fed by its reader, read via :meth:`snapshot`."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.messages = 0
+        self.bytes = 0
+        self._decode_seconds = 0.0
+        self._lags: deque = deque(maxlen=_LAG_SAMPLES)
+        self._hwm: Dict[int, int] = {}  # id(sink) -> high-water mark
+        self._prev = (time.monotonic(), 0, 0, 0.0)
+        self._prev_wire = 0
+
+    def on_message(
+        self, raw: Any, decode_seconds: float, msg: Any, recv_ms: int
+    ) -> None:
+        self.messages += 1
+        self.bytes += _payload_size(raw)
+        self._decode_seconds += decode_seconds
+        ts = _timestamp(msg)
+        if ts is not None:
+            self._lags.append(recv_ms - ts)
+
+    def on_publish(self, sinks: List[Any]) -> None:
+        hwm = self._hwm
+        for sink in sinks:
+            depth = _depth(sink)
+            if depth > hwm.get(id(sink), 0):
+                hwm[id(sink)] = depth
+
+    def snapshot(
+        self,
+        sinks: List[Any],
+        acks: Optional[Dict[str, Any]] = None,
+        now_ms: Optional[int] = None,
+        heartbeat: Optional[Dict[str, Any]] = None,
+        wire_bytes: Optional[int] = None,
+        compression: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Totals, per-interval rates and lag, and per-subscriber depths.
+
+        Starts a new interval: rates, decode time and lag percentiles cover
+        the time since the previous call.
+        """
+        now = time.monotonic()
+        prev_t, prev_msgs, prev_bytes, prev_decode = self._prev
+        elapsed = max(now - prev_t, 1e-9)
+        interval_msgs = self.messages - prev_msgs
+        self._prev = (now, self.messages, self.bytes, self._decode_seconds)
+        interval_wire = None
+        if wire_bytes is not None:
+            interval_wire = wire_bytes - self._prev_wire
+            self._prev_wire = wire_bytes
+
+        lags = sorted(self._lags)
+        self._lags.clear()
+        live = {id(sink) for sink in sinks}
+        self._hwm = {k: v for k, v in self._hwm.items() if k in live}
+        return {
+            "path": self.path,
+            "ts": now_ms if now_ms is not None else int(time.time() * 1000),
+            "messages": self.messages,
+            "bytes": self.bytes,
+            "msgs_per_sec": interval_msgs / elapsed,
+            "bytes_per_sec": (self.bytes - prev_bytes) / elapsed,
+            "wire_bytes": wire_bytes,
+            "wire_bytes_per_sec": (
+                interval_wire / elapsed if interval_wire is not None else None
+            ),
+            "compression": compression,
+            "compression_ratio": (
+                (self.bytes - prev_bytes) / interval_wire if interval_wire else None
+            ),
+            "decode_us": (
+                (self._decode_seconds - prev_decode) / interval_msgs * 1e6
+                if interval_msgs
+                else None
+            ),
+            "lag_ms": (
+                {
+                    "p50": _percentile(lags, 50),
+                    "p90": _percentile(lags, 90),
+                    "p99": _percentile(lags, 99),
+                    "max": lags[-1],
+                }
+                if lags
+                else None
+            ),
+            "subscribers": [
+                {
+                    "kind": type(sink).__name__,
+                    "depth": _depth(sink),
+                    "hwm": self._hwm.get(id(sink), 0),
+                    "dropped": getattr(sink, "dropped", 0),
+                }
+                for sink in sinks
+            ],
+            "acks": acks,
+            "heartbeat": heartbeat,
+        }
@@ -0,0 +1,190 @@
+"""Record WebSocket sessions and replay them from a local server.
+
+Realistic traffic for benchmarking and regression-testing the WS path
+offline. :class:`WSRecorder` tees every raw frame a connection receives to a
+compact text file — one ``<recv ms>\\t<channel path>\\t<frame>`` line per
+frame, gzip-compressed when the file name ends in ``.gz`` — and
+:class:`ReplayServer` serves such a recording on localhost, at the original
+pace or ``speed`` times faster (``speed=None``: as fast as possible)::
+
+    from datamaxi.aio.ws import AsyncDatamaxiWS
+    from datamaxi.aio.ws_replay import ReplayServer, WSRecorder
+
+    with WSRecorder("session.tsv.gz") as rec:
+        async with AsyncDatamaxiWS(recorder=rec) as ws:
+            ...  # live traffic is recorded as it is consumed
+
+    async with ReplayServer("session.tsv.gz", speed=10) as server:
+        async with AsyncDatamaxiWS(ws_url=server.url, reconnect=False) as ws:
+            async for msg in await ws.liquidation_feed.stream():
+                ...  # ends when the recording does
+
+The replay server acks every SUBSCRIBE / UNSUBSCRIBE and sends a channel's
+recorded frames (subscription acks excluded) once the client subscribes — or
+right away on firehose channels — regardless of the params requested. It
+requires the ``ws`` extra.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import io
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from datamaxi._ws_endpoints import WS_CHANNELS, WS_BASE_PATH
+
+
+def _open_text(path: str, mode: str) -> io.TextIOBase:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _is_ack(raw: str) -> bool:
+    try:
+        msg = json.loads(raw)
+    except ValueError:
+        return False
+    return isinstance(msg, dict) and set(msg) <= {"result", "id"}
+
+
+class WSRecorder:
+    """Append raw WS frames to a recording file (see module docstring).
+
+    Pass it as ``AsyncDatamaxiWS(recorder=...)``; every connection tees the
+    frames it receives through :meth:`record` before decoding them. Close it
+    (or use it as a context manager) to flush the file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = _open_text(path, "a")
+        self.frames = 0
+
+    def record(self, channel: str, raw: Any, recv_ms: int) -> None:
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        # JSON never has a literal newline inside a string, so only
+        # inter-token whitespace is folded: the frame still decodes the same.
+        raw = raw.replace("\n", " ")
+        self._file.write(f"{recv_ms}\t{channel}\t{raw}\n")
+        self.frames += 1
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "WSRecorder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_recording(path: str) -> Iterator[Tuple[int, str, str]]:
+    """``(recv_ms, channel_path, frame)`` for every line of a recording."""
+    with _open_text(path, "r") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line:
+                continue
+            recv_ms, channel, raw = line.split("\t", 2)
+            yield int(recv_ms), channel, raw
+
+
+class ReplayServer:
+    """Serve a :class:`WSRecorder` file as a local DataMaxi+ WS endpoint.
+
+    ``speed`` scales the recorded inter-frame gaps (``2`` = twice as fast,
+    ``None`` or ``0`` = no waiting). Each connection to
+    ``<url>/ws/v1/<channel>`` replays that channel's frames once, then the
+    server closes it (``close_at_end=False`` keeps it open, idle).
+    """
+
+    def __init__(
+        self,
+        recording: str,
+        speed: Optional[float] = 1.0,
+        host: str = "localhost",
+        port: int = 0,
+        close_at_end: bool = True,
+    ):
+        self._frames: Dict[str, List[Tuple[int, str]]] = {}
+        for recv_ms, channel, raw in read_recording(recording):
+            if not _is_ack(raw):
+                self._frames.setdefault(channel, []).append((recv_ms, raw))
+        self.speed = speed
+        self.host = host
+        self.port = port
+        self.close_at_end = close_at_end
+        self._server = None
+
+    @property
+    def channels(self) -> List[str]:
+        return sorted(self._frames)
+
+    @property
+    def url(self) -> str:
+        """Base URL for ``AsyncDatamaxiWS(ws_url=...)``."""
+        return f"ws://{self.host}:{self.port}"
+
+    async def start(self) -> "ReplayServer":
+        from datamaxi.aio.ws import _import_websockets
+
+        websockets = _import_websockets()
+        self._server = await websockets.serve(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "ReplayServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _handle(self, conn) -> None:
+        channel = conn.request.path.removeprefix(WS_BASE_PATH)
+        subscribed = asyncio.Event()
+        if not WS_CHANNELS.get(channel, {}).get("subscribe", True):
+            subscribed.set()  # firehose: no SUBSCRIBE will come
+        control = asyncio.create_task(self._ack(conn, subscribed))
+        waiting = asyncio.create_task(subscribed.wait())
+        try:
+            await asyncio.wait({waiting, control}, return_when=asyncio.FIRST_COMPLETED)
+            if not subscribed.is_set():
+                return  # client left before subscribing
+            await self._play(conn, self._frames.get(channel, []))
+            if self.close_at_end:
+                await conn.close()
+            else:
+                await control
+        finally:
+            waiting.cancel()
+            control.cancel()
+
+    async def _ack(self, conn, subscribed: asyncio.Event) -> None:
+        async for raw in conn:
+            msg = json.loads(raw)
+            if msg.get("method") in ("SUBSCRIBE", "UNSUBSCRIBE"):
+                await conn.send(json.dumps({"result": None, "id": msg.get("id")}))
+                subscribed.set()
+
+    async def _play(self, conn, frames: List[Tuple[int, str]]) -> None:
+        if not frames:
+            return
+        loop = asyncio.get_running_loop()
+        start, first_ms = loop.time(), frames[0][0]
+        for recv_ms, raw in frames:
+            if self.speed:
+                delay = start + (recv_ms - first_ms) / 1000 / self.speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await conn.send(raw)
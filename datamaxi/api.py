@@ -8,6 +8,7 @@ from .__version__ import __version__
 from datamaxi.lib.utils import cleanNoneValue
 from datamaxi.lib.utils import encoded_string
 from datamaxi._dispatch import resolve_endpoint, raise_for_error, extract_limit_usage
+from datamaxi._intern import object_hook
 
 
 class API(object):
@@ -26,6 +27,7 @@ class API(object):
         max_retries=3,
         retry_backoff=0.5,
         retry_statuses=(502, 503, 504),
+        intern_strings=False,
     ):
         """Client API constructor. `api_key` can be set
         as an environment variable `DATAMAXI_API_KEY`.
@@ -46,6 +48,10 @@ class API(object):
                 see urllib3 ``Retry(backoff_factor=...)``.
             retry_statuses (tuple): HTTP status codes treated as transient
                 and retried (GET only).
+            intern_strings (bool): Intern exchange / symbol / market / base /
+                quote values while decoding, so repeated identifiers share
+                one object (or a list of wire keys to intern instead); see
+                ``datamaxi._intern``.
         """
         self.api_key = api_key or os.environ.get("DATAMAXI_API_KEY")
         self.base_url = base_url
@@ -69,6 +75,7 @@ class API(object):
         # Metadata for the most recent successful response (see #140).
         # Populated on every call; None until the first request.
         self.last_response = None
+        self._object_hook = object_hook(intern_strings)
 
         self.session = requests.Session()
         self.session.headers.update(
@@ -165,7 +172,7 @@ class API(object):
         self._handle_exception(response)
 
         try:
-            data = response.json()
+            data = response.json(object_hook=self._object_hook)
         except ValueError:
             data = response.text
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, List, Union, TYPE_CHECKING
+from typing import Any, List, Optional, Union, TYPE_CHECKING
 from datamaxi.api import Resource
 from datamaxi.resources.responses import NaverTrendRow
+from datamaxi.resources.frames import resolve_output, to_frame
 from datamaxi.lib.utils import check_required_parameter
 from datamaxi.lib.constants import BASE_URL
 
@@ -40,7 +41,11 @@ class Naver(Resource):
         return self.request_endpoint("naver_trend_symbols")
 
     def trend(
-        self, symbol: str, pandas: bool = True
+        self,
+        symbol: str,
+        pandas: bool = True,
+        output: Optional[str] = None,
+        columns: Optional[List[str]] = None,
     ) -> Union[pd.DataFrame, List[NaverTrendRow]]:
         """Get Naver trend for given token symbol
 
@@ -51,14 +56,16 @@ class Naver(Resource):
         Args:
             symbol (str): token symbol to search for
             pandas (bool): Return data as pandas DataFrame
+            output (str): "pandas", "arrow", "polars" or "raw";
+                overrides ``pandas`` when given
+            columns (list): Only build these columns (frame outputs)
 
         Returns:
             Naver trend data as list or pandas DataFrame
         """
+        output = resolve_output(pandas, output)
         check_required_parameter(symbol, "symbol")
         res = self.request_endpoint("naver_trend", symbol=symbol)
-        if pandas:
-            import pandas as pd
-
-            return pd.DataFrame(res)
-        return res
+        if output == "raw":
+            return res
+        return to_frame(res, output, columns=columns)
@@ -0,0 +1,128 @@
+"""Shared pandas categories for low-cardinality string columns.
+
+Exchange, market, quote and base columns repeat a handful of values across
+every ticker / premium / announcement frame. Stored as ``category`` dtype
+they take one small integer per row instead of one Python string. Frames
+only concatenate as categoricals when their categories match, so every
+frame shaped with ``categorical=True`` draws its dtype from the
+process-wide :data:`CATEGORIES` registry: categories per column name,
+append-only, so a frame built earlier holds a prefix of today's categories
+and :meth:`CategoryRegistry.concat` can align it with a cheap
+``set_categories`` instead of falling back to ``object``::
+
+    from datamaxi.resources.categories import CATEGORIES
+
+    frames = [maxi.premium(categorical=True) for _ in range(10)]
+    history = CATEGORIES.concat(frames, ignore_index=True)  # still categorical
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+#: Columns :meth:`CategoryRegistry.apply` converts by default when present
+#: with string values: exchange / market / quote / base / category, and
+#: premium's source / target variants.
+DEFAULT_COLUMNS = (
+    "e",
+    "m",
+    "q",
+    "b",
+    "c",
+    "se",
+    "te",
+    "sm",
+    "tm",
+    "sq",
+    "tq",
+    "sb",
+    "tb",
+)
+
+
+class CategoryRegistry:
+    """Append-only categories per column name, shared by every frame."""
+
+    def __init__(self):
+        self._values: Dict[str, Dict[Any, None]] = {}
+        self._dtypes: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def dtype(self, column: str, values: Iterable = ()) -> pd.CategoricalDtype:
+        """The column's ``CategoricalDtype``, first adding unseen ``values``."""
+        import pandas as pd
+
+        with self._lock:
+            known = self._values.setdefault(column, {})
+            new = [
+                v
+                for v in dict.fromkeys(values)
+                if v is not None and v == v and v not in known
+            ]
+            if new or column not in self._dtypes:
+                known.update(dict.fromkeys(new))
+                self._dtypes[column] = pd.CategoricalDtype(list(known))
+            return self._dtypes[column]
+
+    def categorical(self, column: str, values: List) -> pd.Categorical:
+        import pandas as pd
+
+        return pd.Categorical(values, dtype=self.dtype(column, values))
+
+    def apply(
+        self, frame: pd.DataFrame, columns: Optional[Iterable[str]] = None
+    ) -> pd.DataFrame:
+        """Convert ``columns`` (default :data:`DEFAULT_COLUMNS`) of ``frame``
+        that hold strings to the registry's categoricals, in place."""
+        import pandas as pd
+
+        for name in DEFAULT_COLUMNS if columns is None else columns:
+            if name not in frame.columns:
+                continue
+            column = frame[name]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                continue
+            if pd.api.types.is_string_dtype(column) or column.dtype == object:
+                frame[name] = self.categorical(name, column.tolist())
+        return frame
+
+    def align(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """``frame`` with its registry-backed categoricals on today's dtype."""
+        import pandas as pd
+
+        out = frame
+        for name in frame.columns:
+            dtype = self._dtypes.get(name)
+            column = frame[name]
+            if (
+                dtype is not None
+                and isinstance(column.dtype, pd.CategoricalDtype)
+                and column.dtype != dtype
+            ):
+                if out is frame:
+                    out = frame.copy(deep=False)
+                out[name] = column.cat.set_categories(dtype.categories)
+        return out
+
+    def concat(self, frames: Iterable[pd.DataFrame], **kwargs: Any) -> pd.DataFrame:
+        """``pd.concat`` that keeps registry-backed columns categorical."""
+        import pandas as pd
+
+        return pd.concat([self.align(frame) for frame in frames], **kwargs)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._dtypes.clear()
+
+    def __repr__(self) -> str:
+        sizes = ", ".join(f"{k}={len(v)}" for k, v in self._values.items())
+        return f"CategoryRegistry({sizes})"
+
+
+#: The process-wide registry ``categorical=True`` shapes with.
+CATEGORIES = CategoryRegistry()
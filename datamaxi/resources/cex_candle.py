@@ -4,7 +4,10 @@ from typing import Any, List, Dict, Union, Optional, TYPE_CHECKING
 from datamaxi.api import Resource
 from datamaxi.lib.utils import check_required_parameter
 from datamaxi.lib.utils import check_required_parameters
-from datamaxi.resources.utils import convert_data_to_data_frame, raise_if_no_data
+from datamaxi.resources.frames import resolve_output, to_frame
+from datamaxi.resources.models import to_models
+from datamaxi.resources.schema import endpoint_schema
+from datamaxi.resources.utils import raise_if_no_data
 from datamaxi.resources.responses import CandleResponse
 from datamaxi.lib.constants import SPOT, FUTURES, INTERVAL_1D, USD, Market, Interval
 
@@ -37,6 +40,10 @@ class CexCandle(Resource):
         from_unix: Optional[str] = None,
         to_unix: Optional[str] = None,
         pandas: bool = True,
+        output: Optional[str] = None,
+        friendly_names: bool = False,
+        columns: Optional[List[str]] = None,
+        datetime_index: bool = False,
     ) -> Union[pd.DataFrame, CandleResponse]:
         """Fetch candle data
 
@@ -53,10 +60,18 @@ class CexCandle(Resource):
             from_unix (str): Start time in Unix timestamp
             to_unix (str): End time in Unix timestamp
             pandas (bool): Return data as pandas DataFrame
+            output (str): "pandas", "arrow", "polars", "model" or "raw";
+                overrides ``pandas`` when given
+            friendly_names (bool): Name the columns after the response
+                model (e.g. ``close`` for ``c``) instead of the wire keys
+            columns (list): Only build these columns (frame outputs)
+            datetime_index (bool): Index by UTC datetimes (sorted) instead
+                of the epoch-millisecond ``d`` values
 
         Returns:
             Candle data in pandas DataFrame or dict response
         """
+        output = resolve_output(pandas, output, models=True)
         check_required_parameters(
             [
                 [exchange, "exchange"],
@@ -81,10 +96,12 @@ class CexCandle(Resource):
         )
         raise_if_no_data(res)
 
-        if pandas:
-            return convert_data_to_data_frame(res["data"])
-        else:
+        if output == "raw":
             return res
+        if output == "model":
+            return to_models(res["data"], "CexCandleView")
+        schema = endpoint_schema("cex_candle", friendly_names, False, datetime_index)
+        return to_frame(res["data"], output, schema=schema, columns=columns)
 
     def exchanges(self, market: Market) -> List[str]:
         """Fetch supported exchanges for candle data.
@@ -3,7 +3,9 @@ from __future__ import annotations
 from typing import Any, List, Union, Optional, TYPE_CHECKING
 from datamaxi.api import Resource
 from datamaxi.lib.utils import check_required_parameters
-from datamaxi.resources.utils import to_indexed_dataframe
+from datamaxi.resources.frames import resolve_output, to_frame
+from datamaxi.resources.models import to_model
+from datamaxi.resources.schema import endpoint_schema
 from datamaxi.resources.responses import TickerResponse
 from datamaxi.lib.constants import SPOT, FUTURES, Market
 
@@ -31,6 +33,9 @@ class CexTicker(Resource):
         currency: Optional[str] = None,
         conversion_base: Optional[str] = None,
         pandas: bool = True,
+        output: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        categorical: bool = False,
     ) -> Union[pd.DataFrame, TickerResponse]:
         """Fetch ticker data
 
@@ -45,11 +50,16 @@ class CexTicker(Resource):
             currency (str): Price currency
             conversion_base (str): Conversion base currency
             pandas (bool): Return data as pandas DataFrame
+            output (str): "pandas", "arrow", "polars", "model" or "raw";
+                overrides ``pandas`` when given
+            columns (list): Only build these columns (frame outputs)
+            categorical (bool): Exchange, market, quote and base columns as
+                categoricals
 
         Returns:
             Ticker data in pandas DataFrame or dict response
         """
-
+        output = resolve_output(pandas, output, models=True)
         check_required_parameters(
             [
                 [exchange, "exchange"],
@@ -70,10 +80,14 @@ class CexTicker(Resource):
             conversion_base=conversion_base,
         )
 
-        if pandas:
-            return to_indexed_dataframe([res["data"]], "d")
-        else:
+        if output == "raw":
             return res
+        if output == "model":
+            return to_model(res["data"], "TickerView")
+        schema = endpoint_schema("ticker", False, True) if categorical else None
+        return to_frame(
+            [res["data"]], output, index="d", schema=schema, columns=columns
+        )
 
     def exchanges(
         self,
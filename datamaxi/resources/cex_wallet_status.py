@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, List, Union, TYPE_CHECKING
+from typing import Any, List, Optional, Union, TYPE_CHECKING
 from datamaxi.api import Resource
 from datamaxi.resources.responses import WalletStatusRow
-from datamaxi.resources.utils import to_indexed_dataframe
+from datamaxi.resources.frames import resolve_output, to_frame
 from datamaxi.lib.utils import check_required_parameters
 from datamaxi.lib.utils import check_required_parameter
 
@@ -28,6 +28,8 @@ class CexWalletStatus(Resource):
         exchange: str,
         asset: str,
         pandas: bool = True,
+        output: Optional[str] = None,
+        columns: Optional[List[str]] = None,
     ) -> Union[pd.DataFrame, List[WalletStatusRow]]:
         """Fetch transfer status data
 
@@ -39,10 +41,14 @@ class CexWalletStatus(Resource):
             exchange (str): Exchange name
             asset (str): Asset name
             pandas (bool): Return data as pandas DataFrame
+            output (str): "pandas", "arrow", "polars" or "raw";
+                overrides ``pandas`` when given
+            columns (list): Only build these columns (frame outputs)
 
         Returns:
             Wallet status data
         """
+        output = resolve_output(pandas, output)
         check_required_parameters(
             [
                 [exchange, "exchange"],
@@ -51,10 +57,9 @@ class CexWalletStatus(Resource):
         )
 
         res = self.request_endpoint("wallet_status", exchange=exchange, asset=asset)
-        if pandas:
-            return to_indexed_dataframe(res, "network")
-
-        return res
+        if output == "raw":
+            return res
+        return to_frame(res, output, index="network", columns=columns)
 
     def exchanges(self) -> List[str]:
         """Fetch supported exchanges for wallet status data.
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, List, Union, TYPE_CHECKING
+from typing import Any, List, Optional, Union, TYPE_CHECKING
 from datamaxi.api import Resource
 from datamaxi.resources.responses import ForexRow
+from datamaxi.resources.frames import resolve_output, to_frame
+from datamaxi.resources.models import to_model
 from datamaxi.lib.utils import check_required_parameter
 
 if TYPE_CHECKING:
@@ -28,6 +30,8 @@ class Forex(Resource):
         self,
         symbol: str,
         pandas: bool = True,
+        output: Optional[str] = None,
+        columns: Optional[List[str]] = None,
     ) -> Union[pd.DataFrame, ForexRow]:
         """Fetch forex data
 
@@ -38,20 +42,23 @@ class Forex(Resource):
         Args:
             symbol (str): Symbol name
             pandas (bool): Return data as pandas DataFrame
+            output (str): "pandas", "arrow", "polars", "model" or "raw";
+                overrides ``pandas`` when given
+            columns (list): Only build these columns (frame outputs)
 
         Returns:
             Forex data in pandas DataFrame
         """
+        output = resolve_output(pandas, output, models=True)
         check_required_parameter(symbol, "symbol")
 
         res = self.request_endpoint("forex", symbol=symbol)
 
-        if pandas:
-            import pandas as pd
-
-            return pd.DataFrame([res])
-        else:
+        if output == "raw":
             return res
+        if output == "model":
+            return to_model(res, "ForexResponse")
+        return to_frame([res], output, columns=columns)
 
     def symbols(self) -> List[str]:
         """Fetch supported symbols for forex data.
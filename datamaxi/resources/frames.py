@@ -0,0 +1,464 @@
+"""Pluggable frame backends behind the ``output=`` option.
+
+Every DataFrame-returning resource method shapes its decoded JSON through
+:func:`to_frame`, which hands the rows to the backend registered under the
+requested ``output``:
+
+* ``"pandas"`` — the legacy ``pandas.DataFrame`` shapes (the default).
+* ``"arrow"`` — a ``pyarrow.Table`` (``datamaxi[arrow]`` extra).
+* ``"polars"`` — a ``polars.DataFrame`` (``datamaxi[polars]`` extra).
+
+``output="raw"`` (or ``pandas=False``) skips shaping entirely, and
+``output="model"`` (``datamaxi.resources.models``) returns typed models.
+The Arrow and Polars backends build their columns straight from the rows,
+with no pandas round trip, and every backend applies the same coercion (see
+:func:`wire_columns`): columns an endpoint schema
+(``datamaxi.resources.schema``) declares get exactly that type, others are
+inferred as ``pd.to_numeric`` would. Arrow and Polars have no index, so the
+pandas index column comes first instead. Other libraries plug in via
+:func:`register_backend`. Like ``datamaxi.resources.utils`` this is a leaf
+module with deferred imports.
+"""
+
+from __future__ import annotations
+
+from math import isnan
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from datamaxi.resources.categories import CATEGORIES
+from datamaxi.resources.schema import CATEGORY, DATETIME, Schema
+from datamaxi.resources.utils import to_indexed_dataframe
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+
+
+def _import_optional(module: str, extra: str):
+    try:
+        return __import__(module)
+    except ImportError as exc:
+        raise ImportError(
+            f"output={extra!r} requires {module}. Install it with: "
+            f"pip install 'datamaxi[{extra}]'"
+        ) from exc
+
+
+def _to_number(value: Any) -> Any:
+    """``pd.to_numeric(errors="coerce")`` for one wire value (``None`` = NaN)."""
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+        try:
+            value = float(value)
+        except ValueError:
+            return None
+    elif isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return None if value != value else value  # NaN -> missing
+
+
+def _numeric_column(values: List) -> Tuple[List, type]:
+    """Coerce a column like ``pd.to_numeric``: ``int`` only if every value
+    parses as an integer, otherwise ``float`` with missing values as None."""
+    if all(type(v) is str for v in values):
+        try:  # fast path: integer strings (timestamps, counts)
+            return list(map(int, values)), int
+        except ValueError:
+            pass
+    numbers = [_to_number(v) for v in values]
+    if all(type(n) is int for n in numbers):
+        return numbers, int
+    return [None if n is None else float(n) for n in numbers], float
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    try:
+        value = float(value)  # "NaN" parses, to NaN
+    except (TypeError, ValueError):
+        return None
+    return None if value != value else value
+
+
+def _float_column(values: List) -> List[Optional[float]]:
+    try:  # fast path: every value is a number or a numeric string
+        floats = list(map(float, values))
+    except (TypeError, ValueError):
+        return [_to_float(v) for v in values]
+    if any(map(isnan, floats)):  # NaN -> missing
+        return [None if f != f else f for f in floats]
+    return floats
+
+
+def _typed_column(values: List, kind: Any) -> Tuple[List, Any]:
+    """Coerce a column to a schema ``kind`` (see ``datamaxi.resources.schema``)."""
+    if kind is float:
+        return _float_column(values), float
+    if kind is int:  # falls back to float when a value isn't integral
+        return _numeric_column(values)
+    if kind == DATETIME:  # epoch milliseconds; None stays missing
+        return _numeric_column(values)[0], DATETIME
+    if kind is str or kind == CATEGORY:
+        return _as_text(values), kind
+    return values, None
+
+
+def row_columns(rows: List, index: Optional[str] = None) -> Dict[str, List]:
+    """Decoded JSON rows as ``{key: values}`` column lists, in first-seen key
+    order with ``index`` moved first; a key missing from a row reads None."""
+    names = list(dict.fromkeys(key for row in rows for key in row))
+    if index in names:
+        names.remove(index)
+        names.insert(0, index)
+    return {name: [row.get(name) for row in rows] for name in names}
+
+
+def coerce_columns(
+    columns: Dict[str, List], schema: Optional[Schema] = None, native: Tuple = ()
+) -> Dict[str, Tuple[List, Any]]:
+    """``{name: (values, kind)}`` for raw column lists — the shared coercion.
+
+    With a ``schema`` each column is coerced straight to its declared type
+    — ``kind`` is ``int``, ``float``, ``str``, ``CATEGORY`` or ``DATETIME``
+    (epoch milliseconds, converted by the backend) — and named as
+    the schema says; keys the schema doesn't know fall back to
+    ``pd.to_numeric``-style inference (:func:`_numeric_column`) or, when the
+    schema says not to coerce them, stay as sent. Without one values are
+    untouched and ``kind`` is ``None`` (left to the backend's inference).
+    Columns of a kind in ``native`` are passed through unparsed, for a
+    backend that parses them in bulk (pandas parses numbers with numpy).
+    """
+    if schema is None:
+        return {name: (values, None) for name, values in columns.items()}
+    out = {}
+    for wire, values in columns.items():
+        kind = schema.kind(wire)
+        if kind in native:
+            out[schema.name(wire)] = (values, kind)
+        elif kind is not None:
+            out[schema.name(wire)] = _typed_column(values, kind)
+        elif schema.coerce_unknown:
+            out[wire] = _numeric_column(values)
+        else:
+            out[wire] = (values, None)
+    return out
+
+
+def wire_columns(
+    rows: List, index: Optional[str] = None, schema: Optional[Schema] = None
+) -> Dict[str, Tuple[List, Any]]:
+    """:func:`coerce_columns` of :func:`row_columns`; ``index`` defaults to
+    the schema's."""
+    if index is None and schema is not None:
+        index = schema.index
+    return coerce_columns(row_columns(rows, index), schema)
+
+
+class FrameBackend:
+    """Builds one frame type from decoded JSON rows.
+
+    Subclasses implement :meth:`build`, and may implement
+    :meth:`build_columns` for column-major input; make one available as
+    ``output="<name>"`` with :func:`register_backend`.
+    """
+
+    def build(
+        self, rows: List, index: Optional[str] = None, schema: Optional[Schema] = None
+    ):
+        """Shape ``rows`` (a list of dicts). ``index`` names the index column
+        (the first column for index-less frames); ``schema`` types and names
+        the columns (the candle / funding-history shape, indexed by ``d``)."""
+        raise NotImplementedError
+
+    def build_columns(
+        self,
+        columns: Dict[str, List],
+        index: Optional[str] = None,
+        schema: Optional[Schema] = None,
+    ):
+        """Shape equal-length ``{key: values}`` columns; by default via rows."""
+        names = list(columns)
+        rows = [dict(zip(names, values)) for values in zip(*columns.values())]
+        return self.build(rows, index=index, schema=schema)
+
+
+class PandasBackend(FrameBackend):
+    """The legacy ``pandas.DataFrame`` shapes."""
+
+    def build(self, rows, index=None, schema=None) -> pd.DataFrame:
+        import pandas as pd
+
+        if schema is None:
+            if index is not None:
+                return to_indexed_dataframe(rows, index)
+            return pd.DataFrame(rows)
+
+        index = index or schema.index
+        columns = wire_columns(rows, index, schema)
+        label = schema.name(index)
+        if schema.kind(index) == DATETIME:
+            return _sorted_by_index(_pandas_frame(columns).set_index(label))
+        columns.pop(label, None)
+        frame = _pandas_frame(columns)
+        # The index keeps the wire values, as it always has.
+        frame.index = pd.Index([row.get(index) for row in rows], name=label)
+        return frame
+
+    def build_columns(self, columns, index=None, schema=None) -> pd.DataFrame:
+        frame = _pandas_frame(coerce_columns(columns, schema, _NUMPY_PARSED))
+        if index is not None:
+            frame = frame.set_index(schema.name(index) if schema else index)
+            if schema is not None and schema.kind(index) == DATETIME:
+                frame = _sorted_by_index(frame)
+        return frame
+
+
+def _sorted_by_index(frame: pd.DataFrame) -> pd.DataFrame:
+    """``frame`` in index order, so ``frame.loc[t0:t1]`` is a binary search
+    (responses are often newest-first)."""
+    if frame.index.is_monotonic_increasing:
+        return frame
+    if frame.index.is_monotonic_decreasing:
+        return frame.iloc[::-1]
+    return frame.sort_index(kind="stable")
+
+
+# Kinds :func:`_pandas_frame` parses from the raw wire values itself.
+_NUMPY_PARSED = (float, int)
+
+
+def _float_array(values: List) -> np.ndarray:
+    """A float column as float64; numpy parses numbers, numeric strings and
+    None (-> NaN) in one pass, anything else goes through :func:`_to_float`."""
+    import numpy as np
+
+    try:
+        return np.array(values, dtype="float64")
+    except (TypeError, ValueError):
+        return np.array(_float_column(values), dtype="float64")
+
+
+def _int_array(values: List) -> np.ndarray:
+    """An int column as int64, or float64 like :func:`_numeric_column` when
+    a value is missing or not integral."""
+    import numpy as np
+
+    if set(map(type, values)) <= {str, int}:  # floats would truncate
+        try:
+            return np.array(values, dtype="int64")
+        except (ValueError, OverflowError):
+            pass
+    numbers, kind = _numeric_column(values)
+    return np.array(numbers, dtype="int64" if kind is int else "float64")
+
+
+def _pandas_frame(columns: Dict[str, Tuple[List, Any]]) -> pd.DataFrame:
+    """A DataFrame of coerced columns; ``float`` / ``int`` columns may still
+    hold wire values (see :data:`_NUMPY_PARSED`)."""
+    import numpy as np
+    import pandas as pd
+
+    arrays = {}
+    for name, (values, kind) in columns.items():
+        if kind is float:
+            arrays[name] = _float_array(values)
+        elif kind is int:
+            arrays[name] = _int_array(values)
+        elif kind == CATEGORY:
+            # Shared categories, so frames concatenate as categoricals.
+            arrays[name] = CATEGORIES.categorical(name, values)
+        elif kind == DATETIME:
+            # One vectorized parse; None -> NaT.
+            millis = np.array(values, dtype="float64")
+            arrays[name] = pd.to_datetime(millis, unit="ms", utc=True)
+        else:
+            arrays[name] = values
+    return pd.DataFrame(arrays)
+
+
+class ArrowBackend(FrameBackend):
+    """``pyarrow.Table`` built column by column from the rows."""
+
+    def build(self, rows, index=None, schema=None) -> pa.Table:
+        if index is None and schema is not None:
+            index = schema.index
+        return self.build_columns(row_columns(rows, index), index, schema)
+
+    def build_columns(self, columns, index=None, schema=None) -> pa.Table:
+        pa = _import_optional("pyarrow", "arrow")
+        types = {int: pa.int64(), float: pa.float64(), str: pa.string()}
+        arrays = {}
+        for name, (values, kind) in coerce_columns(columns, schema).items():
+            if kind == CATEGORY:
+                arrays[name] = pa.array(values, pa.string()).dictionary_encode()
+            elif kind == DATETIME:
+                millis = pa.array(values, pa.int64())
+                arrays[name] = millis.cast(pa.timestamp("ms", tz="UTC"))
+            elif kind is not None:
+                arrays[name] = pa.array(values, types[kind])
+            else:
+                try:
+                    arrays[name] = pa.array(values)
+                except (pa.ArrowInvalid, pa.ArrowTypeError):  # mixed: keep as text
+                    arrays[name] = pa.array(_as_text(values), pa.string())
+        table = pa.table(arrays)
+        label = _datetime_label(index, schema)
+        return table if label is None else table.sort_by(label)
+
+
+class PolarsBackend(FrameBackend):
+    """``polars.DataFrame`` built column by column from the rows."""
+
+    def build(self, rows, index=None, schema=None) -> pl.DataFrame:
+        if index is None and schema is not None:
+            index = schema.index
+        return self.build_columns(row_columns(rows, index), index, schema)
+
+    def build_columns(self, columns, index=None, schema=None) -> pl.DataFrame:
+        pl = _import_optional("polars", "polars")
+        types = {
+            int: pl.Int64,
+            float: pl.Float64,
+            str: pl.String,
+            CATEGORY: pl.Categorical,
+            DATETIME: pl.Datetime("ms", "UTC"),
+        }
+        series = []
+        for name, (values, kind) in coerce_columns(columns, schema).items():
+            if kind == DATETIME:
+                millis = pl.Series(name, values, dtype=pl.Int64)
+                series.append(millis.cast(types[kind]))
+                continue
+            if kind is not None:
+                series.append(pl.Series(name, values, dtype=types[kind]))
+                continue
+            try:
+                series.append(pl.Series(name, values))
+            except (TypeError, ValueError, pl.exceptions.PolarsError):
+                series.append(pl.Series(name, _as_text(values), dtype=pl.String))
+        frame = pl.DataFrame(series)
+        label = _datetime_label(index, schema)
+        return frame if label is None else frame.sort(label)
+
+
+def _datetime_label(index: Optional[str], schema: Optional[Schema]) -> Optional[str]:
+    """Column name of the index when it is built as datetimes, else None."""
+    if schema is None:
+        return None
+    index = index or schema.index
+    if index is None or schema.kind(index) != DATETIME:
+        return None
+    return schema.name(index)
+
+
+def _as_text(values: List) -> List[Optional[str]]:
+    if set(map(type, values)) <= {str, type(None)}:  # already text
+        return values
+    return [None if v is None else str(v) for v in values]
+
+
+_BACKENDS: Dict[str, FrameBackend] = {
+    "pandas": PandasBackend(),
+    "arrow": ArrowBackend(),
+    "polars": PolarsBackend(),
+}
+
+
+def register_backend(name: str, backend: FrameBackend) -> None:
+    """Make ``backend`` available as ``output=name`` on every resource."""
+    if name in ("raw", "model"):
+        raise ValueError(f"{name!r} is reserved")
+    _BACKENDS[name] = backend
+
+
+def outputs(models: bool = False) -> Tuple[str, ...]:
+    """Every accepted ``output=`` value (``models``: for a method with a
+    typed response model, see ``datamaxi.resources.models``)."""
+    return (*_BACKENDS, *(("model",) if models else ()), "raw")
+
+
+def resolve_output(pandas: bool, output: Optional[str], models: bool = False) -> str:
+    """The effective ``output=`` of a DataFrame-returning method.
+
+    ``output`` wins when given; otherwise the legacy ``pandas`` flag picks
+    ``"pandas"`` or ``"raw"`` (the decoded JSON, as with ``pandas=False``).
+    ``"model"`` is accepted only by methods passing ``models=True``.
+    """
+    if output is None:
+        return "pandas" if pandas else "raw"
+    if output not in outputs(models):
+        raise ValueError(f"output must be one of {outputs(models)}, got {output!r}")
+    return output
+
+
+def project(
+    rows: List, columns: List[str], keep: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """``rows`` reduced to ``keep`` (the index) plus ``columns``, in that
+    order; a key missing from a row reads ``None``."""
+    names = list(dict.fromkeys([keep, *columns] if keep is not None else columns))
+    return [{name: row.get(name) for name in names} for row in rows]
+
+
+def check_columns(
+    columns: List[str], rows: List, schema: Optional[Schema] = None
+) -> None:
+    """Raise ``ValueError`` for ``columns`` the frame of ``rows`` would not
+    have: neither a ``schema`` column nor a key of some row (under its
+    output name). Rows are only scanned when a name is not in the schema;
+    with nothing to compare against nothing is raised."""
+    known = set(schema.names()) if schema is not None else set()
+    if all(column in known for column in columns):
+        return
+    output_name = schema.name if schema is not None else str
+    for row in rows:
+        known.update(map(output_name, row))
+    missing = [column for column in columns if column not in known]
+    if missing and known:
+        raise ValueError(f"unknown column(s) {missing}; valid columns: {sorted(known)}")
+
+
+def to_frame(
+    rows: List,
+    output: str,
+    index: Optional[str] = None,
+    schema: Optional[Schema] = None,
+    columns: Optional[List[str]] = None,
+) -> Any:
+    """Shape list-of-dict ``rows`` with the backend registered for ``output``.
+
+    ``columns`` keeps only those columns (plus the index), so nothing else
+    is extracted or coerced. Names are the frame's column names, i.e. the
+    friendly names when ``schema`` uses them; any other name raises
+    ``ValueError`` (see :func:`check_columns`).
+    """
+    if columns is not None:
+        check_columns(columns, rows, schema)
+        if schema is not None:
+            columns = [schema.wire_key(name) for name in columns]
+        rows = project(rows, columns, index or (schema and schema.index))
+    return _BACKENDS[output].build(rows, index=index, schema=schema)
+
+
+def columns_to_frame(
+    columns: Dict[str, List],
+    output: str,
+    index: Optional[str] = None,
+    schema: Optional[Schema] = None,
+) -> Any:
+    """:func:`to_frame` for column-major input: equal-length ``{key: values}``
+    lists, e.g. flattened straight out of a nested response."""
+    return _BACKENDS[output].build_columns(columns, index=index, schema=schema)
+
+
+def to_arrow_table(
+    rows: List, index: Optional[str] = None, schema: Optional[Schema] = None
+) -> pa.Table:
+    """``to_frame(rows, "arrow", ...)``."""
+    return to_frame(rows, "arrow", index=index, schema=schema)
@@ -4,7 +4,9 @@ from typing import Any, Callable, Tuple, List, Union, Optional, TYPE_CHECKING
 from datamaxi.api import Resource
 from datamaxi.lib.utils import check_required_parameter
 from datamaxi.lib.utils import check_required_parameters
-from datamaxi.resources.utils import convert_data_to_data_frame
+from datamaxi.resources.frames import resolve_output, to_frame
+from datamaxi.resources.models import to_model, to_models
+from datamaxi.resources.schema import endpoint_schema
 from datamaxi.resources.responses import FundingHistoryResponse, LatestFundingRate
 from datamaxi.lib.constants import ASC, DESC, SortOrder
 
@@ -34,6 +36,10 @@ class FundingRate(Resource):
         toDateTime: Optional[str] = None,
         sort: SortOrder = DESC,
         pandas: bool = True,
+        output: Optional[str] = None,
+        friendly_names: bool = False,
+        columns: Optional[List[str]] = None,
+        datetime_index: bool = False,
     ) -> Union[Tuple[pd.DataFrame, Callable], Tuple[FundingHistoryResponse, Callable]]:
         """Fetch historical funding rate data
 
@@ -50,10 +56,18 @@ class FundingRate(Resource):
             toDateTime (str): End date and time (accepts format "2006-01-02 15:04:05" or "2006-01-02")
             sort (str): Sort order
             pandas (bool): Return data as pandas DataFrame
+            output (str): "pandas", "arrow", "polars", "model" or "raw";
+                overrides ``pandas`` when given
+            friendly_names (bool): Name the columns after the response
+                model (e.g. ``funding_rate`` for ``f``) instead of the wire keys
+            columns (list): Only build these columns (frame outputs)
+            datetime_index (bool): Index by UTC datetimes (sorted) instead
+                of the epoch-millisecond ``d`` values
 
         Returns:
             Historical funding rate data in pandas DataFrame and next request function
         """
+        output = resolve_output(pandas, output, models=True)
         check_required_parameters(
             [
                 [exchange, "exchange"],
@@ -96,20 +110,31 @@ class FundingRate(Resource):
                 fromDateTime,
                 toDateTime,
                 sort,
-                pandas,
+                output=output,
+                friendly_names=friendly_names,
+                datetime_index=datetime_index,
+                columns=columns,
             )
 
-        if pandas:
-            df = convert_data_to_data_frame(res["data"])
-            return df, next_request
-        else:
+        if output == "raw":
             return res, next_request
+        if output == "model":
+            return to_models(res["data"], "FundingRateHistoryView"), next_request
+        schema = endpoint_schema(
+            "funding_rate_history", friendly_names, False, datetime_index
+        )
+        return (
+            to_frame(res["data"], output, schema=schema, columns=columns),
+            next_request,
+        )
 
     def latest(
         self,
         exchange: Optional[str] = None,
         symbol: Optional[str] = None,
         pandas: bool = True,
+        output: Optional[str] = None,
+        columns: Optional[List[str]] = None,
     ) -> Union[pd.DataFrame, LatestFundingRate]:
         """Fetch latest funding rate data
 
@@ -121,22 +146,23 @@ class FundingRate(Resource):
             exchange (str): exchange name
             symbol (str): Symbol name
             pandas (bool): Return data as pandas DataFrame
+            output (str): "pandas", "arrow", "polars", "model" or "raw";
+                overrides ``pandas`` when given
+            columns (list): Only build these columns (frame outputs)
 
         Returns:
             Latest funding rate data in pandas DataFrame or dict response
         """
+        output = resolve_output(pandas, output, models=True)
         res = self.request_endpoint(
             "funding_rate_latest", exchange=exchange, symbol=symbol
         )
 
-        if pandas:
-            import pandas as pd
-
-            df = pd.DataFrame([res])
-            df = df.set_index("d")
-            return df
-        else:
+        if output == "raw":
             return res
+        if output == "model":
+            return to_model(res, "FundingRateLatestResponse")
+        return to_frame([res], output, index="d", columns=columns)
 
     def exchanges(self) -> List[str]:
         """Fetch supported exchanges for funding rate endpoints.
@@ -0,0 +1,73 @@
+"""``output="model"``: typed response models instead of frames or dicts.
+
+Rows come back as the slotted variants of the generated models in
+``datamaxi._responses`` (see ``datamaxi._response_records``), e.g.
+``CexCandleView`` with ``close`` / ``high`` / ... attributes. A row list is
+a :class:`ModelList`: ``len()`` and slicing work on the decoded rows, and a
+row's model is only built — once — when that row is read, so a 100k-row
+response costs nothing per row you never touch.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+
+class ModelList(Sequence):
+    """Read-only sequence of response models, built lazily from JSON rows."""
+
+    __slots__ = ("_rows", "_from_dict", "_built")
+
+    def __init__(
+        self, rows: List[Dict[str, Any]], from_dict: Callable[[Dict[str, Any]], Any]
+    ):
+        self._rows = rows
+        self._from_dict = from_dict
+        self._built: Optional[List[Any]] = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, i: Union[int, slice]) -> Any:
+        if isinstance(i, slice):
+            return ModelList(self._rows[i], self._from_dict)
+        built = self._built
+        if built is None:
+            built = self._built = [None] * len(self._rows)
+        item = built[i]
+        if item is None:
+            item = built[i] = self._from_dict(self._rows[i])
+        return item
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self._rows)):
+            yield self[i]
+
+    @property
+    def rows(self) -> List[Dict[str, Any]]:
+        """The decoded JSON rows (the ``output="raw"`` form)."""
+        return self._rows
+
+    def to_list(self) -> List[Any]:
+        """Every row as a model, built now."""
+        return list(self)
+
+    def __repr__(self) -> str:
+        return "ModelList({} rows)".format(len(self._rows))
+
+
+def _model(model: Union[str, type]) -> type:
+    from datamaxi._response_records import slotted
+
+    return slotted(model)
+
+
+def to_models(rows: List[Dict[str, Any]], model: str) -> ModelList:
+    """``rows`` (a response's ``data`` array) as a lazy list of ``model``."""
+    return ModelList(rows, _model(model).from_dict)
+
+
+def to_model(data: Dict[str, Any], model: str) -> Any:
+    """One response object as ``model``."""
+    return _model(model).from_dict(data)
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Union, Optional, TYPE_CHECKING
+from operator import itemgetter
+from typing import Any, Dict, List, Sequence, Union, Optional, TYPE_CHECKING
 from datamaxi.api import Resource
 from datamaxi.resources.responses import PremiumResponse
+from datamaxi.resources.frames import check_columns, columns_to_frame, resolve_output
+from datamaxi.resources.schema import endpoint_schema
+from datamaxi.resources.models import to_models
 from datamaxi.resources.utils import assemble_params, raise_if_no_data
 from datamaxi.lib.constants import Market, SortOrder
 
@@ -64,35 +68,97 @@ def build_premium_params(
     )
 
 
+_FUNDING_KEYS = ("source_annualized_funding_rate", "target_annualized_funding_rate")
+
+
+def _premium_columns(
+    data: List[Dict[str, Any]], columns: Optional[List[str]]
+) -> Dict[str, Sequence]:
+    """Flatten premium items column by column: each item's ``detail`` plus
+    its annualized funding rates (or just ``columns`` of those), into
+    per-column sequences; a field missing from an item reads None, a name
+    no item has raises ValueError."""
+    n = len(data)
+    if columns is None:
+        out = _uniform_detail_columns(data)
+        if out is None:
+            out = _detail_columns(data)
+        funding = _FUNDING_KEYS
+    else:
+        names = list(dict.fromkeys(columns))
+        details = list(map(itemgetter("detail"), data))
+        check_columns(names, details, endpoint_schema("premium"))
+        out = {name: [None] * n for name in names}
+        funding = tuple(name for name in names if name in _FUNDING_KEYS)
+        detail = [(name, out[name]) for name in names if name not in _FUNDING_KEYS]
+        for i, source in enumerate(details):
+            for name, column in detail:
+                column[i] = source.get(name)
+    for key in funding:
+        out[key] = [item.get(key) for item in data]
+    return out
+
+
+def _uniform_detail_columns(
+    data: List[Dict[str, Any]],
+) -> Optional[Dict[str, Sequence]]:
+    """The detail columns (as tuples) when every item's ``detail`` has the
+    same keys — the usual case — transposed in C with ``itemgetter`` /
+    ``zip``; None when they differ."""
+    if not data:
+        return None
+    details = list(map(itemgetter("detail"), data))
+    keys = tuple(details[0])
+    if len(keys) < 2 or set(map(len, details)) != {len(keys)}:
+        return None
+    try:
+        rows = list(map(itemgetter(*keys), details))
+    except KeyError:  # same size, different keys
+        return None
+    return dict(zip(keys, zip(*rows)))
+
+
+def _detail_columns(data: List[Dict[str, Any]]) -> Dict[str, List]:
+    """The detail columns of items with differing keys; a missing key reads
+    None."""
+    n = len(data)
+    out: Dict[str, List] = {}
+    for i, item in enumerate(data):
+        for key, value in item["detail"].items():
+            column = out.get(key)
+            if column is None:
+                column = out[key] = [None] * n
+            column[i] = value
+    return out
+
+
 def shape_premium_response(
-    res: PremiumResponse, pandas: bool
+    res: PremiumResponse,
+    pandas: bool,
+    output: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    categorical: bool = False,
 ) -> Union[pd.DataFrame, PremiumResponse]:
     """Turn a raw ``premium`` response into the DataFrame or typed dict shape.
 
     Shared by the sync and async ``Premium.__call__`` so the "no data"
     check and DataFrame construction can't drift between the two — see
-    #154.
+    #154. Items are flattened column by column (``columns`` picks fields
+    out of each item directly) and each column is parsed once to the type
+    ``PremiumDetail`` declares; ``categorical`` makes the exchange, quote,
+    market and base columns categoricals.
     """
     raise_if_no_data(res)
 
-    if not pandas:
+    output = resolve_output(pandas, output, models=True)
+    if output == "raw":
         return res
+    if output == "model":
+        return to_models(res["data"], "PremiumView")
 
-    import pandas as pd
-
-    return pd.DataFrame(
-        [
-            {
-                **item["detail"],
-                "source_annualized_funding_rate": item.get(
-                    "source_annualized_funding_rate"
-                ),
-                "target_annualized_funding_rate": item.get(
-                    "target_annualized_funding_rate"
-                ),
-            }
-            for item in res["data"]
-        ]
+    schema = endpoint_schema("premium", False, categorical)
+    return columns_to_frame(
+        _premium_columns(res["data"], columns), output, schema=schema
     )
 
 
@@ -135,6 +201,9 @@ class Premium(Resource):
         token_exclude: Optional[str] = None,
         query: Optional[str] = None,
         pandas: bool = True,
+        output: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        categorical: bool = False,
     ) -> Union[pd.DataFrame, PremiumResponse]:
         """Fetch premium data
 
@@ -165,6 +234,11 @@ class Premium(Resource):
             query (str): Search query for filtering assets
 
             pandas (bool): Return data as pandas DataFrame
+            output (str): "pandas", "arrow", "polars", "model" or "raw";
+                overrides ``pandas`` when given
+            columns (list): Only build these columns (frame outputs)
+            categorical (bool): Exchange, quote, market and base columns as
+                categoricals
 
         Returns:
             Premium data in pandas DataFrame
@@ -193,7 +267,7 @@ class Premium(Resource):
             query=query,
         )
         res = self.request_endpoint("premium", **params)
-        return shape_premium_response(res, pandas)
+        return shape_premium_response(res, pandas, output, columns, categorical)
 
     def exchanges(self) -> List[str]:
         """Fetch supported exchanges for premium data.
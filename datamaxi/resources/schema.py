@@ -0,0 +1,218 @@
+"""Per-endpoint column schemas derived from ``datamaxi._responses``.
+
+The generated response models already know each wire key's type and its
+friendly attribute name (``c`` is ``close: float``, ``d`` is
+``timestamp: int``). :func:`endpoint_schema` turns a model into a
+:class:`Schema` so the frame backends in ``datamaxi.resources.frames`` can
+build every column with its exact dtype in one pass, instead of guessing
+from the values, and optionally name the columns ``open`` / ``high`` / ...
+rather than ``o`` / ``h`` / ....
+
+The wire key of each attribute is read off the model's own ``from_dict``
+(fed a dict that answers every ``get`` with a marker naming the key), so the
+schema can never drift from the generated mapping.
+"""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+
+class _Endpoint(NamedTuple):
+    models: Tuple[str, ...]  # row models; later ones add their scalar fields
+    index: Optional[str] = None  # index wire key
+    # Whether keys no model declares are coerced like ``pd.to_numeric``
+    # (the candle / funding-history frames always were) or left as sent.
+    coerce_unknown: bool = True
+    # Low-cardinality string keys emitted as categoricals on request.
+    categories: Tuple[str, ...] = ()
+
+
+# endpoint name (``datamaxi._endpoints``) -> its frame schema
+_ENDPOINTS: Dict[str, _Endpoint] = {
+    "cex_candle": _Endpoint(("CexCandleView",), "d"),
+    "funding_rate_history": _Endpoint(("FundingRateHistoryView",), "d"),
+    # A premium row is an item's ``detail`` plus the item's funding rates.
+    "premium": _Endpoint(
+        ("PremiumDetail", "PremiumView"),
+        coerce_unknown=False,
+        categories=("se", "te", "sq", "tq", "sm", "tm", "sb", "tb"),
+    ),
+    # Untyped (values stay as sent); only the categories apply.
+    "ticker": _Endpoint((), "d", coerce_unknown=False, categories=("e", "m", "q", "b")),
+    "cex_announcements": _Endpoint(
+        (), "d", coerce_unknown=False, categories=("e", "c")
+    ),
+    "cex_token_updates": _Endpoint(
+        (), "d", coerce_unknown=False, categories=("e", "m", "q", "b")
+    ),
+}
+
+_KINDS = {"int": int, "float": float, "str": str, "bool": bool}
+
+#: ``kind`` of a column emitted as a categorical (string values).
+CATEGORY = "category"
+#: ``kind`` of the index with ``datetime_index``: UTC datetimes parsed from
+#: epoch milliseconds.
+DATETIME = "datetime"
+
+
+class Column(NamedTuple):
+    wire: str  # key in the JSON row
+    field: str  # the model's attribute (friendly) name
+    kind: Optional[type]  # int / float / str / bool; None = untyped
+
+
+class Schema:
+    """Typed columns of one endpoint's rows.
+
+    ``index`` is the wire key the pandas frame is indexed by (the first
+    column for index-less frames). With ``friendly_names`` columns are
+    named after the model attributes instead of the wire keys. With
+    ``categorical`` the ``categories`` keys come out as :data:`CATEGORY`;
+    with ``datetime_index`` the index is :data:`DATETIME` and the frame is
+    sorted by it.
+    ``coerce_unknown`` says whether keys outside the schema are inferred
+    as numbers or left untouched.
+    """
+
+    __slots__ = (
+        "columns",
+        "index",
+        "friendly_names",
+        "coerce_unknown",
+        "categories",
+        "categorical",
+        "datetime_index",
+        "_by_wire",
+        "_by_name",
+    )
+
+    def __init__(
+        self,
+        columns: Tuple[Column, ...],
+        index: Optional[str] = None,
+        friendly_names: bool = False,
+        coerce_unknown: bool = True,
+        categories: FrozenSet[str] = frozenset(),
+        categorical: bool = False,
+        datetime_index: bool = False,
+    ):
+        self.columns = columns
+        self.index = index
+        self.friendly_names = friendly_names
+        self.coerce_unknown = coerce_unknown
+        self.categories = categories
+        self.categorical = categorical
+        self.datetime_index = datetime_index
+        self._by_wire = {c.wire: c for c in columns}
+        self._by_name = {c.field if friendly_names else c.wire: c for c in columns}
+
+    def kind(self, wire: str) -> Any:
+        """The column's type, :data:`CATEGORY` / :data:`DATETIME`, or
+        ``None`` when untyped."""
+        if self.datetime_index and wire == self.index:
+            return DATETIME
+        if self.categorical and wire in self.categories:
+            return CATEGORY
+        column = self._by_wire.get(wire)
+        return None if column is None else column.kind
+
+    def name(self, wire: str) -> str:
+        """Output name of a wire key (unknown keys keep their wire name)."""
+        column = self._by_wire.get(wire)
+        if column is None or not self.friendly_names:
+            return wire
+        return column.field
+
+    def wire_key(self, name: str) -> str:
+        """Wire key of an output column name (the inverse of :meth:`name`)."""
+        column = self._by_name.get(name)
+        return name if column is None else column.wire
+
+    def names(self) -> Tuple[str, ...]:
+        """Output names of the typed columns (friendly or wire)."""
+        return tuple(self._by_name)
+
+    def replace(self, **changes: Any) -> Schema:
+        """A copy with some constructor arguments changed."""
+        args = {name: getattr(self, name) for name in _SCHEMA_ARGS}
+        args.update(changes)
+        return Schema(**args)
+
+    def __repr__(self) -> str:
+        return "Schema({})".format(
+            ", ".join(
+                f"{c.wire}->{c.field}:{getattr(c.kind, '__name__', 'any')}"
+                for c in self.columns
+            )
+        )
+
+
+_SCHEMA_ARGS = (
+    "columns",
+    "index",
+    "friendly_names",
+    "coerce_unknown",
+    "categories",
+    "categorical",
+    "datetime_index",
+)
+
+
+class _Marker(str):
+    """The value ``_KeyProbe.get`` returns: remembers which key was read."""
+
+
+class _KeyProbe(dict):
+    def get(self, key: Any, default: Any = None) -> Any:
+        return _Marker(key)
+
+
+def _kind(annotation: Any) -> Optional[type]:
+    """``int`` / ``float`` / ``str`` / ``bool`` for a (string) annotation,
+    unwrapping ``Optional[...]``; ``None`` for anything else."""
+    if isinstance(annotation, type):
+        return _KINDS.get(annotation.__name__)
+    text = str(annotation)
+    if text.startswith("Optional[") and text.endswith("]"):
+        text = text[9:-1]  # len("Optional[")
+    return _KINDS.get(text)
+
+
+def model_schema(model: type, index: Optional[str] = None) -> Schema:
+    """:class:`Schema` of a generated ``_responses`` model's scalar fields."""
+    probe = model.from_dict(_KeyProbe())
+    columns = []
+    for f in fields(model):
+        wire = getattr(probe, f.name)
+        if isinstance(wire, _Marker):  # nested models are skipped
+            columns.append(Column(str(wire), f.name, _kind(f.type)))
+    return Schema(tuple(columns), index)
+
+
+@lru_cache(maxsize=None)
+def endpoint_schema(
+    endpoint: str,
+    friendly_names: bool = False,
+    categorical: bool = False,
+    datetime_index: bool = False,
+) -> Schema:
+    """The row schema of ``endpoint`` (``KeyError`` when it has none)."""
+    from datamaxi import _responses
+
+    spec = _ENDPOINTS[endpoint]
+    columns: Tuple[Column, ...] = ()
+    for model in spec.models:
+        columns += model_schema(getattr(_responses, model)).columns
+    return Schema(
+        columns,
+        spec.index,
+        friendly_names=friendly_names,
+        coerce_unknown=spec.coerce_unknown,
+        categories=frozenset(spec.categories),
+        categorical=categorical,
+        datetime_index=datetime_index,
+    )
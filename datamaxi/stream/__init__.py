@@ -0,0 +1,15 @@
+"""Client-side aggregation of WebSocket streams.
+
+Consumers for ``datamaxi.aio.ws`` streams that keep derived state cheap to
+query while messages arrive:
+
+* :class:`RollingFrame` — columnar ring buffer with rolling DataFrame views.
+* :class:`PremiumMatrix` — latest premium per exchange pair and token, with
+  top-K queries.
+* :class:`LiquidationAggregator` — rolling long / short liquidation totals
+  per token and exchange.
+"""
+
+from datamaxi.stream.liquidation import LiquidationAggregator  # noqa: F401
+from datamaxi.stream.premium import PremiumMatrix  # noqa: F401
+from datamaxi.stream.rolling import RollingFrame  # noqa: F401
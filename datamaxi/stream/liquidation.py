@@ -0,0 +1,280 @@
+"""Rolling liquidation statistics from the ``/liquidation/feed`` WS channel.
+
+The REST ``Liquidation.stats`` / ``heatmap`` endpoints aggregate fixed
+1h / 4h / 24h windows server-side. :class:`LiquidationAggregator` keeps the
+same long / short USD totals, counts and largest events client-side, per
+token and exchange, over any windows you choose — updated as each event
+arrives::
+
+    from datamaxi.stream import LiquidationAggregator
+
+    agg = LiquidationAggregator(windows=(60, 300, 3600))
+    task = asyncio.create_task(agg.consume(await ws.liquidation_feed.stream()))
+    ...
+    agg.stats(300, token="BTC")   # last 5 minutes, every exchange
+    agg.to_pandas(60)             # one row per token / exchange
+
+A ``sell`` liquidation (``sd == "sell"``) closes a long position and counts
+as a long liquidation; ``buy`` counts as short. Each window is a queue of
+events with running sums plus a monotonic queue per side for the largest
+event, so an update is amortized O(1) per window and reading a group's
+window is O(1) after expiring its old events. Time is the events' own ``d``
+(the newest seen), not the wall clock; an event arriving late is inserted
+in ``d`` order (a bisect) so it still expires on time.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import deque
+from operator import itemgetter
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from datamaxi.aio.ws_backfill import dedupe_key
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_DEFAULT_WINDOWS = (60.0, 300.0, 3600.0)
+# Event keys remembered to drop duplicates (the feed replays recent events
+# as ``snap`` messages on every reconnect).
+_SEEN_KEYS = 10_000
+_TS = itemgetter(0)
+
+
+class _Window:
+    """Running long / short totals and maxima over one time window."""
+
+    __slots__ = (
+        "span",
+        "events",
+        "long_usd",
+        "short_usd",
+        "long_count",
+        "short_count",
+        "long_max",
+        "short_max",
+    )
+
+    def __init__(self, span_ms: float):
+        self.span = span_ms
+        self.events: deque = deque()  # (ts, usd, is_long)
+        self.long_usd = 0.0
+        self.short_usd = 0.0
+        self.long_count = 0
+        self.short_count = 0
+        # (ts, usd, msg) with usd strictly decreasing: the front is the max.
+        self.long_max: deque = deque()
+        self.short_max: deque = deque()
+
+    def add(self, ts: int, usd: float, is_long: bool, msg: Any) -> None:
+        events = self.events
+        if events and events[-1][0] > ts:  # late: keep ``ts`` order
+            events.insert(bisect_right(events, ts, key=_TS), (ts, usd, is_long))
+        else:
+            events.append((ts, usd, is_long))
+        if is_long:
+            self.long_usd += usd
+            self.long_count += 1
+            peaks = self.long_max
+        else:
+            self.short_usd += usd
+            self.short_count += 1
+            peaks = self.short_max
+        _push_peak(peaks, ts, usd, msg)
+
+    def expire(self, now: int) -> None:
+        cutoff = now - self.span
+        events = self.events
+        while events and events[0][0] < cutoff:
+            _, usd, is_long = events.popleft()
+            if is_long:
+                self.long_usd -= usd
+                self.long_count -= 1
+            else:
+                self.short_usd -= usd
+                self.short_count -= 1
+        for peaks in (self.long_max, self.short_max):
+            while peaks and peaks[0][0] < cutoff:
+                peaks.popleft()
+        if not events:  # drop float drift once the window empties
+            self.long_usd = self.short_usd = 0.0
+
+
+def _push_peak(peaks: deque, ts: int, usd: float, msg: Any) -> None:
+    """Add an event to a ``(ts, usd, msg)`` queue kept in ``ts`` order with
+    ``usd`` strictly decreasing: entries it outlasts and outweighs go, and a
+    late event outweighed by a newer entry is never the max."""
+    i = len(peaks)
+    if peaks and peaks[-1][0] > ts:
+        i = bisect_right(peaks, ts, key=_TS)
+        if i < len(peaks) and peaks[i][1] >= usd:
+            return
+    while i and peaks[i - 1][1] <= usd:
+        i -= 1
+        del peaks[i]
+    peaks.insert(i, (ts, usd, msg))
+
+
+def _largest(peaks: deque) -> Optional[Any]:
+    return peaks[0][2] if peaks else None
+
+
+class LiquidationAggregator:
+    """Rolling long / short liquidation stats per token and exchange.
+
+    ``windows`` are the window lengths in seconds to maintain (queried by
+    the same value). Feed it ``LiquidationMessage`` s via :meth:`update` /
+    :meth:`extend` / :meth:`consume`. An event repeating a recently seen
+    one — same exchange, symbol, token, time, side and volume, the key the
+    REST backfill de-duplicates on — is ignored. ``id`` alone is the token
+    id, shared by every liquidation of that token.
+    """
+
+    def __init__(self, windows: Sequence[float] = _DEFAULT_WINDOWS):
+        if not windows or any(w <= 0 for w in windows):
+            raise ValueError("windows must be a non-empty sequence of seconds > 0")
+        self.windows = tuple(sorted(set(windows)))
+        self._groups: Dict[Tuple[str, str], Dict[float, _Window]] = {}
+        self._now = 0  # ms, newest event time
+        self._seen: set = set()
+        self._seen_order: deque = deque()
+
+    def __len__(self) -> int:
+        """Number of (token, exchange) groups seen."""
+        return len(self._groups)
+
+    def _duplicate(self, key: tuple) -> bool:
+        if key in self._seen:
+            return True
+        self._seen.add(key)
+        self._seen_order.append(key)
+        if len(self._seen_order) > _SEEN_KEYS:
+            self._seen.discard(self._seen_order.popleft())
+        return False
+
+    def update(self, msg: Any) -> None:
+        """Count one liquidation event."""
+        ts = msg.get("d")
+        if ts is None or self._duplicate(dedupe_key(msg)):
+            return
+        group = (msg.get("b"), msg.get("e"))
+        windows = self._groups.get(group)
+        if windows is None:
+            windows = self._groups[group] = {w: _Window(w * 1000) for w in self.windows}
+        if ts > self._now:
+            self._now = ts
+        usd = msg.get("vusd") or 0.0
+        is_long = msg.get("sd") == "sell"
+        for window in windows.values():
+            if ts >= self._now - window.span:  # late events may miss short ones
+                window.add(ts, usd, is_long, msg)
+            window.expire(self._now)
+
+    def extend(self, msgs: Iterable[Any]) -> None:
+        for msg in msgs:
+            self.update(msg)
+
+    async def consume(self, stream: AsyncIterator[Any]) -> None:
+        """Feed every message (or batch, from ``stream_batches``) of ``stream``.
+
+        Non-message items such as :class:`datamaxi.aio.ws.WSEvent` are
+        skipped. Returns when the stream ends.
+        """
+        async for item in stream:
+            if isinstance(item, list):
+                self.extend(m for m in item if hasattr(m, "get"))
+            elif hasattr(item, "get"):
+                self.update(item)
+
+    def _window(self, group: Tuple[str, str], window: float) -> _Window:
+        try:
+            state = self._groups[group][window]
+        except KeyError:
+            raise ValueError(
+                f"window {window!r} is not maintained; windows: {self.windows}"
+            ) from None
+        state.expire(self._now)
+        return state
+
+    def stats(
+        self,
+        window: float,
+        token: Optional[str] = None,
+        exchange: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Totals over the last ``window`` seconds for the matching groups.
+
+        Returns ``long_usd`` / ``short_usd`` / ``long_count`` /
+        ``short_count`` and the ``largest_long`` / ``largest_short`` event
+        (``None`` when there is none). ``token`` matches the base asset
+        (``b``), ``exchange`` the ``e`` field; omit both for the whole market.
+        """
+        if window not in self.windows:
+            raise ValueError(
+                f"window {window!r} is not maintained; windows: {self.windows}"
+            )
+        out = {
+            "long_usd": 0.0,
+            "short_usd": 0.0,
+            "long_count": 0,
+            "short_count": 0,
+            "largest_long": None,
+            "largest_short": None,
+        }
+        long_peak = short_peak = 0.0
+        for group in self._groups:
+            if token is not None and group[0] != token:
+                continue
+            if exchange is not None and group[1] != exchange:
+                continue
+            state = self._window(group, window)
+            out["long_usd"] += state.long_usd
+            out["short_usd"] += state.short_usd
+            out["long_count"] += state.long_count
+            out["short_count"] += state.short_count
+            if state.long_max and state.long_max[0][1] > long_peak:
+                long_peak = state.long_max[0][1]
+                out["largest_long"] = _largest(state.long_max)
+            if state.short_max and state.short_max[0][1] > short_peak:
+                short_peak = state.short_max[0][1]
+                out["largest_short"] = _largest(state.short_max)
+        return out
+
+    def to_pandas(self, window: float) -> "pd.DataFrame":
+        """One row per (token, exchange) with activity in ``window``."""
+        import pandas as pd
+
+        rows: List[Dict[str, Any]] = []
+        for token, exchange in sorted(self._groups, key=str):
+            state = self._window((token, exchange), window)
+            if not state.events:
+                continue
+            rows.append(
+                {
+                    "token": token,
+                    "exchange": exchange,
+                    "long_usd": state.long_usd,
+                    "short_usd": state.short_usd,
+                    "long_count": state.long_count,
+                    "short_count": state.short_count,
+                    "largest_long_usd": state.long_max[0][1] if state.long_max else 0.0,
+                    "largest_short_usd": (
+                        state.short_max[0][1] if state.short_max else 0.0
+                    ),
+                }
+            )
+        return pd.DataFrame(rows)
+
+    def clear(self) -> None:
+        self._groups.clear()
+        self._seen.clear()
+        self._seen_order.clear()
+        self._now = 0
+
+    def __repr__(self) -> str:
+        return "LiquidationAggregator(windows={}, groups={})".format(
+            self.windows, len(self._groups)
+        )
@@ -0,0 +1,289 @@
+"""Live premium matrix maintained from the ``/premium`` WS channel.
+
+Rebuilding an arbitrage view from REST ``Premium`` pages every few seconds
+re-downloads every pair. :class:`PremiumMatrix` instead keeps the latest
+message per pair — source exchange × target exchange × token, plus the
+quote / market legs of the 7-token ``/premium`` param — and overwrites it in
+place as updates arrive. A premium-ordered index serves unfiltered top-K
+queries from its ends, and secondary indexes by token and by exchange route
+keep filtered ones proportional to the matching pairs only::
+
+    from datamaxi.stream import PremiumMatrix
+
+    matrix = PremiumMatrix(max_age=30)
+    stream = await ws.premium.subscribe(*params)
+    task = asyncio.create_task(matrix.consume(stream))
+    ...
+    best = matrix.top(10)                      # widest premiums right now
+    krw = matrix.top(5, target="upbit", by_abs=True)
+    grid = matrix.matrix("bitcoin")            # source × target DataFrame
+"""
+
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left, insort
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Set
+from typing import Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Message fields making up a pair's identity, in ``/premium`` param order
+# (src:tgt:tokenId:srcQuote:tgtQuote:srcMkt:tgtMkt).
+_KEY_FIELDS = (
+    "source_exchange",
+    "target_exchange",
+    "token_id",
+    "source_quote",
+    "target_quote",
+    "source_market",
+    "target_market",
+)
+_TIME_FIELD = "timestamp"
+
+
+def pair_key(msg: Any) -> str:
+    """A premium message's pair key: its ``key`` field, else the param form."""
+    key = msg.get("key")
+    if key:
+        return key
+    return ":".join(str(msg.get(f) or "") for f in _KEY_FIELDS)
+
+
+def _widest(ranked: List[Tuple[float, str]]) -> Iterator[Tuple[float, str]]:
+    """Entries of an ascending ``(premium, key)`` list, largest ``|premium|``
+    first: merged from both ends inwards."""
+    lo, hi = 0, len(ranked) - 1
+    while lo <= hi:
+        if -ranked[lo][0] > ranked[hi][0]:
+            yield ranked[lo]
+            lo += 1
+        else:
+            yield ranked[hi]
+            hi -= 1
+
+
+def _narrowest(ranked: List[Tuple[float, str]]) -> Iterator[Tuple[float, str]]:
+    """Entries of an ascending ``(premium, key)`` list, smallest ``|premium|``
+    first: merged from zero outwards."""
+    hi = bisect_left(ranked, (0.0,))
+    lo, n = hi - 1, len(ranked)
+    while lo >= 0 or hi < n:
+        if hi >= n or (lo >= 0 and -ranked[lo][0] < ranked[hi][0]):
+            yield ranked[lo]
+            lo -= 1
+        else:
+            yield ranked[hi]
+            hi += 1
+
+
+class PremiumMatrix:
+    """Latest premium per pair, kept ranked for top-K queries.
+
+    Feed it ``/premium`` messages through :meth:`update` / :meth:`extend` /
+    :meth:`consume`.
+    ``max_age`` (seconds) hides pairs whose last update is older than that,
+    measured back from the newest ``timestamp`` seen; they stay stored and
+    reappear when updated. Pairs without a numeric premium (``None`` /
+    NaN) are stored but never ranked.
+    """
+
+    def __init__(self, max_age: Optional[float] = None):
+        self.max_age = max_age
+        self._entries: Dict[str, Any] = {}
+        self._by_token: Dict[str, Set[str]] = {}
+        self._by_route: Dict[Tuple[str, str], Set[str]] = {}
+        # (premium, key) ascending, and each ranked key's entry in it
+        self._ranked: List[Tuple[float, str]] = []
+        self._rank: Dict[str, Tuple[float, str]] = {}
+        self._newest = 0  # ms
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: str) -> Any:
+        """Latest message for a pair key (``KeyError`` when never seen)."""
+        return self._entries[key]
+
+    def update(self, msg: Any) -> None:
+        """Store one premium message, replacing the pair's previous one.
+
+        Re-ranking is a bisect plus a list insert / delete: O(log n)
+        comparisons and an O(n) pointer move done in C.
+        """
+        key = pair_key(msg)
+        if key not in self._entries:
+            token = msg.get("token_id")
+            route = (msg.get("source_exchange"), msg.get("target_exchange"))
+            self._by_token.setdefault(token, set()).add(key)
+            self._by_route.setdefault(route, set()).add(key)
+        self._entries[key] = msg
+        self._rerank(key, msg.get("premium"))
+        ts = msg.get(_TIME_FIELD)
+        if ts is not None and ts > self._newest:
+            self._newest = ts
+
+    def _rerank(self, key: str, premium: Any) -> None:
+        ranked = self._ranked
+        old = self._rank.pop(key, None)
+        if old is not None:
+            if old[0] == premium:
+                self._rank[key] = old
+                return
+            del ranked[bisect_left(ranked, old)]
+        if premium is not None and premium == premium:  # not NaN
+            entry = self._rank[key] = (premium, key)
+            insort(ranked, entry)
+
+    def extend(self, msgs: Iterable[Any]) -> None:
+        for msg in msgs:
+            self.update(msg)
+
+    async def consume(self, stream: AsyncIterator[Any]) -> None:
+        """Feed every message (or batch, from ``subscribe_batches``) of ``stream``.
+
+        Non-message items such as :class:`datamaxi.aio.ws.WSEvent` are
+        skipped. Returns when the stream ends.
+        """
+        async for item in stream:
+            if isinstance(item, list):
+                self.extend(m for m in item if hasattr(m, "get"))
+            elif hasattr(item, "get"):
+                self.update(item)
+
+    def _candidates(
+        self, source: Optional[str], target: Optional[str], token: Optional[str]
+    ) -> Iterable[str]:
+        """Keys that can match the filters, from the narrowest index."""
+        pools = []
+        if token is not None:
+            pools.append(self._by_token.get(token, set()))
+        if source is not None and target is not None:
+            pools.append(self._by_route.get((source, target), set()))
+        if not pools:
+            return self._entries
+        return min(pools, key=len)
+
+    def select(
+        self,
+        source: Optional[str] = None,
+        target: Optional[str] = None,
+        token: Optional[str] = None,
+    ) -> List[Any]:
+        """Current (non-stale) messages matching every given filter."""
+        cutoff = None
+        if self.max_age is not None:
+            cutoff = self._newest - self.max_age * 1000
+        out = []
+        entries = self._entries
+        for key in self._candidates(source, target, token):
+            msg = entries[key]
+            if source is not None and msg.get("source_exchange") != source:
+                continue
+            if target is not None and msg.get("target_exchange") != target:
+                continue
+            if token is not None and msg.get("token_id") != token:
+                continue
+            if cutoff is not None and (msg.get(_TIME_FIELD) or 0) < cutoff:
+                continue
+            premium = msg.get("premium")
+            if premium is None or premium != premium:
+                continue
+            out.append(msg)
+        return out
+
+    def top(
+        self,
+        k: int = 10,
+        source: Optional[str] = None,
+        target: Optional[str] = None,
+        token: Optional[str] = None,
+        by_abs: bool = False,
+        ascending: bool = False,
+    ) -> List[Any]:
+        """The ``k`` pairs with the highest premium (``ascending``: lowest).
+
+        ``by_abs`` ranks by ``|premium|`` so reverse arbitrage (negative
+        premium) competes too. Filters as in :meth:`select`. Without
+        filters the ranked index is read from its ends: O(k), plus any
+        stale pairs skipped on the way. With filters the token / route
+        index narrows the candidates, which are then ranked in
+        O(m log k) for m matching pairs.
+        """
+        if source is None and target is None and token is None:
+            return self._top_ranked(k, by_abs, ascending)
+        msgs = self.select(source, target, token)
+        if by_abs:
+            rank = lambda m: abs(m.get("premium"))  # noqa: E731
+        else:
+            rank = lambda m: m.get("premium")  # noqa: E731
+        pick = heapq.nsmallest if ascending else heapq.nlargest
+        return pick(k, msgs, key=rank)
+
+    def _top_ranked(self, k: int, by_abs: bool, ascending: bool) -> List[Any]:
+        ranked = self._ranked
+        if by_abs:
+            order = _narrowest(ranked) if ascending else _widest(ranked)
+        else:
+            order = iter(ranked) if ascending else reversed(ranked)
+        cutoff = None
+        if self.max_age is not None:
+            cutoff = self._newest - self.max_age * 1000
+        out: List[Any] = []
+        entries = self._entries
+        for _, key in order:
+            if len(out) >= k:
+                break
+            msg = entries[key]
+            if cutoff is None or (msg.get(_TIME_FIELD) or 0) >= cutoff:
+                out.append(msg)
+        return out
+
+    @property
+    def tokens(self) -> List[str]:
+        return sorted(t for t in self._by_token if t is not None)
+
+    @property
+    def routes(self) -> List[Tuple[str, str]]:
+        """``(source_exchange, target_exchange)`` pairs seen so far."""
+        return sorted(r for r in self._by_route if None not in r)
+
+    def to_pandas(self, **filters: Optional[str]) -> "pd.DataFrame":
+        """Matching messages (see :meth:`select`) as a long DataFrame."""
+        import pandas as pd
+
+        return pd.DataFrame([dict(m.items()) for m in self.select(**filters)])
+
+    def matrix(self, token: str) -> "pd.DataFrame":
+        """Source × target premium grid for one token.
+
+        Where a route has several quote / market legs the widest premium
+        wins; routes never seen read NaN.
+        """
+        import pandas as pd
+
+        grid: Dict[str, Dict[str, float]] = {}
+        for msg in self.select(token=token):
+            row = grid.setdefault(msg.get("source_exchange"), {})
+            target, premium = msg.get("target_exchange"), msg.get("premium")
+            if target not in row or premium > row[target]:
+                row[target] = premium
+        frame = pd.DataFrame.from_dict(grid, orient="index")
+        return frame.sort_index().sort_index(axis=1)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_token.clear()
+        self._by_route.clear()
+        self._ranked.clear()
+        self._rank.clear()
+        self._newest = 0
+
+    def __repr__(self) -> str:
+        return "PremiumMatrix(pairs={}, tokens={})".format(
+            len(self._entries), len(self._by_token)
+        )
@@ -0,0 +1,193 @@
+"""Columnar ring buffer for WS messages, with rolling DataFrame views.
+
+Appending WS dicts to a DataFrame (or rebuilding one from a growing list)
+costs O(n) per refresh. :class:`RollingFrame` instead writes each message's
+fields into preallocated NumPy columns — one per field of the channel's
+generated ``datamaxi._ws_models`` message — overwriting the oldest row once
+``capacity`` is reached. Views are cut on demand, by count (``last=N``) or by
+time (``window=`` seconds of the wire ``d`` timestamp)::
+
+    from datamaxi.stream import RollingFrame
+
+    frame = RollingFrame("/liquidation/feed", capacity=100_000, window=300)
+    stream = await ws.liquidation_feed.stream_batches()
+    task = asyncio.create_task(frame.consume(stream))
+    ...
+    df = frame.to_pandas()  # last 5 minutes, oldest first
+
+Column dtypes follow the model annotations: ``float`` -> ``float64`` (missing
+reads NaN), ``int`` -> ``int64`` (missing reads 0), anything else -> object
+(missing reads ``None``).
+"""
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence
+from typing import TYPE_CHECKING
+
+import datamaxi._ws_models as _ws_models
+from datamaxi._ws_endpoints import WS_CHANNELS
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+_DEFAULT_CAPACITY = 10_000
+_TIME_FIELD = "d"
+
+
+def _message_fields(channel: str) -> Dict[str, type]:
+    """``{wire key: annotated type}`` for a WS path or a message model name."""
+    message = WS_CHANNELS[channel]["message"] if channel in WS_CHANNELS else channel
+    model = getattr(_ws_models, message, None)
+    if model is None or not hasattr(model, "__annotations__"):
+        raise ValueError(
+            f"unknown WS channel or message model {channel!r}; channels: "
+            f"{sorted(WS_CHANNELS)}"
+        )
+    return dict(model.__annotations__)
+
+
+def _column_spec(annotation: Any) -> tuple:
+    """``(numpy dtype, missing value)`` for a model annotation."""
+    # Annotations are strings under ``from __future__ import annotations``.
+    name = getattr(annotation, "__name__", annotation)
+    if name == "float":
+        return "float64", float("nan")
+    if name == "int":
+        return "int64", 0
+    return object, None
+
+
+class RollingFrame:
+    """Fixed-capacity, column-wise store of one WS channel's messages.
+
+    ``channel`` is a WS path (``"/ticker/spot"``) or a ``_ws_models`` message
+    name (``"TickerMessage"``). ``fields`` restricts the stored columns
+    (default: every model field). ``window`` is the default time window in
+    seconds for :meth:`arrays` / :meth:`to_pandas`, measured back from the
+    newest message's ``d``; ``None`` returns everything retained.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        capacity: int = _DEFAULT_CAPACITY,
+        window: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+    ):
+        import numpy as np
+
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        schema = _message_fields(channel)
+        if fields is not None:
+            unknown = [f for f in fields if f not in schema]
+            if unknown:
+                raise ValueError(
+                    f"unknown field(s) {unknown} for {channel!r}; "
+                    f"valid: {sorted(schema)}"
+                )
+            schema = {f: schema[f] for f in fields}
+        self.channel = channel
+        self.capacity = capacity
+        self.window = window
+        self._missing: Dict[str, Any] = {}
+        self._columns: Dict[str, "np.ndarray"] = {}
+        for name, annotation in schema.items():
+            dtype, missing = _column_spec(annotation)
+            self._missing[name] = missing
+            self._columns[name] = np.full(capacity, missing, dtype=dtype)
+        self._head = 0  # next write position
+        self._count = 0
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, msg: Any) -> None:
+        """Store one message."""
+        i = self._head
+        get = msg.get
+        for name, column in self._columns.items():
+            value = get(name)
+            column[i] = self._missing[name] if value is None else value
+        self._head = (i + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def extend(self, msgs: Iterable[Any]) -> None:
+        """Store many messages with one vectorized write per column."""
+        import numpy as np
+
+        msgs = list(msgs)
+        overflow = len(msgs) - self.capacity
+        if overflow > 0:  # only the newest `capacity` rows survive anyway
+            del msgs[:overflow]
+        n = len(msgs)
+        if not n:
+            return
+        positions = (self._head + np.arange(n)) % self.capacity
+        for name, column in self._columns.items():
+            missing = self._missing[name]
+            values = [m.get(name) for m in msgs]
+            column[positions] = [missing if v is None else v for v in values]
+        self._head = (self._head + n) % self.capacity
+        self._count = min(self._count + n, self.capacity)
+
+    async def consume(self, stream: AsyncIterator[Any]) -> None:
+        """Feed every message (or batch, from ``stream_batches``) of ``stream``.
+
+        Non-message items such as :class:`datamaxi.aio.ws.WSEvent` are
+        skipped. Returns when the stream ends.
+        """
+        async for item in stream:
+            if isinstance(item, list):
+                self.extend(m for m in item if hasattr(m, "get"))
+            elif hasattr(item, "get"):
+                self.append(item)
+
+    def _order(self) -> "np.ndarray":
+        """Buffer positions of the retained rows, oldest first."""
+        import numpy as np
+
+        start = (self._head - self._count) % self.capacity
+        return (start + np.arange(self._count)) % self.capacity
+
+    def arrays(
+        self, window: Optional[float] = None, last: Optional[int] = None
+    ) -> Dict[str, "np.ndarray"]:
+        """Retained rows as ``{field: array}``, oldest first (copies).
+
+        ``last`` keeps the newest N rows; ``window`` (default: the
+        constructor's) keeps rows whose ``d`` lies within that many seconds of
+        the newest row's.
+        """
+        idx = self._order()
+        if last is not None:
+            keep = min(max(last, 0), len(idx))
+            idx = idx[-keep:] if keep else idx[:0]
+        window = self.window if window is None else window
+        if window is not None and len(idx) and _TIME_FIELD in self._columns:
+            ts = self._columns[_TIME_FIELD][idx]
+            idx = idx[ts >= ts.max() - window * 1000]
+        return {name: column[idx] for name, column in self._columns.items()}
+
+    def to_pandas(
+        self, window: Optional[float] = None, last: Optional[int] = None
+    ) -> "pd.DataFrame":
+        """:meth:`arrays` as a DataFrame, one column per stored field."""
+        import pandas as pd
+
+        return pd.DataFrame(self.arrays(window=window, last=last), copy=False)
+
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+
+    def __repr__(self) -> str:
+        return "RollingFrame(channel={!r}, rows={}, capacity={})".format(
+            self.channel, self._count, self.capacity
+        )
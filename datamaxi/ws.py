@@ -0,0 +1,405 @@
+"""Synchronous WebSocket client for every DataMaxi+ WS data type.
+
+Runs the async machinery of :mod:`datamaxi.aio.ws` on one background event
+loop thread and hands messages to the caller's threads through bounded,
+thread-safe queues — the connection's reader puts straight into them, so
+there is no per-message hop back onto the loop. Requires the ``ws`` extra::
+
+    pip install "datamaxi[ws]"
+
+Usage::
+
+    from datamaxi.ws import DatamaxiWS
+
+    with DatamaxiWS(api_key="...") as ws:
+        # blocking iterator ...
+        for msg in ws.ticker.subscribe("BTC-USDT@binance", market="spot"):
+            print(msg["s"], msg["p"])
+
+        # ... or a callback run on a dispatcher thread
+        handle = ws.forex.subscribe("USD-KRW", callback=print)
+        ...
+        handle.close()
+
+Accessors and keyword options mirror :class:`~datamaxi.aio.ws.AsyncDatamaxiWS`
+(which every constructor option is passed to).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import queue
+import threading
+from typing import Any, Callable, Coroutine, List, Optional
+
+from datamaxi._ws_endpoints import WS_CHANNELS
+from datamaxi.aio.ws import (
+    _CLOSED,
+    AsyncDatamaxiWS,
+    AsyncWSConnection,
+    _resolve_params,
+)
+
+_DEFAULT_MAXSIZE = 10_000
+# Seconds to wait for loop-side work (connect + subscribe ack) to finish.
+_CALL_TIMEOUT = 30.0
+
+_logger = logging.getLogger(__name__)
+
+
+class _ThreadSink(queue.Queue):
+    """Bounded thread-safe queue that drops its oldest item when full.
+
+    The connection reader calls :meth:`put_nowait` on the loop thread and
+    must never block, so a slow consumer loses the oldest messages rather
+    than stalling the stream; losses are counted in ``dropped``. Once the
+    ``_CLOSED`` sentinel is queued later items are ignored, so making room
+    can never evict it and leave the consumer blocked.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize)
+        self.dropped = 0
+        self._closed = False
+
+    def put_nowait(self, item: Any) -> None:
+        with self.not_full:
+            if self._closed:
+                return
+            if item is _CLOSED:
+                self._closed = True
+            if 0 < self.maxsize <= self._qsize():
+                self._get()
+                self.dropped += 1
+                if self.dropped == 1:
+                    _logger.warning(
+                        "WS consumer is falling behind; dropping oldest messages"
+                    )
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+
+class WSStream:
+    """A blocking subscriber stream (iterate it, or :meth:`get` with timeout).
+
+    Yields messages — and :class:`~datamaxi.aio.ws.WSEvent` s when opened
+    with ``events=True`` — until the connection closes or :meth:`close` is
+    called. ``maxsize`` bounds the buffered backlog (oldest dropped first,
+    counted in :attr:`dropped`).
+    """
+
+    def __init__(self, client: "DatamaxiWS", conn: AsyncWSConnection, sink):
+        self._client = client
+        self._conn = conn
+        self._sink = sink
+        self._done = False
+
+    @property
+    def dropped(self) -> int:
+        """Messages discarded because the consumer fell behind."""
+        return self._sink.dropped
+
+    def qsize(self) -> int:
+        return self._sink.qsize()
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Next item; ``queue.Empty`` on timeout, ``StopIteration`` at the end."""
+        if self._done:
+            raise StopIteration
+        item = self._sink.get(timeout=timeout)
+        if item is _CLOSED:
+            self._done = True
+            raise StopIteration
+        return item
+
+    def get_batch(self, max_size: int = 1000, timeout: Optional[float] = None) -> List:
+        """Block for one item, then take whatever else is queued (<= max_size).
+
+        Returns ``[]`` once the stream has ended; ``queue.Empty`` on timeout.
+        """
+        try:
+            batch = [self.get(timeout)]
+        except StopIteration:
+            return []
+        while len(batch) < max_size:
+            try:
+                item = self._sink.get_nowait()
+            except queue.Empty:
+                break
+            if item is _CLOSED:
+                self._done = True
+                break
+            batch.append(item)
+        return batch
+
+    def __iter__(self) -> "WSStream":
+        return self
+
+    def __next__(self) -> Any:
+        return self.get()
+
+    def close(self) -> None:
+        """Detach from the connection and end the iteration."""
+        if not self._client._closed:
+            self._client._loop.call_soon_threadsafe(self._conn.remove_sink, self._sink)
+        self._sink.put_nowait(_CLOSED)
+
+    def __enter__(self) -> "WSStream":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class WSCallback:
+    """A callback subscription: ``callback(msg)`` runs on a dispatcher thread.
+
+    Exceptions raised by the callback are logged and do not stop dispatch.
+    """
+
+    def __init__(self, stream: WSStream, callback: Callable[[Any], Any]):
+        self.stream = stream
+        self._callback = callback
+        self._thread = threading.Thread(
+            target=self._run, name="datamaxi-ws-callback", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        for item in self.stream:
+            try:
+                self._callback(item)
+            except Exception:
+                _logger.exception("WS callback %r failed", self._callback)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop dispatching and wait for the in-flight callback to return."""
+        self.stream.close()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+
+
+class _SyncAccessor:
+    def __init__(self, client: "DatamaxiWS", accessor: Any):
+        self._client = client
+        self._accessor = accessor
+
+    def _open(
+        self,
+        path: str,
+        params: Optional[List[str]],
+        events: bool,
+        confirm: bool,
+        maxsize: int,
+        callback: Optional[Callable[[Any], Any]],
+    ):
+        sink = _ThreadSink(maxsize)
+
+        async def go() -> AsyncWSConnection:
+            conn = await self._client._async._conn(path)
+            conn.add_sink(sink, events)  # before SUBSCRIBE: no missed msgs
+            try:
+                if params is not None:
+                    ack = await conn.subscribe(params)
+                    if confirm:
+                        await ack
+            except BaseException:
+                conn.remove_sink(sink)
+                raise
+            return conn
+
+        try:
+            conn = self._client._call(go())
+        except BaseException:
+            # go() may have attached the sink before being cancelled (or
+            # finished just after the timeout): detach it on the loop thread.
+            if not self._client._closed:
+                self._client._loop.call_soon_threadsafe(self._drop_sink, path, sink)
+            raise
+        stream = WSStream(self._client, conn, sink)
+        if callback is not None:
+            return WSCallback(stream, callback)
+        return stream
+
+    def _drop_sink(self, path: str, sink: _ThreadSink) -> None:
+        conn = self._client._async._conns.get(path)
+        if conn is not None:
+            conn.remove_sink(sink)
+
+    def _unsubscribe(self, path: str, params: List[str], confirm: bool) -> None:
+        async def go() -> None:
+            conn = await self._client._async._conn(path)
+            ack = await conn.unsubscribe(params)
+            if confirm:
+                await ack
+
+        self._client._call(go())
+
+
+class SyncSubscription(_SyncAccessor):
+    """Blocking counterpart of :class:`~datamaxi.aio.ws.Subscription`."""
+
+    @property
+    def param_format(self) -> Optional[str]:
+        return self._accessor.param_format
+
+    def subscribe(
+        self,
+        *params: str,
+        events: bool = False,
+        confirm: bool = False,
+        maxsize: int = _DEFAULT_MAXSIZE,
+        callback: Optional[Callable[[Any], Any]] = None,
+        **tokens: str,
+    ):
+        """SUBSCRIBE and return a :class:`WSStream` (or, with ``callback``, a
+        :class:`WSCallback`). ``params`` / ``tokens`` / ``events`` /
+        ``confirm`` as in :meth:`datamaxi.aio.ws.Subscription.subscribe`."""
+        resolved = _resolve_params(self.param_format, params, tokens)
+        return self._open(
+            self._accessor._path, resolved, events, confirm, maxsize, callback
+        )
+
+    def unsubscribe(self, *params: str, confirm: bool = False, **tokens: str) -> None:
+        resolved = _resolve_params(self.param_format, params, tokens)
+        self._unsubscribe(self._accessor._path, resolved, confirm)
+
+
+class SyncMarketSubscription(_SyncAccessor):
+    """Blocking counterpart of :class:`~datamaxi.aio.ws.MarketSubscription`."""
+
+    def subscribe(
+        self,
+        *params: str,
+        market: str = "spot",
+        events: bool = False,
+        confirm: bool = False,
+        maxsize: int = _DEFAULT_MAXSIZE,
+        callback: Optional[Callable[[Any], Any]] = None,
+        **tokens: str,
+    ):
+        """SUBSCRIBE on ``market``; see :meth:`SyncSubscription.subscribe`."""
+        path = self._accessor._path(market)
+        resolved = _resolve_params(WS_CHANNELS[path].get("param"), params, tokens)
+        return self._open(path, resolved, events, confirm, maxsize, callback)
+
+    def unsubscribe(
+        self, *params: str, market: str = "spot", confirm: bool = False, **tokens: str
+    ) -> None:
+        path = self._accessor._path(market)
+        resolved = _resolve_params(WS_CHANNELS[path].get("param"), params, tokens)
+        self._unsubscribe(path, resolved, confirm)
+
+
+class SyncFeed(_SyncAccessor):
+    """Blocking counterpart of :class:`~datamaxi.aio.ws.Feed`."""
+
+    def stream(
+        self,
+        events: bool = False,
+        maxsize: int = _DEFAULT_MAXSIZE,
+        callback: Optional[Callable[[Any], Any]] = None,
+    ):
+        """Return a :class:`WSStream` over the feed (or a :class:`WSCallback`)."""
+        return self._open(self._accessor._path, None, events, False, maxsize, callback)
+
+
+class DatamaxiWS:
+    """Synchronous WebSocket entrypoint — every DataMaxi+ WS data type.
+
+    Starts a daemon thread running an event loop that owns an
+    :class:`~datamaxi.aio.ws.AsyncDatamaxiWS` (all keyword options are passed
+    through). Accessors mirror the async client; ``subscribe()`` blocks until
+    the SUBSCRIBE is sent (or acked, with ``confirm=True``) and returns a
+    blocking :class:`WSStream`, or a :class:`WSCallback` when ``callback=`` is
+    given. Use as a context manager, or call :meth:`close`.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, **options: Any):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="datamaxi-ws-loop", daemon=True
+        )
+        self._thread.start()
+        self._closed = False
+        self._async = AsyncDatamaxiWS(api_key=api_key, **options)
+
+        self.ticker = SyncMarketSubscription(self, self._async.ticker)
+        self.forex = SyncSubscription(self, self._async.forex)
+        self.premium = SyncSubscription(self, self._async.premium)
+        self.funding_rate = SyncSubscription(self, self._async.funding_rate)
+        self.open_interest = SyncSubscription(self, self._async.open_interest)
+        self.liquidation = SyncSubscription(self, self._async.liquidation)
+        self.liquidation_feed = SyncFeed(self, self._async.liquidation_feed)
+        self.announcement = SyncSubscription(self, self._async.announcement)
+
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._async.api_key
+
+    @property
+    def ws_url(self) -> str:
+        return self._async.ws_url
+
+    def _call(self, coro: Coroutine, timeout: Optional[float] = _CALL_TIMEOUT):
+        """Run ``coro`` on the loop thread and block for its result; on
+        timeout ``coro`` is cancelled rather than left running."""
+        if self._closed:
+            coro.close()
+            raise RuntimeError("DatamaxiWS is closed")
+        fut = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return fut.result(timeout)
+        except concurrent.futures.TimeoutError:
+            fut.cancel()
+            raise
+
+    def ack_stats(self):
+        """See :meth:`datamaxi.aio.ws.AsyncDatamaxiWS.ack_stats`."""
+
+        async def stats():  # read on the loop thread that mutates them
+            return self._async.ack_stats()
+
+        return self._call(stats())
+
+    def heartbeat_stats(self):
+        """See :meth:`datamaxi.aio.ws.AsyncDatamaxiWS.heartbeat_stats`."""
+
+        async def stats():
+            return self._async.heartbeat_stats()
+
+        return self._call(stats())
+
+    def metrics(self):
+        """See :meth:`datamaxi.aio.ws.AsyncDatamaxiWS.metrics`."""
+
+        async def snapshot():
+            return self._async.metrics()
+
+        return self._call(snapshot())
+
+    def close(self) -> None:
+        """Close every connection (ending all streams) and stop the loop thread."""
+        if self._closed:
+            return
+        try:
+            self._call(self._async.aclose())
+        finally:
+            self._closed = True
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def __enter__(self) -> "DatamaxiWS":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return "DatamaxiWS(ws_url={!r}, has_key={})".format(
+            self.ws_url, bool(self.api_key)
+        )
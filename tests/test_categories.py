@@ -0,0 +1,62 @@
+"""Tests for the shared categorical registry and categorical frames (no network)."""
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from datamaxi.resources.categories import CategoryRegistry  # noqa: E402
+from datamaxi.resources.frames import to_frame  # noqa: E402
+from datamaxi.resources.schema import endpoint_schema  # noqa: E402
+
+
+def test_registry_categories_are_append_only():
+    registry = CategoryRegistry()
+    first = registry.dtype("e", ["binance", "okx", "binance", None])
+    assert list(first.categories) == ["binance", "okx"]
+    assert registry.dtype("e") is first  # nothing new, same dtype
+    second = registry.dtype("e", ["upbit", "okx"])
+    assert list(second.categories) == ["binance", "okx", "upbit"]
+
+
+def test_registry_concat_keeps_categoricals():
+    registry = CategoryRegistry()
+    a = registry.apply(pd.DataFrame({"e": ["binance"], "p": [1.0]}))
+    b = registry.apply(pd.DataFrame({"e": ["okx"], "p": [2.0]}))
+    assert a["e"].dtype != b["e"].dtype
+    assert pd.concat([a, b])["e"].dtype != "category"
+    merged = registry.concat([a, b], ignore_index=True)
+    assert merged["e"].dtype == registry.dtype("e")
+    assert merged["e"].tolist() == ["binance", "okx"]
+    assert merged["p"].dtype == "float64"
+
+
+def test_registry_apply_skips_numeric_and_missing_columns():
+    registry = CategoryRegistry()
+    frame = registry.apply(pd.DataFrame({"c": [1.5], "x": ["a"]}), ["c", "x", "m"])
+    assert frame["c"].dtype == "float64"
+    assert frame["x"].dtype == "category"
+
+
+def test_announcement_and_token_update_schemas_categorize():
+    rows = [{"d": "1", "e": "binance", "c": "listing", "u": "https://a"}]
+    news = endpoint_schema("cex_announcements", False, True)
+    df = to_frame(rows, "pandas", schema=news)
+    assert df.index.name == "d"
+    assert df["e"].dtype == "category" and df["c"].dtype == "category"
+    assert df["u"].dtype != "category"
+    plain = to_frame(rows, "pandas", schema=endpoint_schema("cex_announcements"))
+    assert plain["e"].dtype != "category"
+    updates = endpoint_schema("cex_token_updates", False, True)
+    df = to_frame(
+        [{"d": "1", "b": "BTC", "q": "USDT", "t": "x"}], "pandas", schema=updates
+    )
+    assert df["b"].dtype == "category" and df["t"].dtype != "category"
+
+
+def test_ticker_schema_only_categorizes():
+    rows = [{"d": "1", "e": "binance", "m": "spot", "q": "USDT", "p": "1.0"}]
+    schema = endpoint_schema("ticker", False, True)
+    df = to_frame(rows, "pandas", index="d", schema=schema)
+    assert df.index.tolist() == ["1"]
+    assert df["e"].dtype == "category" and df["q"].dtype == "category"
+    assert df["p"].tolist() == ["1.0"]  # values otherwise as sent
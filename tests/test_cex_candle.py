@@ -31,6 +31,29 @@ def test_candle_returns_dataframe():
     assert len(df) == 1
 
 
+@mock_http_response(responses.GET, "/api/v1/cex/candle", _CANDLE)
+def test_candle_output_raw_and_arrow():
+    client = _client()
+    raw = client(exchange="binance", market="spot", symbol="BTC-USDT", output="raw")
+    assert raw == _CANDLE
+    pytest.importorskip("pyarrow")
+    table = client(exchange="binance", market="spot", symbol="BTC-USDT", output="arrow")
+    assert table.column_names[0] == "d" and table.num_rows == 1
+    assert table.column("c").to_pylist() == [105.0]
+
+
+@mock_http_response(responses.GET, "/api/v1/cex/candle", _CANDLE)
+def test_candle_typed_columns_and_friendly_names():
+    client = _client()
+    df = client(exchange="binance", market="spot", symbol="BTC-USDT")
+    assert (df.dtypes == "float64").all()  # "100" is still a price
+    df = client(
+        exchange="binance", market="spot", symbol="BTC-USDT", friendly_names=True
+    )
+    assert df.index.name == "timestamp"
+    assert list(df.columns) == ["open", "high", "low", "close"]
+
+
 @responses.activate
 def test_candle_sends_query_params():
     responses.add(
@@ -81,3 +81,8 @@ def test_wallet_status_client_error():
 def test_wallet_status_server_error():
     with pytest.raises(ServerError):
         _client()(exchange="binance", asset="BTC")
+
+
+def test_wallet_status_has_no_model_output():
+    with pytest.raises(ValueError):
+        _client()(exchange="binance", asset="BTC", output="model")
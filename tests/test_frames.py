@@ -0,0 +1,157 @@
+"""Frame backends behind ``output=`` (``datamaxi.resources.frames``)."""
+
+import pandas as pd
+import pytest
+
+from datamaxi.resources.frames import (
+    FrameBackend,
+    _BACKENDS,
+    outputs,
+    project,
+    register_backend,
+    resolve_output,
+    to_arrow_table,
+    to_frame,
+    wire_columns,
+)
+from datamaxi.resources.schema import endpoint_schema
+
+CANDLE = endpoint_schema("cex_candle")
+CANDLES = [
+    {"d": "1700000000000", "o": "100", "c": "105.5", "v": "NaN"},
+    {"d": "1700000060000", "o": "101", "c": "bogus", "v": "7"},
+]
+
+
+def test_resolve_output_falls_back_to_the_pandas_flag():
+    assert resolve_output(True, None) == "pandas"
+    assert resolve_output(False, None) == "raw"
+    assert resolve_output(True, "polars") == "polars"  # output wins
+    assert set(outputs()) >= {"pandas", "arrow", "polars", "raw"}
+    with pytest.raises(ValueError):
+        resolve_output(True, "excel")
+
+
+def test_to_frame_pandas_shapes():
+    rows = [{"d": "1", "c": "1.5"}, {"d": "2", "c": "NaN"}]
+    df = to_frame(rows, "pandas", schema=CANDLE)
+    assert df.index.name == "d" and list(df.index) == ["1", "2"]  # wire values
+    assert df["c"].dtype == "float64"
+    assert to_frame(rows, "pandas", index="d").index.name == "d"
+    assert list(to_frame(rows, "pandas").columns) == ["d", "c"]
+
+
+def test_wire_columns_follow_the_schema():
+    cols = wire_columns(CANDLES, schema=CANDLE)
+    assert list(cols) == ["d", "o", "c", "v"]
+    assert cols["d"] == ([1700000000000, 1700000060000], int)
+    assert cols["o"] == ([100.0, 101.0], float)  # float per the model
+    assert cols["c"] == ([105.5, None], float)
+    assert cols["v"] == ([None, 7.0], float)
+    drifted = wire_columns([{"d": "1", "x": "3"}], schema=CANDLE)
+    assert drifted["x"] == ([3], int)  # unknown key: pd.to_numeric-style
+    assert wire_columns([{"a": "1"}]) == {"a": (["1"], None)}
+
+
+def test_friendly_names():
+    friendly = endpoint_schema("cex_candle", friendly_names=True)
+    df = to_frame(CANDLES, "pandas", schema=friendly)
+    assert df.index.name == "timestamp"
+    assert list(df.columns) == ["open", "close", "volume"]
+
+
+def test_arrow_backend_types_columns():
+    pa = pytest.importorskip("pyarrow")
+    table = to_arrow_table(CANDLES, schema=CANDLE)
+    assert table.column_names == ["d", "o", "c", "v"]  # index first
+    assert table.schema.field("d").type == pa.int64()
+    assert table.schema.field("o").type == pa.float64()
+    assert table.column("c").to_pylist() == [105.5, None]
+    mixed = to_frame([{"x": 1, "s": "a"}, {"x": "b", "s": "c"}], "arrow")
+    assert mixed.schema.field("x").type == pa.string()
+
+
+def test_polars_backend_matches_pandas():
+    pl = pytest.importorskip("polars")
+    frame = to_frame(CANDLES, "polars", schema=CANDLE)
+    assert isinstance(frame, pl.DataFrame)
+    assert frame.columns == ["d", "o", "c", "v"]
+    assert frame.schema["d"] == pl.Int64 and frame.schema["o"] == pl.Float64
+    legacy = to_frame(CANDLES, "pandas", schema=CANDLE)
+    pd.testing.assert_frame_equal(
+        frame.drop("d").to_pandas(), legacy.reset_index(drop=True)
+    )
+    mixed = to_frame([{"x": 1}, {"x": "b"}], "polars")
+    assert mixed.schema["x"] == pl.String
+
+
+def test_columns_projection():
+    df = to_frame(CANDLES, "pandas", schema=CANDLE, columns=["c"])
+    assert df.index.name == "d" and list(df.columns) == ["c"]
+    friendly = endpoint_schema("cex_candle", True)
+    assert list(to_frame(CANDLES, "pandas", schema=friendly, columns=["close"])) == [
+        "close"
+    ]
+    with pytest.raises(ValueError, match=r"\['zz'\].*'close'"):
+        to_frame(CANDLES, "pandas", schema=friendly, columns=["close", "zz"])
+    with pytest.raises(ValueError, match="'c'"):  # the wire name, not "close"
+        to_frame(CANDLES, "pandas", schema=friendly, columns=["c"])
+    with pytest.raises(ValueError, match="'a', 'b'"):
+        to_frame([{"a": 1, "b": 2}], "pandas", columns=["B"])
+    assert project([{"a": 1, "b": 2}], ["b"], keep="a") == [{"a": 1, "b": 2}]
+    assert list(to_frame([{"a": 1, "b": 2}], "pandas", columns=["b"])) == ["b"]
+
+
+def test_datetime_index_is_sorted_utc():
+    timed = endpoint_schema("cex_candle", False, False, True)
+    newest_first = CANDLES[::-1]
+    df = to_frame(newest_first, "pandas", schema=timed)
+    assert isinstance(df.index, pd.DatetimeIndex) and str(df.index.tz) == "UTC"
+    assert df.index.is_monotonic_increasing and df.index.name == "d"
+    assert df.index[0] == pd.Timestamp(1700000000000, unit="ms", tz="UTC")
+    assert df["o"].tolist() == [100.0, 101.0]
+    window = df.loc["2023-11-14 22:14":"2023-11-14 22:15"]
+    assert window["o"].tolist() == [101.0]
+    friendly = endpoint_schema("cex_candle", True, False, True)
+    df = to_frame(newest_first, "pandas", schema=friendly, columns=["close"])
+    assert df.index.name == "timestamp" and list(df.columns) == ["close"]
+
+
+def test_datetime_index_sorts_unordered_rows():
+    timed = endpoint_schema("funding_rate_history", False, False, True)
+    rows = [
+        {"d": "1700000060000", "f": "2"},
+        {"d": "1700000120000", "f": "3"},
+        {"d": "1700000000000", "f": "1"},
+    ]
+    df = to_frame(rows, "pandas", schema=timed)
+    assert isinstance(df.index, pd.DatetimeIndex) and str(df.index.tz) == "UTC"
+    assert df.index.name == "d" and df["f"].tolist() == [1.0, 2.0, 3.0]
+    assert to_frame(rows, "pandas", schema=CANDLE).index[0] == "1700000060000"
+
+
+def test_datetime_index_other_backends():
+    pa = pytest.importorskip("pyarrow")
+    pl = pytest.importorskip("polars")
+    timed = endpoint_schema("cex_candle", False, False, True)
+    table = to_frame(CANDLES[::-1], "arrow", schema=timed)
+    assert table.schema.field("d").type == pa.timestamp("ms", tz="UTC")
+    assert table.column("o").to_pylist() == [100.0, 101.0]
+    frame = to_frame(CANDLES[::-1], "polars", schema=timed)
+    assert frame.schema["d"] == pl.Datetime("ms", "UTC")
+    assert frame["o"].to_list() == [100.0, 101.0]
+
+
+def test_register_backend():
+    class Records(FrameBackend):
+        def build(self, rows, index=None, schema=None):
+            return list(rows)
+
+    register_backend("records", Records())
+    try:
+        assert resolve_output(True, "records") == "records"
+        assert to_frame([{"a": 1}], "records") == [{"a": 1}]
+    finally:
+        del _BACKENDS["records"]
+    with pytest.raises(ValueError):
+        register_backend("raw", Records())
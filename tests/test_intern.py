@@ -0,0 +1,69 @@
+"""Opt-in string interning in the REST and WS decode paths (no network)."""
+
+import asyncio
+import json
+
+import pytest
+import responses
+
+from datamaxi._intern import interning_hook, object_hook
+from datamaxi.api import API
+
+BASE_URL = "https://api.datamaxiplus.com"
+_ROWS = {
+    "data": [
+        {"e": "binance", "s": "BTC-USDT", "p": "105.5"},
+        {"e": "binance", "s": "BTC-USDT", "p": "105.5"},
+    ]
+}
+
+
+def test_interning_hook_only_touches_identifier_keys():
+    rows = json.loads(json.dumps(_ROWS), object_hook=interning_hook())["data"]
+    assert rows[0]["e"] is rows[1]["e"] and rows[0]["s"] is rows[1]["s"]
+    assert rows == _ROWS["data"]
+    custom = json.loads(json.dumps(_ROWS), object_hook=interning_hook(["p"]))
+    assert custom["data"][0]["p"] is custom["data"][1]["p"]
+    assert object_hook(False) is None and object_hook(None) is None
+    nested = json.loads(
+        '{"detail": {"se": "upbit"}, "se": 1}', object_hook=object_hook(True)
+    )
+    assert nested["se"] == 1 and nested["detail"]["se"] == "upbit"
+
+
+@responses.activate
+def test_api_send_request_interns_across_responses():
+    responses.add(responses.GET, BASE_URL + "/x", json=_ROWS)
+    api = API(api_key="k", base_url=BASE_URL, intern_strings=True)
+    first = api.send_request("GET", "/x")["data"]
+    second = api.send_request("GET", "/x")["data"]
+    assert first[0]["e"] is second[1]["e"]
+    assert first == _ROWS["data"]
+    assert API(api_key="k", base_url=BASE_URL)._object_hook is None
+
+
+def test_async_api_interns():
+    httpx = pytest.importorskip("httpx")
+    from datamaxi.aio._core import AsyncAPI
+
+    async def run():
+        api = AsyncAPI(
+            api_key="k",
+            base_url=BASE_URL,
+            transport=httpx.MockTransport(lambda r: httpx.Response(200, json=_ROWS)),
+            intern_strings=True,
+        )
+        async with api:
+            return await api.send_request("GET", "/x")
+
+    rows = asyncio.run(run())["data"]
+    assert rows[0]["s"] is rows[1]["s"]
+
+
+def test_ws_connection_decodes_with_interning():
+    from datamaxi.aio.ws import AsyncWSConnection
+
+    raw = json.dumps({"e": "binance", "s": "BTC-USDT", "p": "1"})
+    conn = AsyncWSConnection("wss://x/ws/ticker", "k", intern_strings=True)
+    a, b = conn._decode(raw), conn._decode(raw)
+    assert a["s"] is b["s"] and a["e"] == "binance"
@@ -6,7 +6,8 @@ import pandas as pd
 import pytest
 from urllib.parse import urlparse, parse_qs
 
-from datamaxi.resources.premium import Premium
+from datamaxi.resources.categories import CATEGORIES
+from datamaxi.resources.premium import Premium, shape_premium_response
 from datamaxi.error import ClientError, ServerError
 from tests.util import mock_http_response
 
@@ -47,6 +48,47 @@ def test_premium_call_pandas_false_returns_raw():
     assert res["data"][0]["detail"]["asset"] == "BTC"
 
 
+@mock_http_response(responses.GET, "/api/v1/premium", _RESPONSE)
+def test_premium_call_columns():
+    df = _client()(columns=["pdp", "target_annualized_funding_rate"])
+    assert list(df.columns) == ["pdp", "target_annualized_funding_rate"]
+    assert df.iloc[0]["target_annualized_funding_rate"] == 0.2
+    with pytest.raises(ValueError, match="pdpp"):
+        _client()(columns=["pdpp"])
+
+
+def test_shape_premium_response_types_columns():
+    res = {
+        "data": [
+            {"detail": {"se": "upbit", "te": "binance", "pdp": "1.5", "d": "17"}},
+            {
+                "detail": {"se": "upbit", "pdp": "NaN", "x": "keep"},
+                "source_annualized_funding_rate": "0.1",
+            },
+        ]
+    }
+    df = shape_premium_response(res, True)
+    assert list(df.columns[:5]) == ["se", "te", "pdp", "d", "x"]
+    assert df["pdp"].dtype == "float64" and pd.isna(df["pdp"][1])
+    assert df["d"].dtype == "float64"  # integral, with one missing
+    assert pd.isna(df["x"][0]) and df["x"][1] == "keep"  # unknown keys as sent
+    assert df["se"].dtype != "category"
+    assert df["source_annualized_funding_rate"].tolist()[1] == 0.1
+    df = shape_premium_response(res, True, categorical=True)
+    assert df["se"].dtype == "category" and df["te"].dtype == "category"
+    # Categories come from the shared registry, a superset across calls.
+    assert df["se"].dtype == CATEGORIES.dtype("se")
+    assert "upbit" in df["se"].cat.categories
+
+
+@mock_http_response(responses.GET, "/api/v1/premium", _RESPONSE)
+def test_premium_call_model_output():
+    rows = _client()(output="model")
+    assert len(rows) == 1
+    assert rows[0].detail.pdp == "1.5"
+    assert rows[0].source_annualized_funding_rate == "0.1"
+
+
 @responses.activate
 def test_premium_call_param_name_translation():
     responses.add(
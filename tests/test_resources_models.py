@@ -0,0 +1,40 @@
+"""``output="model"`` (``datamaxi.resources.models``)."""
+
+import pytest
+
+from datamaxi.resources.frames import resolve_output
+from datamaxi.resources.models import ModelList, to_model, to_models
+
+_ROWS = [{"d": 1700000000000 + i, "c": float(i)} for i in range(5)]
+
+
+def test_model_list_builds_rows_on_access():
+    built = []
+
+    def from_dict(row):
+        built.append(row["d"])
+        return row["c"]
+
+    models = ModelList(_ROWS, from_dict)
+    assert len(models) == 5 and built == []
+    tail = models[3:]
+    assert isinstance(tail, ModelList) and len(tail) == 2 and built == []
+    assert models[-1] == 4.0 and models[-1] == 4.0
+    assert built == [1700000000004]  # built once, then cached
+    assert list(tail) == [3.0, 4.0]
+    assert models.rows is _ROWS
+
+
+def test_to_models_and_to_model():
+    candles = to_models(_ROWS, "CexCandleView")
+    assert type(candles[0]).__name__ == "CexCandleView"
+    assert [c.close for c in candles[1:3]] == [1.0, 2.0]
+    assert candles[0].timestamp == 1700000000000
+    forex = to_model({"d": 1, "r": 1350.5, "s": "USD-KRW"}, "ForexResponse")
+    assert forex.symbol == "USD-KRW"
+
+
+def test_model_output_is_opt_in_per_method():
+    assert resolve_output(True, "model", models=True) == "model"
+    with pytest.raises(ValueError):
+        resolve_output(True, "model")
@@ -0,0 +1,96 @@
+"""Slotted variants of the generated REST response models."""
+
+import dataclasses
+
+import pytest
+
+from datamaxi import _responses
+from datamaxi._response_records import RESPONSE_RECORDS, slotted
+
+_CANDLE = {"d": 1700000000000, "o": 1.0, "h": 2.0, "l": 0.5, "c": 1.5, "v": 9.0}
+
+
+def test_every_generated_model_has_a_slotted_variant():
+    generated = {
+        name
+        for name, obj in vars(_responses).items()
+        if dataclasses.is_dataclass(obj) and obj.__module__ == _responses.__name__
+    }
+    for name in generated:
+        cls, original = slotted(name), getattr(_responses, name)
+        assert [f.name for f in dataclasses.fields(cls)] == [
+            f.name for f in dataclasses.fields(original)
+        ]
+    assert set(RESPONSE_RECORDS) == generated
+    with pytest.raises(KeyError):
+        slotted("_as_model")
+
+
+def test_from_dict_matches_the_generated_model():
+    cls = slotted("CexCandleView")
+    assert cls is slotted(_responses.CexCandleView)
+    for row in (_CANDLE, {"c": "NaN"}, {}):
+        rec = cls.from_dict(row)
+        assert dataclasses.asdict(rec) == dataclasses.asdict(
+            _responses.CexCandleView.from_dict(row)
+        )
+    rec = cls.from_dict(_CANDLE)
+    assert not hasattr(rec, "__dict__")
+    with pytest.raises(AttributeError):
+        rec.extra = 1
+    assert rec == cls(
+        close=1.5, timestamp=1700000000000, high=2.0, low=0.5, open=1.0, volume=9.0
+    )
+    assert [r.close for r in cls.from_list([_CANDLE, _CANDLE])] == [1.5, 1.5]
+
+
+def test_nested_models_are_slotted_too():
+    cls = slotted("CexAnnouncementsResponse")
+    res = cls.from_dict({"data": [{"title": "x"}, "bogus"], "total": 1})
+    assert len(res.data) == 1
+    assert type(res.data[0]) is slotted("CexAnnouncementsView")
+    assert res.category == [] and cls.from_dict({}).category is not res.category
+    stats = slotted("LiquidationStatsResponse").from_dict({"biggest": None})
+    assert stats.biggest is None
+
+
+def test_falls_back_to_generated_models_without_source(monkeypatch):
+    from datamaxi import _response_records
+    from datamaxi.resources.models import to_model
+
+    def no_source(obj):
+        raise OSError("could not get source code")
+
+    monkeypatch.setattr(_response_records.inspect, "getsource", no_source)
+    monkeypatch.setattr(_response_records, "RESPONSE_RECORDS", {})
+    monkeypatch.delattr(_responses.CexCandleView, "from_list", raising=False)
+    _response_records._from_dict_defs.cache_clear()
+    try:
+        cls = slotted("CexCandleView")
+        assert cls is _responses.CexCandleView
+        assert to_model(_CANDLE, "CexCandleView").close == 1.5
+        assert [r.close for r in cls.from_list([_CANDLE, _CANDLE])] == [1.5, 1.5]
+    finally:
+        _response_records._from_dict_defs.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        '"""Only a docstring."""',
+        "row = dict(data)\n    return cls(close=row.get('c'))",
+        "return cls(close=data.get('c'))",  # fields missing
+    ],
+)
+def test_unexpected_generated_from_dict_raises_clearly(monkeypatch, body):
+    from datamaxi import _response_records
+
+    source = "class CexCandleView:\n  def from_dict(cls, data):\n    {}\n".format(body)
+    monkeypatch.setattr(_response_records.inspect, "getsource", lambda m: source)
+    monkeypatch.setattr(_response_records, "RESPONSE_RECORDS", {})
+    _response_records._from_dict_defs.cache_clear()
+    try:
+        with pytest.raises(ValueError, match="CexCandleView.from_dict"):
+            slotted("CexCandleView")
+    finally:
+        _response_records._from_dict_defs.cache_clear()
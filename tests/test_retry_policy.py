@@ -15,6 +15,7 @@ from datamaxi._retry import (
     parse_retry_after,
     get_backoff_time,
     get_retry_delay,
+    get_reconnect_delay,
 )
 
 httpx = pytest.importorskip("httpx")
@@ -74,6 +75,24 @@ def test_get_retry_delay_falls_back_to_backoff():
     assert get_retry_delay(3, 0.5, {}) == 2.0
 
 
+def test_get_reconnect_delay_exponential_without_jitter():
+    # Unlike the REST policy, the first reconnect already waits.
+    assert get_reconnect_delay(1, 1.0, 30.0, jitter=False) == 1.0
+    assert get_reconnect_delay(2, 1.0, 30.0, jitter=False) == 2.0
+    assert get_reconnect_delay(4, 1.0, 30.0, jitter=False) == 8.0
+
+
+def test_get_reconnect_delay_caps_and_never_overflows():
+    assert get_reconnect_delay(6, 1.0, 30.0, jitter=False) == 30.0
+    assert get_reconnect_delay(10_000, 1.0, 30.0, jitter=False) == 30.0
+
+
+def test_get_reconnect_delay_jitter_stays_within_half_to_full_backoff():
+    delays = {get_reconnect_delay(3, 1.0, 30.0) for _ in range(50)}
+    assert all(2.0 <= d <= 4.0 for d in delays)
+    assert len(delays) > 1  # spread out, not lockstep
+
+
 # --- async transport wiring ---------------------------------------------------
 def _run(coro):
     return asyncio.run(coro)
@@ -0,0 +1,36 @@
+"""Endpoint schemas derived from the generated ``_responses`` models."""
+
+import pytest
+
+from datamaxi._responses import CexCandleView, LiquidationStatsResponse
+from datamaxi.resources.schema import Column, endpoint_schema, model_schema
+
+
+def test_candle_schema_comes_from_the_model():
+    schema = endpoint_schema("cex_candle")
+    assert schema.index == "d"
+    assert set(schema.columns) == {
+        Column("c", "close", float),
+        Column("d", "timestamp", int),
+        Column("h", "high", float),
+        Column("l", "low", float),
+        Column("o", "open", float),
+        Column("v", "volume", float),
+    }
+    assert schema.name("c") == "c" and schema.name("zz") == "zz"
+    assert model_schema(CexCandleView).index is None
+
+
+def test_friendly_names_and_optional_fields():
+    schema = endpoint_schema("funding_rate_history", True)
+    assert schema.name("d") == "timestamp"
+    assert schema.name("f") == "funding_rate"
+    assert schema.kind("f") is float  # Optional[float]
+    assert endpoint_schema("funding_rate_history", True) is schema  # cached
+
+
+def test_nested_models_are_skipped():
+    fields = {c.field for c in model_schema(LiquidationStatsResponse).columns}
+    assert fields and "biggest" not in fields
+    with pytest.raises(KeyError):
+        endpoint_schema("forex")
@@ -0,0 +1,100 @@
+"""Rolling liquidation aggregation (``datamaxi.stream.LiquidationAggregator``)."""
+
+import asyncio
+
+import pytest
+
+from datamaxi.stream import LiquidationAggregator
+
+
+def _liq(d, vusd, sd="sell", b="BTC", e="binance", **extra):
+    return {"d": d, "vusd": vusd, "sd": sd, "b": b, "e": e, **extra}
+
+
+def test_sell_counts_as_long_and_buy_as_short():
+    agg = LiquidationAggregator(windows=[60])
+    agg.extend([_liq(0, 100.0), _liq(1, 50.0, sd="buy"), _liq(2, 30.0)])
+    stats = agg.stats(60)
+    assert (stats["long_usd"], stats["long_count"]) == (130.0, 2)
+    assert (stats["short_usd"], stats["short_count"]) == (50.0, 1)
+    assert stats["largest_long"]["vusd"] == 100.0
+    assert stats["largest_short"]["vusd"] == 50.0
+
+
+def test_late_event_expires_on_time_and_keeps_newer_peaks():
+    agg = LiquidationAggregator(windows=[10])
+    agg.extend([_liq(0, 5.0), _liq(20_000, 1.0)])
+    agg.update(_liq(15_000, 3.0))  # late, but inside the window
+    stats = agg.stats(10)
+    assert (stats["long_usd"], stats["largest_long"]["vusd"]) == (4.0, 3.0)
+    agg.update(_liq(26_000, 0.5))  # cutoff 16s: the late event expires
+    stats = agg.stats(10)
+    assert (stats["long_usd"], stats["long_count"]) == (1.5, 2)
+    assert stats["largest_long"]["d"] == 20_000
+    agg.update(_liq(21_000, 0.2))  # late and outweighed by a newer peak
+    assert agg.stats(10)["largest_long"]["d"] == 20_000
+
+
+def test_windows_expire_old_events_and_maxima():
+    agg = LiquidationAggregator(windows=(10, 60))
+    agg.update(_liq(0, 500.0))
+    agg.update(_liq(5_000, 20.0))
+    agg.update(_liq(30_000, 10.0))
+    short, long_ = agg.stats(10), agg.stats(60)
+    assert (short["long_count"], short["long_usd"]) == (1, 10.0)
+    assert short["largest_long"]["vusd"] == 10.0  # the 500 fell out
+    assert (long_["long_count"], long_["long_usd"]) == (3, 530.0)
+    assert long_["largest_long"]["vusd"] == 500.0
+    # time follows the newest event, for every group
+    agg.update(_liq(100_000, 1.0, b="ETH"))
+    assert agg.stats(60, token="BTC")["long_count"] == 0
+    assert agg.stats(60, token="BTC")["largest_long"] is None
+
+
+def test_filters_by_token_and_exchange():
+    agg = LiquidationAggregator(windows=[60])
+    agg.extend(
+        [
+            _liq(0, 1.0),
+            _liq(1, 2.0, e="bybit"),
+            _liq(2, 4.0, b="ETH"),
+            _liq(3, 8.0, b="ETH", e="bybit", sd="buy"),
+        ]
+    )
+    assert agg.stats(60, token="BTC")["long_usd"] == 3.0
+    assert agg.stats(60, exchange="bybit")["long_usd"] == 2.0
+    assert agg.stats(60, exchange="bybit")["short_usd"] == 8.0
+    assert agg.stats(60, token="ETH", exchange="binance")["long_usd"] == 4.0
+    df = agg.to_pandas(60)
+    assert len(df) == 4 and set(df["token"]) == {"BTC", "ETH"}
+    with pytest.raises(ValueError):
+        agg.stats(30)
+
+
+def test_same_token_events_count_and_exact_replays_do_not():
+    agg = LiquidationAggregator(windows=[60])
+    # ``id`` is the token id: every BTC liquidation carries the same one.
+    events = [_liq(d, 10.0, id="bitcoin", s="BTC-USDT", v=0.1) for d in range(5)]
+    agg.extend(events)
+    assert agg.stats(60)["long_count"] == 5
+    agg.update({**events[2], "snap": True})  # replayed on reconnect
+    assert agg.stats(60)["long_count"] == 5
+    agg.update(_liq(2, 10.0, id="bitcoin", s="BTC-USDT", v=0.2))  # other size
+    assert agg.stats(60)["long_count"] == 6
+
+
+def test_consume_accepts_batches_and_skips_events():
+    items = [
+        _liq(0, 1.0),
+        object(),  # e.g. a WSEvent
+        [_liq(1, 2.0, sd="buy")],
+    ]
+
+    async def stream():
+        for item in items:
+            yield item
+
+    agg = LiquidationAggregator(windows=[60])
+    asyncio.run(agg.consume(stream()))
+    stats = agg.stats(60)
+    assert (stats["long_usd"], stats["short_usd"]) == (1.0, 2.0)
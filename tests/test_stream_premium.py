@@ -0,0 +1,131 @@
+"""Live premium matrix (``datamaxi.stream.PremiumMatrix``)."""
+
+import asyncio
+import math
+import random
+
+from datamaxi.stream import PremiumMatrix
+from datamaxi.stream.premium import pair_key
+
+
+def _prem(src, tgt, token, premium, ts=1_000, quote="USDT", **extra):
+    return {
+        "source_exchange": src,
+        "target_exchange": tgt,
+        "token_id": token,
+        "source_quote": quote,
+        "target_quote": "KRW",
+        "source_market": "spot",
+        "target_market": "spot",
+        "premium": premium,
+        "timestamp": ts,
+        **extra,
+    }
+
+
+def test_update_overwrites_the_pair_in_place():
+    matrix = PremiumMatrix()
+    matrix.update(_prem("binance", "upbit", "bitcoin", 1.0))
+    matrix.update(_prem("binance", "upbit", "bitcoin", 2.5))
+    key = "binance:upbit:bitcoin:USDT:KRW:spot:spot"
+    assert len(matrix) == 1 and key in matrix
+    assert matrix[key]["premium"] == 2.5
+    assert pair_key({"key": "k1", "token_id": "x"}) == "k1"  # server key wins
+
+
+def test_top_k_and_filters():
+    matrix = PremiumMatrix()
+    matrix.extend(
+        [
+            _prem("binance", "upbit", "bitcoin", 1.0),
+            _prem("binance", "upbit", "ethereum", 3.0),
+            _prem("okx", "upbit", "bitcoin", -4.0),
+            _prem("okx", "bithumb", "bitcoin", 2.0),
+            _prem("binance", "upbit", "bitcoin", 0.5, quote="USDC"),
+        ]
+    )
+    premiums = lambda msgs: [m["premium"] for m in msgs]  # noqa: E731
+    assert premiums(matrix.top(2)) == [3.0, 2.0]
+    assert premiums(matrix.top(1, ascending=True)) == [-4.0]
+    assert premiums(matrix.top(2, by_abs=True)) == [-4.0, 3.0]
+    assert premiums(matrix.top(5, token="bitcoin", target="upbit")) == [
+        1.0,
+        0.5,
+        -4.0,
+    ]
+    assert premiums(matrix.top(5, source="binance", target="upbit")) == [
+        3.0,
+        1.0,
+        0.5,
+    ]
+    assert matrix.top(3, token="dogecoin") == []
+    assert matrix.tokens == ["bitcoin", "ethereum"]
+    assert ("okx", "bithumb") in matrix.routes
+
+
+def test_ranked_top_matches_a_full_sort_after_updates():
+    rng = random.Random(7)
+    matrix = PremiumMatrix(max_age=50)
+    for i in range(400):
+        premium = rng.choice([None, math.nan, 0.0, round(rng.uniform(-5, 5), 2)])
+        src = rng.choice(["binance", "okx", "bybit"])
+        token = rng.choice(["bitcoin", "ethereum", "ripple", "solana"])
+        matrix.update(_prem(src, "upbit", token, premium, ts=i * 1000))
+    live = [
+        m
+        for m in matrix.select()
+        if m["timestamp"] >= matrix._newest - 50_000  # max_age cutoff
+    ]
+    for by_abs in (False, True):
+        rank = abs if by_abs else float
+        for ascending in (False, True):
+            values = [rank(m["premium"]) for m in live]
+            expected = sorted(values, reverse=not ascending)[:5]
+            got = matrix.top(5, by_abs=by_abs, ascending=ascending)
+            assert [rank(m["premium"]) for m in got] == expected
+    assert len(matrix._ranked) == len(matrix._rank) <= len(matrix)
+    matrix.clear()
+    assert matrix.top(3) == [] and matrix._ranked == []
+
+
+def test_max_age_hides_stale_pairs():
+    matrix = PremiumMatrix(max_age=10)
+    matrix.update(_prem("binance", "upbit", "bitcoin", 5.0, ts=0))
+    matrix.update(_prem("okx", "upbit", "bitcoin", 1.0, ts=20_000))
+    assert [m["source_exchange"] for m in matrix.top(5)] == ["okx"]
+    matrix.update(_prem("binance", "upbit", "bitcoin", 5.0, ts=21_000))
+    assert [m["source_exchange"] for m in matrix.top(5)] == ["binance", "okx"]
+
+
+def test_matrix_keeps_the_widest_leg_per_route():
+    matrix = PremiumMatrix()
+    matrix.extend(
+        [
+            _prem("binance", "upbit", "bitcoin", 1.0),
+            _prem("binance", "upbit", "bitcoin", 1.5, quote="USDC"),
+            _prem("okx", "bithumb", "bitcoin", 2.0),
+            _prem("okx", "upbit", "ethereum", 9.0),
+        ]
+    )
+    grid = matrix.matrix("bitcoin")
+    assert list(grid.index) == ["binance", "okx"]
+    assert list(grid.columns) == ["bithumb", "upbit"]
+    assert grid.loc["binance", "upbit"] == 1.5
+    assert math.isnan(grid.loc["binance", "bithumb"])
+    assert len(matrix.to_pandas(token="ethereum")) == 1
+
+
+def test_consume_accepts_batches_and_skips_events():
+    items = [
+        _prem("binance", "upbit", "bitcoin", 1.0),
+        object(),  # e.g. a WSEvent
+        [_prem("okx", "upbit", "bitcoin", 2.0)],
+    ]
+
+    async def stream():
+        for item in items:
+            yield item
+
+    matrix = PremiumMatrix()
+    asyncio.run(matrix.consume(stream()))
+    assert [m["source_exchange"] for m in matrix.top(2)] == ["okx", "binance"]
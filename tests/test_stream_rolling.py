@@ -0,0 +1,72 @@
+"""Columnar WS ring buffer (``datamaxi.stream.RollingFrame``)."""
+
+import asyncio
+import math
+
+import pytest
+
+from datamaxi.stream import RollingFrame
+
+
+def _liq(d, v=1.0, **extra):
+    return {"d": d, "e": "binance", "s": "BTC-USDT", "sd": "sell", "v": v, **extra}
+
+
+def test_schema_follows_the_generated_model():
+    frame = RollingFrame("/liquidation/feed", capacity=4)
+    assert frame.columns[:3] == ["b", "d", "e"]
+    cols = frame.arrays()
+    assert cols["d"].dtype == "int64" and cols["v"].dtype == "float64"
+    assert cols["s"].dtype == object
+    assert RollingFrame("LiquidationMessage").columns == frame.columns
+
+
+def test_ring_buffer_keeps_newest_rows_in_order():
+    frame = RollingFrame("/liquidation", capacity=3, fields=["d", "v", "p"])
+    for d in range(5):
+        frame.append(_liq(d, v=float(d)))
+    cols = frame.arrays()
+    assert len(frame) == 3
+    assert cols["d"].tolist() == [2, 3, 4]
+    assert all(math.isnan(p) for p in cols["p"])  # absent float -> NaN
+    assert frame.arrays(last=2)["d"].tolist() == [3, 4]
+    assert frame.arrays(last=0)["d"].tolist() == []
+
+
+def test_extend_matches_append_and_wraps():
+    a = RollingFrame("/liquidation", capacity=4)
+    b = RollingFrame("/liquidation", capacity=4)
+    msgs = [_liq(d, v=d * 2.0) for d in range(7)]
+    for m in msgs[:2]:
+        a.append(m)
+    a.extend(msgs[2:])
+    b.extend(msgs)
+    assert a.to_pandas().equals(b.to_pandas())
+    assert b.arrays()["d"].tolist() == [3, 4, 5, 6]
+
+
+def test_time_window_is_relative_to_newest_message():
+    frame = RollingFrame("/liquidation", capacity=10, window=2.0)
+    frame.extend(_liq(d) for d in (0, 1000, 2500, 3000))
+    assert frame.arrays()["d"].tolist() == [1000, 2500, 3000]
+    assert frame.arrays(window=0.5)["d"].tolist() == [2500, 3000]
+
+
+def test_consume_accepts_batches_and_skips_events():
+    frame = RollingFrame("/liquidation", capacity=10, fields=["d", "v"])
+
+    async def stream():
+        yield [_liq(1), _liq(2)]
+        yield object()  # e.g. a WSEvent
+        yield _liq(3, v=3.0)
+
+    asyncio.run(frame.consume(stream()))
+    df = frame.to_pandas()
+    assert df["d"].tolist() == [1, 2, 3] and df["v"].tolist() == [1.0, 1.0, 3.0]
+
+
+def test_unknown_channel_and_field_rejected():
+    with pytest.raises(ValueError):
+        RollingFrame("/nope")
+    with pytest.raises(ValueError):
+        RollingFrame("/liquidation", fields=["nope"])
@@ -14,7 +14,12 @@ import pytest
 websockets = pytest.importorskip("websockets")
 
 import datamaxi._ws_models as _ws_models  # noqa: E402
-from datamaxi.aio.ws import AsyncDatamaxiWS, build_param  # noqa: E402
+from datamaxi.aio.ws import (  # noqa: E402
+    AsyncDatamaxiWS,
+    AsyncWSConnection,
+    WSEvent,
+    build_param,
+)
 from datamaxi._ws_endpoints import WS_CHANNELS, WS_BASE_PATH  # noqa: E402
 from datamaxi._ws_models import TickerMessage  # noqa: E402
 
@@ -35,6 +40,13 @@ def _run(coro):
     return asyncio.run(coro)
 
 
+async def _until(predicate, timeout=1.0):
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+
+
 def test_ws_consumes_generated_registry_and_model():
     # The client resolves the path from the generated WS_CHANNELS, and the
     # generated TickerMessage carries the wire keys.
@@ -282,6 +294,361 @@ def test_ws_reconnect_replays_active_subscription(monkeypatch):
     assert seen[1] == ["USD-KRW"]  # `_open` replays sorted(self._active)
 
 
+def test_ws_reconnect_emits_state_events_and_gap(monkeypatch):
+    # A stream opened with events=True sees the outage as disconnected ->
+    # connected -> resubscribed -> gap, in line with the data.
+    monkeypatch.setattr("datamaxi.aio.ws._RECONNECT_BACKOFF", 0.01)
+    conns = []
+
+    async def handler(conn):
+        idx = len(conns)
+        conns.append(conn)
+        async for raw in conn:
+            m = json.loads(raw)
+            if m.get("method") == "SUBSCRIBE":
+                await conn.send(json.dumps({"s": "USD-KRW", "d": idx, "r": 1.0}))
+                if idx == 0:
+                    return
+
+    async def run():
+        async with _serve(handler) as server:
+            async with AsyncDatamaxiWS(
+                api_key="k", ws_url=f"ws://localhost:{_port(server)}", keepalive=0
+            ) as ws:
+                stream = await ws.forex.subscribe("USD-KRW", events=True)
+                return [await _first(stream) for _ in range(6)]
+
+    items = _run(run())
+    assert items[0] == {"s": "USD-KRW", "d": 0, "r": 1.0}
+    events = items[1:5]
+    assert all(isinstance(e, WSEvent) for e in events)
+    assert [e.type for e in events] == [
+        "disconnected",
+        "connected",
+        "resubscribed",
+        "gap",
+    ]
+    assert events[2].params == ["USD-KRW"]
+    gap = events[3]
+    assert gap.start <= gap.end and gap.duration >= 0
+    assert items[5] == {"s": "USD-KRW", "d": 1, "r": 1.0}
+
+
+def test_ws_default_stream_has_no_events(monkeypatch):
+    monkeypatch.setattr("datamaxi.aio.ws._RECONNECT_BACKOFF", 0.01)
+    count = {"n": 0}
+
+    async def handler(conn):
+        count["n"] += 1
+        idx = count["n"]
+        async for raw in conn:
+            if json.loads(raw).get("method") == "SUBSCRIBE":
+                await conn.send(json.dumps({"s": "USD-KRW", "d": idx}))
+                if idx == 1:
+                    return
+
+    async def run():
+        async with _serve(handler) as server:
+            async with AsyncDatamaxiWS(
+                api_key="k", ws_url=f"ws://localhost:{_port(server)}", keepalive=0
+            ) as ws:
+                stream = await ws.forex.subscribe("USD-KRW")
+                return await _first(stream), await _first(stream)
+
+    assert _run(run()) == ({"s": "USD-KRW", "d": 1}, {"s": "USD-KRW", "d": 2})
+
+
+def test_ws_gives_up_after_max_reconnect_attempts():
+    async def handler(conn):
+        async for raw in conn:
+            if json.loads(raw).get("method") == "SUBSCRIBE":
+                await conn.send(json.dumps({"s": "USD-KRW", "d": 1}))
+
+    async def run():
+        server = await _serve(handler)
+        async with AsyncDatamaxiWS(
+            api_key="k",
+            ws_url=f"ws://localhost:{_port(server)}",
+            keepalive=0,
+            reconnect_backoff=0.01,
+            max_reconnect_attempts=2,
+        ) as ws:
+            stream = await ws.forex.subscribe("USD-KRW")
+            await _first(stream)
+            server.close()  # drops the conn and refuses every reconnect
+            await server.wait_closed()
+            return [item async for item in stream]
+
+    assert _run(run()) == []  # the stream ends instead of retrying forever
+
+
+def test_ws_heartbeat_measures_rtt_and_drops_half_open_connection(monkeypatch):
+    monkeypatch.setattr("datamaxi.aio.ws._RECONNECT_BACKOFF", 0.01)
+    connections = []
+
+    async def handler(conn):
+        connections.append(conn)
+        async for raw in conn:
+            if json.loads(raw).get("method") != "SUBSCRIBE":
+                continue
+            await conn.send(json.dumps({"s": "USD-KRW", "d": len(connections)}))
+            if len(connections) == 1:
+                await asyncio.sleep(0.2)  # answer a few pings first
+                conn.transport.pause_reading()  # half-open: pongs stop
+
+    async def run():
+        server = await _serve(handler)
+        try:
+            async with AsyncDatamaxiWS(
+                api_key="k",
+                ws_url=f"ws://localhost:{_port(server)}",
+                keepalive=0,
+                heartbeat=0.05,
+                heartbeat_timeout=0.05,
+            ) as ws:
+                stream = await ws.forex.subscribe("USD-KRW")
+                first = await _first(stream)
+                second = await _first(stream)
+                return first, second, ws.heartbeat_stats()["/forex"]
+        finally:
+            server.close()
+
+    first, second, stats = _run(run())
+    assert (first["d"], second["d"]) == (1, 2)  # resumed on a new connection
+    assert stats["dead"] == 1
+    assert 0 < stats["rtt_p50"] <= stats["rtt_max"] < 0.05
+
+
+def test_ws_subscribes_coalesce_into_chunked_acked_frames():
+    frames = []
+
+    async def handler(conn):
+        async for raw in conn:
+            m = json.loads(raw)
+            frames.append((m["method"], m["params"]))
+            await conn.send(json.dumps({"result": None, "id": m["id"]}))
+
+    async def run():
+        server = await _serve(handler)
+        try:
+            async with AsyncDatamaxiWS(
+                api_key="k",
+                ws_url=f"ws://localhost:{_port(server)}",
+                keepalive=0,
+                max_params_per_frame=2,
+            ) as ws:
+                await asyncio.gather(
+                    ws.forex.subscribe("A"),
+                    ws.forex.subscribe("B", "A"),
+                    ws.forex.subscribe("C", confirm=True),
+                )
+                await ws.forex.unsubscribe("A", confirm=True)
+        finally:
+            server.close()
+
+    _run(run())
+    assert frames == [
+        ("SUBSCRIBE", ["A", "B"]),
+        ("SUBSCRIBE", ["C"]),
+        ("UNSUBSCRIBE", ["A"]),
+    ]
+
+
+def test_ws_pending_ack_fails_when_connection_drops(monkeypatch):
+    monkeypatch.setattr("datamaxi.aio.ws._RECONNECT_BACKOFF", 0.01)
+
+    async def handler(conn):
+        await conn.recv()  # never ack; drop the connection instead
+        await conn.close()
+
+    async def run():
+        server = await _serve(handler)
+        try:
+            async with AsyncDatamaxiWS(
+                api_key="k", ws_url=f"ws://localhost:{_port(server)}", keepalive=0
+            ) as ws:
+                with pytest.raises(ConnectionError):
+                    await asyncio.wait_for(
+                        ws.forex.subscribe("USD-KRW", confirm=True), 2.0
+                    )
+        finally:
+            server.close()
+
+    _run(run())
+
+
+def test_ws_ack_stats_track_latency_and_results():
+    async def handler(conn):
+        async for raw in conn:
+            m = json.loads(raw)
+            await conn.send(json.dumps({"result": m["params"], "id": m["id"]}))
+
+    async def run():
+        server = await _serve(handler)
+        try:
+            async with AsyncDatamaxiWS(
+                api_key="k", ws_url=f"ws://localhost:{_port(server)}", keepalive=0
+            ) as ws:
+                await ws.forex.subscribe("USD-KRW", confirm=True)
+                conn = await ws._conn("/forex")
+                ack = await conn.subscribe(["EUR-KRW"])
+                return await ack, ws.ack_stats()["/forex"]
+        finally:
+            server.close()
+
+    result, stats = _run(run())
+    assert result == [["EUR-KRW"]]  # server result, one entry per frame
+    assert stats["acked"] == 2 and stats["pending"] == 0
+    assert stats["timed_out"] == stats["failed"] == 0
+    assert 0 <= stats["p50"] <= stats["p99"] <= stats["max"]
+
+
+def test_ws_unacked_subscribe_times_out():
+    async def handler(conn):
+        async for _ in conn:
+            pass  # swallow SUBSCRIBE without acking
+
+    async def run():
+        server = await _serve(handler)
+        try:
+            async with AsyncDatamaxiWS(
+                api_key="k",
+                ws_url=f"ws://localhost:{_port(server)}",
+                keepalive=0,
+                ack_timeout=0.05,
+            ) as ws:
+                with pytest.raises(asyncio.TimeoutError):
+                    await ws.forex.subscribe("USD-KRW", confirm=True)
+                return ws.ack_stats()["/forex"]
+        finally:
+            server.close()
+
+    stats = _run(run())
+    assert stats["timed_out"] == 1 and stats["p50"] is None
+
+
+def test_ws_subscribe_batches_cut_by_size_then_latency():
+    async def handler(conn):
+        async for raw in conn:
+            m = json.loads(raw)
+            await conn.send(json.dumps({"result": None, "id": m["id"]}))
+            for d in range(5):
+                await conn.send(json.dumps({"s": "USD-KRW", "d": d}))
+
+    async def run():
+        server = await _serve(handler)
+        try:
+            async with AsyncDatamaxiWS(
+                api_key="k", ws_url=f"ws://localhost:{_port(server)}", keepalive=0
+            ) as ws:
+                batches = await ws.forex.subscribe_batches(
+                    "USD-KRW", max_size=3, max_latency=0.2
+                )
+                return [[m["d"] for m in await _first(batches)] for _ in range(2)]
+        finally:
+            server.close()
+
+    assert _run(run()) == [[0, 1, 2], [3, 4]]
+
+
+def test_ws_feed_stream_batches_end_with_partial_batch_on_close():
+    async def handler(conn):
+        for d in range(2):
+            await conn.send(json.dumps({"s": "RPL-USDT", "d": d}))
+        await conn.close()
+
+    async def run():
+        server = await _serve(handler)
+        try:
+            async with AsyncDatamaxiWS(
+                api_key="k",
+                ws_url=f"ws://localhost:{_port(server)}",
+                keepalive=0,
+                reconnect=False,
+            ) as ws:
+                batches = await ws.liquidation_feed.stream_batches(max_latency=5.0)
+                return [[m["d"] for m in b] async for b in batches]
+        finally:
+            server.close()
+
+    assert _run(run()) == [[0, 1]]
+
+
+def test_ws_sync_and_async_handlers_bypass_queues():
+    async def handler(conn):
+        async for raw in conn:
+            m = json.loads(raw)
+            if m.get("method") == "SUBSCRIBE":
+                await conn.send(json.dumps({"result": None, "id": m["id"]}))
+                for d in range(4):
+                    await conn.send(json.dumps({"s": "USD-KRW", "d": d}))
+
+    seen, running = [], {"now": 0, "max": 0}
+
+    def on_sync(msg):
+        if msg["d"] == 0:
+            raise RuntimeError("boom")  # logged, not fatal
+        seen.append(("sync", msg["d"]))
+
+    async def on_async(msg):
+        running["now"] += 1
+        running["max"] = max(running["max"], running["now"])
+        await asyncio.sleep(0.01)
+        running["now"] -= 1
+        seen.append(("async", msg["d"]))
+
+    async def run():
+        server = await _serve(handler)
+        try:
+            async with AsyncDatamaxiWS(
+                api_key="k", ws_url=f"ws://localhost:{_port(server)}", keepalive=0
+            ) as ws:
+                h1 = await ws.forex.add_handler(on_sync, "USD-KRW")
+                h2 = await ws.forex.add_handler(
+                    on_async, "USD-KRW", concurrency=2, confirm=True, max_backlog=8
+                )
+                assert h2._backlog.maxlen == 8
+                await _until(lambda: len(seen) == 7)
+                await h2.drain()
+                h1.remove()
+                h2.remove()
+                return h1.errors, h2.errors, h2.pending
+        finally:
+            server.close()
+
+    assert _run(run()) == (1, 0, 0)
+    assert [d for kind, d in seen if kind == "sync"] == [1, 2, 3]
+    assert sorted(d for kind, d in seen if kind == "async") == [0, 1, 2, 3]
+    assert running["max"] == 2  # bounded concurrency
+
+
+def test_ws_feed_handler_stops_after_remove():
+    got = []
+
+    async def handler(conn):
+        await conn.send(json.dumps({"s": "RPL-USDT", "d": 1}))
+        async for raw in conn:
+            await conn.send(json.dumps({"s": "RPL-USDT", "d": 2}))
+
+    async def run():
+        server = await _serve(handler)
+        try:
+            async with AsyncDatamaxiWS(
+                api_key="k", ws_url=f"ws://localhost:{_port(server)}", keepalive=0
+            ) as ws:
+                registration = await ws.liquidation_feed.add_handler(got.append)
+                await _until(lambda: got)
+                registration.remove()
+                conn = await ws._conn("/liquidation/feed")
+                await conn._send({"method": "PING"})  # provokes d=2
+                await asyncio.sleep(0.05)
+        finally:
+            server.close()
+
+    _run(run())
+    assert got == [{"s": "RPL-USDT", "d": 1}]
+
+
 # --- structured subscribe helpers: build_param unit tests ---
 
 
@@ -427,3 +794,33 @@ def test_ws_structured_subscribe_mixing_raw_and_tokens_raises():
 
     with pytest.raises(ValueError):
         _run(run())
+
+
+def test_ws_resubscribe_waits_for_an_inflight_flush(monkeypatch):
+    sent = []
+
+    class FakeSocket:
+        async def send(self, raw):
+            sent.append(json.loads(raw)["method"])
+
+    class FakeWebsockets:
+        @staticmethod
+        async def connect(url, **kwargs):
+            return FakeSocket()
+
+    monkeypatch.setattr("datamaxi.aio.ws._import_websockets", lambda: FakeWebsockets)
+
+    async def run():
+        conn = AsyncWSConnection(
+            "wss://x/ws/v1/forex", "k", keepalive=0, ack_timeout=None
+        )
+        conn._active.update(["A", "B"])
+        async with conn._flush_lock:  # a flush is mid-way
+            reopen = asyncio.create_task(conn._open())
+            await asyncio.sleep(0.01)
+            assert sent == []  # resubscribe waits for it
+            await conn._send_frame("UNSUBSCRIBE", ["C"])
+        await reopen
+        return sent
+
+    assert _run(run()) == ["UNSUBSCRIBE", "SUBSCRIBE"]
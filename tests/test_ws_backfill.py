@@ -0,0 +1,190 @@
+"""Local tests for the opt-in REST gap-filler (``datamaxi.aio.ws_backfill``).
+
+A real in-process `websockets` server drops the connection once; the REST
+side is an ``AsyncDatamaxi`` on ``httpx.MockTransport``. The WS clock
+(``datamaxi.aio.ws._now_ms``) is pinned so the outage window is exact.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+websockets = pytest.importorskip("websockets")
+httpx = pytest.importorskip("httpx")
+
+from datamaxi.aio import AsyncDatamaxi  # noqa: E402
+from datamaxi.aio.ws import AsyncDatamaxiWS  # noqa: E402
+from datamaxi.aio.ws_backfill import RestGapFiller, dedupe_key  # noqa: E402
+
+BASE_URL = "https://api.datamaxiplus.com"
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _live(d, v=1.0):
+    return {
+        "b": "BTC",
+        "d": d,
+        "e": "binance",
+        "id": "bitcoin",
+        "s": "BTC-USDT",
+        "sd": "sell",
+        "v": v,
+    }
+
+
+def _rest(d, v=1.0):
+    return {
+        "base": "BTC",
+        "exchange": "binance",
+        "price": 60000.0,
+        "quote": "USDT",
+        "side": "sell",
+        "symbol": "BTC-USDT",
+        "timestamp": d,
+        "tokenId": "bitcoin",
+        "volume": v,
+    }
+
+
+def test_backfill_injects_missed_window_before_live_and_dedupes(monkeypatch):
+    clock = {"t": 1000}
+    monkeypatch.setattr("datamaxi.aio.ws._now_ms", lambda: clock["t"])
+    monkeypatch.setattr("datamaxi.aio.ws._RECONNECT_BACKOFF", 0.01)
+    requests = []
+
+    def rest(request):
+        requests.append(dict(request.url.params))
+        # 500 predates the gap; 1500 and 1800 fall inside [1000, 2000].
+        rows = [_rest(500), _rest(1500), _rest(1800)]
+        return httpx.Response(200, json={"data": rows})
+
+    conns = []
+
+    async def handler(conn):
+        conns.append(conn)
+        idx = len(conns)
+        if idx == 2:
+            clock["t"] = 2000  # reconnect time = gap end
+        async for raw in conn:
+            if json.loads(raw).get("method") != "SUBSCRIBE":
+                continue
+            if idx == 1:
+                await conn.send(json.dumps(_live(1000)))
+                return
+            await conn.send(json.dumps(_live(1800)))  # also backfilled
+            await conn.send(json.dumps(_live(2500)))
+
+    async def run():
+        rest_client = AsyncDatamaxi(
+            api_key="k", base_url=BASE_URL, transport=httpx.MockTransport(rest)
+        )
+        server = await websockets.serve(handler, "localhost", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            async with AsyncDatamaxiWS(
+                api_key="k",
+                ws_url=f"ws://localhost:{port}",
+                keepalive=0,
+                backfill=rest_client,
+            ) as ws:
+                stream = await ws.liquidation.subscribe("BTC-USDT@binance")
+                return [
+                    (await asyncio.wait_for(stream.__anext__(), 2.0))["d"]
+                    for _ in range(4)
+                ]
+        finally:
+            server.close()
+            await rest_client.aclose()
+
+    assert _run(run()) == [1000, 1500, 1800, 2500]
+    assert requests == [{"exchange": "binance", "symbol": "BTC-USDT", "limit": "1000"}]
+
+
+def test_backfill_rest_failure_is_swallowed():
+    class Broken:
+        async def liquidation(self, **kwargs):
+            raise RuntimeError("boom")
+
+    filler = RestGapFiller(Broken(), "/liquidation")
+    assert _run(filler.fill(["BTC-USDT@binance"], 0, 10)) == []
+
+
+def test_backfill_fetches_params_concurrently_with_a_bound():
+    running = {"now": 0, "max": 0}
+
+    class Rest:
+        async def open_interest(self, exchange, symbol):
+            if symbol == "BAD-USDT":
+                raise RuntimeError("boom")
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+            return {"exchange": exchange, "symbol": symbol, "timestamp": 5}
+
+    params = [f"T{i}-USDT@binance" for i in range(6)] + ["BAD-USDT@binance"]
+    filler = RestGapFiller(Rest(), "/open-interest", concurrency=2)
+    rows = _run(filler.fill(params, 0, 10))
+    assert [r["s"] for r in rows] == [f"T{i}-USDT" for i in range(6)]
+    assert running["max"] == 2
+
+
+def test_backfill_gives_up_after_timeout():
+    class Slow:
+        async def liquidation(self, **kwargs):
+            await asyncio.sleep(10)
+
+    filler = RestGapFiller(Slow(), "/liquidation", timeout=0.01)
+    assert _run(filler.fill(["BTC-USDT@binance"], 0, 10)) == []
+
+
+def test_backfill_open_interest_maps_to_wire_shape():
+    class Rest:
+        async def open_interest(self, exchange, symbol):
+            return {
+                "base": "BTC",
+                "exchange": exchange,
+                "openInterest": 12.5,
+                "openInterestUsd": 750000.0,
+                "quote": "USDT",
+                "symbol": symbol,
+                "timestamp": 5,
+                "tokenId": "bitcoin",
+            }
+
+    filler = RestGapFiller(Rest(), "/open-interest")
+    rows = _run(filler.fill(["BTC-USDT@binance"], 0, 10))
+    assert rows == [
+        {
+            "b": "BTC",
+            "d": 5,
+            "e": "binance",
+            "id": "bitcoin",
+            "oi": 12.5,
+            "oiusd": 750000.0,
+            "q": "USDT",
+            "s": "BTC-USDT",
+        }
+    ]
+
+
+def test_dedupe_key_matches_string_and_int_timestamps():
+    assert dedupe_key({"e": "x", "d": "5"}) == dedupe_key({"e": "x", "d": 5})
+
+
+def test_dedupe_window_is_bounded():
+    filler = RestGapFiller(object(), "/liquidation/feed", dedupe_size=2)
+    assert not filler.seen(_live(1))
+    assert filler.seen(_live(1))
+    filler.seen(_live(2))
+    filler.seen(_live(3))  # evicts d=1
+    assert not filler.seen(_live(1))
+
+
+def test_backfill_rejects_unsupported_channel():
+    with pytest.raises(ValueError):
+        RestGapFiller(object(), "/ticker/spot")
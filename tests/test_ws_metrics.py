@@ -0,0 +1,134 @@
+"""WS throughput / lag instrumentation (``datamaxi.aio.ws_metrics``)."""
+
+import asyncio
+import json
+
+import pytest
+
+websockets = pytest.importorskip("websockets")
+
+from datamaxi.aio.ws import AsyncDatamaxiWS  # noqa: E402
+from datamaxi.aio.ws_metrics import WSMetrics, _percentile  # noqa: E402
+
+
+def test_metrics_hook_reports_rates_lag_and_backlog(monkeypatch):
+    monkeypatch.setattr("datamaxi.aio.ws._now_ms", lambda: 1_000)
+    frames = [json.dumps({"s": "USD-KRW", "d": 1_000 - lag}) for lag in (5, 10, 50)]
+
+    async def handler(conn):
+        async for raw in conn:
+            m = json.loads(raw)
+            await conn.send(json.dumps({"result": None, "id": m["id"]}))
+            for frame in frames:
+                await conn.send(frame)
+
+    snapshots = []
+
+    async def hook(snapshot):
+        snapshots.append(snapshot)
+
+    async def run():
+        server = await websockets.serve(handler, "localhost", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            async with AsyncDatamaxiWS(
+                api_key="k",
+                ws_url=f"ws://localhost:{port}",
+                keepalive=0,
+                metrics_hook=hook,
+                metrics_interval=0.2,
+            ) as ws:
+                stream = await ws.forex.subscribe("USD-KRW", confirm=True)
+                while not snapshots or snapshots[-1]["messages"] < 4:
+                    await asyncio.sleep(0.01)
+                return ws.metrics()["/forex"], stream
+        finally:
+            server.close()
+
+    latest, _ = asyncio.run(run())
+    snap = next(s for s in snapshots if s["lag_ms"] is not None)
+    assert snap["path"] == "/forex"
+    assert snap["messages"] == 4  # the ack frame counts towards throughput
+    assert snap["bytes"] == sum(map(len, frames)) + len('{"result": null, "id": 1}')
+    assert snap["lag_ms"] == {"p50": 10, "p90": 50, "p99": 50, "max": 50}
+    assert snap["decode_us"] > 0 and snap["msgs_per_sec"] > 0
+    (sub,) = snap["subscribers"]
+    assert sub["kind"] == "Queue" and sub["depth"] == sub["hwm"] == 3
+    assert snap["acks"]["acked"] == 1
+    # an on-demand snapshot starts a fresh interval
+    assert latest["lag_ms"] is None and latest["msgs_per_sec"] == 0
+
+
+def test_metrics_are_off_by_default():
+    ws = AsyncDatamaxiWS(api_key="k")
+    assert ws.metrics() == {}
+
+
+def test_percentile_nearest_rank():
+    data = list(range(1, 101))
+    assert _percentile(data, 50) == 50
+    assert _percentile(data, 99) == 99
+    assert _percentile([7], 99) == 7
+
+
+def test_snapshot_without_messages():
+    snap = WSMetrics("/forex").snapshot([])
+    assert snap["messages"] == 0 and snap["decode_us"] is None
+    assert snap["lag_ms"] is None and snap["subscribers"] == []
+
+
+def test_bytes_count_utf8_not_characters():
+    metrics = WSMetrics("/cex/announcement")
+    for raw in ('{"t": "₩"}', b'{"t": "x"}'):
+        metrics.on_message(raw, 0.0, {}, 0)
+    assert metrics.bytes == len('{"t": "₩"}'.encode()) + 10
+
+
+@pytest.mark.parametrize("compression", ["deflate", None])
+def test_snapshot_compares_wire_and_payload_bytes(compression):
+    # Large, repetitive JSON (like /premium) compresses well on the wire.
+    frame = json.dumps([{"s": "BTC-USDT", "e": "binance", "p": 1.0}] * 200)
+
+    async def handler(conn):
+        async for raw in conn:
+            m = json.loads(raw)
+            await conn.send(json.dumps({"result": None, "id": m["id"]}))
+            await conn.send(frame)
+
+    async def run():
+        server = await websockets.serve(handler, "localhost", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            async with AsyncDatamaxiWS(
+                api_key="k",
+                ws_url=f"ws://localhost:{port}",
+                keepalive=0,
+                metrics=True,
+                compression=compression,
+                max_size=2**16,
+            ) as ws:
+                stream = await ws.premium.subscribe("BTC-USDT", confirm=True)
+                await asyncio.wait_for(stream.__anext__(), 2.0)
+                return ws.metrics()["/premium"]
+        finally:
+            server.close()
+
+    snap = asyncio.run(run())
+    assert snap["wire_bytes"] > 0 and snap["bytes"] > len(frame)
+    if compression:
+        assert snap["compression"] == "permessage-deflate"
+        assert snap["compression_ratio"] > 10
+    else:
+        assert snap["compression"] is None
+        assert snap["compression_ratio"] < 1  # framing overhead only
+
+
+def test_compression_accepts_deflate_parameters():
+    from datamaxi.aio.ws import _compression_kwargs
+
+    kwargs = _compression_kwargs({"client_max_window_bits": 10})
+    assert kwargs["compression"] is None
+    (factory,) = kwargs["extensions"]
+    assert factory.client_max_window_bits == 10
+    with pytest.raises(ValueError):
+        _compression_kwargs("brotli")
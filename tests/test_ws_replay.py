@@ -0,0 +1,93 @@
+"""WS session recording and local replay (``datamaxi.aio.ws_replay``)."""
+
+import asyncio
+import json
+
+import pytest
+
+websockets = pytest.importorskip("websockets")
+
+from datamaxi.aio.ws import AsyncDatamaxiWS  # noqa: E402
+from datamaxi.aio.ws_replay import (  # noqa: E402
+    ReplayServer,
+    WSRecorder,
+    read_recording,
+)
+
+MSGS = [{"s": "USD-KRW", "d": d, "r": 1500.0 + d} for d in range(3)]
+
+
+async def _record(path):
+    async def handler(conn):
+        async for raw in conn:
+            m = json.loads(raw)
+            await conn.send(json.dumps({"result": None, "id": m["id"]}))
+            for msg in MSGS:
+                await conn.send(json.dumps(msg, indent=1))  # multi-line frame
+
+    server = await websockets.serve(handler, "localhost", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        with WSRecorder(path) as rec:
+            async with AsyncDatamaxiWS(
+                api_key="k", ws_url=f"ws://localhost:{port}", keepalive=0, recorder=rec
+            ) as ws:
+                stream = await ws.forex.subscribe("USD-KRW")
+                for _ in MSGS:
+                    await asyncio.wait_for(stream.__anext__(), 2.0)
+            return rec.frames
+    finally:
+        server.close()
+
+
+async def _replay(path, **options):
+    async with ReplayServer(path, **options) as server:
+        async with AsyncDatamaxiWS(
+            api_key="k", ws_url=server.url, keepalive=0, reconnect=False
+        ) as ws:
+            stream = await ws.forex.subscribe("USD-KRW", confirm=True)
+            return server.channels, [msg async for msg in stream]
+
+
+@pytest.mark.parametrize("name", ["session.tsv", "session.tsv.gz"])
+def test_record_then_replay_roundtrip(tmp_path, name):
+    path = str(tmp_path / name)
+    assert asyncio.run(_record(path)) == 4  # ack + 3 data frames
+    lines = list(read_recording(path))
+    assert {channel for _, channel, _ in lines} == {"/forex"}
+    assert all("\n" not in raw for _, _, raw in lines)
+
+    channels, replayed = asyncio.run(_replay(path, speed=None))
+    assert channels == ["/forex"]
+    assert replayed == MSGS  # recorded ack not replayed; stream ends with it
+
+
+def test_replay_paces_by_recorded_gaps(tmp_path):
+    path = tmp_path / "paced.tsv"
+    path.write_text(
+        "".join(f"{t}\t/forex\t{json.dumps(m)}\n" for t, m in zip((0, 100, 200), MSGS))
+    )
+
+    async def timed(speed):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        _, msgs = await _replay(str(path), speed=speed)
+        return loop.time() - started, msgs
+
+    elapsed, msgs = asyncio.run(timed(1.0))
+    assert msgs == MSGS and elapsed >= 0.2
+    fast, _ = asyncio.run(timed(None))
+    assert fast < elapsed
+
+
+def test_replay_handler_ends_when_client_leaves_before_subscribing(tmp_path):
+    path = tmp_path / "idle.tsv"
+    path.write_text(f"0\t/forex\t{json.dumps(MSGS[0])}\n")
+
+    async def run():
+        server = await ReplayServer(str(path)).start()
+        async with websockets.connect(server.url + "/ws/v1/forex"):
+            pass  # no SUBSCRIBE
+        await asyncio.wait_for(server.close(), 2.0)
+
+    asyncio.run(run())
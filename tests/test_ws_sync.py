@@ -0,0 +1,131 @@
+"""Local tests for the synchronous WebSocket client (``datamaxi.ws``).
+
+A threaded `websockets.sync` server implements the subscribe protocol; the
+client runs its own background event loop thread.
+"""
+
+import concurrent.futures
+import contextlib
+import json
+import queue
+import threading
+
+import pytest
+
+websockets = pytest.importorskip("websockets")
+
+from websockets.sync.server import serve  # noqa: E402
+
+from datamaxi.aio.ws import _CLOSED  # noqa: E402
+from datamaxi.ws import DatamaxiWS, WSCallback, _ThreadSink  # noqa: E402
+
+
+@contextlib.contextmanager
+def _server(handler):
+    server = serve(handler, "localhost", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield "ws://localhost:{}".format(server.socket.getsockname()[1])
+    finally:
+        server.shutdown()
+        thread.join()
+
+
+def _ack_then(*messages):
+    def handler(conn):
+        for raw in conn:
+            m = json.loads(raw)
+            if m.get("method") == "SUBSCRIBE":
+                conn.send(json.dumps({"result": None, "id": m["id"]}))
+                for msg in messages:
+                    conn.send(json.dumps(msg))
+
+    return handler
+
+
+def test_sync_blocking_iterator_and_batches():
+    msgs = [{"s": "USD-KRW", "d": d} for d in range(4)]
+    with _server(_ack_then(*msgs)) as url:
+        with DatamaxiWS(api_key="k", ws_url=url, keepalive=0) as ws:
+            stream = ws.forex.subscribe("USD-KRW", confirm=True)
+            assert next(stream) == msgs[0]
+            assert stream.get(timeout=2.0) == msgs[1]
+            rest = []
+            while len(rest) < 2:
+                rest += stream.get_batch(timeout=2.0)
+            assert rest == msgs[2:]
+            assert ws.ack_stats()["/forex"]["acked"] == 1
+        # closing the client ends the iteration
+        assert list(stream) == []
+
+
+def test_sync_callback_runs_on_dispatcher_thread():
+    got = queue.Queue()
+    with _server(_ack_then({"s": "BTC-USDT", "e": "binance", "d": 1})) as url:
+        with DatamaxiWS(api_key="k", ws_url=url, keepalive=0) as ws:
+            handle = ws.ticker.subscribe(
+                "BTC-USDT@binance",
+                market="spot",
+                callback=lambda m: got.put((m["s"], threading.current_thread())),
+            )
+            assert isinstance(handle, WSCallback)
+            symbol, thread = got.get(timeout=2.0)
+            handle.close(timeout=2.0)
+    assert symbol == "BTC-USDT"
+    assert thread.name == "datamaxi-ws-callback"
+
+
+def test_sync_subscribe_timeout_cancels_and_detaches_the_sink(monkeypatch):
+    def never_ack(conn):
+        for _ in conn:
+            pass
+
+    call = DatamaxiWS._call
+    monkeypatch.setattr(
+        DatamaxiWS, "_call", lambda self, coro, timeout=0.3: call(self, coro, timeout)
+    )
+    with _server(never_ack) as url:
+        with DatamaxiWS(api_key="k", ws_url=url, keepalive=0) as ws:
+            with pytest.raises(concurrent.futures.TimeoutError):
+                ws.forex.subscribe("USD-KRW", confirm=True)
+
+            async def sinks():
+                conn = ws._async._conns["/forex"]
+                return len(conn._subscribers) + len(conn._event_subscribers)
+
+            assert ws._call(sinks()) == 0
+
+
+def test_sync_stream_close_detaches():
+    with _server(_ack_then({"s": "USD-KRW", "d": 1})) as url:
+        with DatamaxiWS(api_key="k", ws_url=url, keepalive=0) as ws:
+            stream = ws.forex.subscribe("USD-KRW")
+            stream.close()
+            assert list(stream) == []
+
+
+def test_thread_sink_drops_oldest_when_full():
+    sink = _ThreadSink(2)
+    for i in range(5):
+        sink.put_nowait(i)
+    assert sink.dropped == 3
+    assert [sink.get_nowait(), sink.get_nowait()] == [3, 4]
+
+
+def test_thread_sink_never_drops_the_close_sentinel():
+    sink = _ThreadSink(1)
+    sink.put_nowait(1)
+    sink.put_nowait(_CLOSED)  # makes room by dropping 1
+    sink.put_nowait(2)  # late message after close: ignored
+    assert sink.get_nowait() is _CLOSED
+    assert sink.dropped == 1 and sink.empty()
+
+
+def test_sync_closed_client_rejects_calls():
+    ws = DatamaxiWS(api_key="k")
+    ws.close()
+    ws.close()  # idempotent
+    with pytest.raises(RuntimeError):
+        ws.forex.subscribe("USD-KRW")
+    assert "has_key=True" in repr(ws)